@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Benchmark callback-to-consumer latency of the audio capture handoff.
+
+Compares the legacy ``queue.Queue`` + ``run_in_executor(queue.get)`` path
+with the current ``AudioChunkStream`` ring buffer + ``call_soon_threadsafe``
+wakeup. A producer thread stands in for the PortAudio callback, and
+optional busy executor jobs emulate Whisper inference / token refreshes
+competing for the default thread pool.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import queue
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, List
+
+import numpy as np
+
+if __name__ == "__main__":
+    ROOT = Path(__file__).resolve().parents[1]
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+
+from transcriber.audio import AudioChunkStream
+from transcriber.config import AudioInputConfig
+
+
+async def _executor_load(jobs: int, job_seconds: float) -> None:
+    """Keep ``jobs`` blocking calls queued on the default executor."""
+
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.gather(
+            *(loop.run_in_executor(None, time.sleep, job_seconds) for _ in range(jobs))
+        )
+
+
+def _summarise(label: str, delays: List[float]) -> None:
+    if not delays:
+        print(f"{label:<28} no samples")
+        return
+    ordered = sorted(delays)
+    p95 = ordered[int(0.95 * (len(ordered) - 1))]
+    print(
+        f"{label:<28} mean {statistics.mean(delays) * 1e3:7.3f} ms  "
+        f"p95 {p95 * 1e3:7.3f} ms  max {ordered[-1] * 1e3:7.3f} ms  (n={len(delays)})"
+    )
+
+
+async def bench_legacy(blocks: int, interval: float, block: bytes) -> List[float]:
+    loop = asyncio.get_running_loop()
+    chunks: "queue.Queue[tuple[float, bytes]]" = queue.Queue(maxsize=10)
+
+    def producer() -> None:
+        for _ in range(blocks):
+            time.sleep(interval)
+            chunks.put((time.perf_counter(), bytes(block)))
+
+    threading.Thread(target=producer, daemon=True).start()
+    delays = []
+    for _ in range(blocks):
+        produced_at, _chunk = await loop.run_in_executor(None, chunks.get)
+        delays.append(time.perf_counter() - produced_at)
+    return delays
+
+
+async def bench_ring(blocks: int, interval: float, block: bytes, config: AudioInputConfig) -> List[float]:
+    stream = AudioChunkStream(config)
+    # Drive the real callback without opening a PortAudio device.
+    stream._loop = asyncio.get_running_loop()  # pylint: disable=protected-access
+    produced: List[float] = []
+    frames = len(block) // 2
+
+    def producer() -> None:
+        for _ in range(blocks):
+            time.sleep(interval)
+            produced.append(time.perf_counter())
+            stream._callback(block, frames, None, None)  # pylint: disable=protected-access
+
+    threading.Thread(target=producer, daemon=True).start()
+    delays = []
+    for index in range(blocks):
+        await stream.next_chunk()
+        delays.append(time.perf_counter() - produced[index])
+    return delays
+
+
+def parse_args(argv: Iterable[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Audio capture handoff latency benchmark.")
+    parser.add_argument("--blocks", type=int, default=200)
+    parser.add_argument("--chunk-seconds", type=float, default=0.02)
+    parser.add_argument("--sample-rate", type=int, default=16_000)
+    parser.add_argument(
+        "--executor-load",
+        type=int,
+        default=0,
+        help="Number of blocking jobs kept queued on the default executor (emulates inference).",
+    )
+    parser.add_argument("--executor-job-seconds", type=float, default=0.1)
+    return parser.parse_args(argv)
+
+
+async def run(args: argparse.Namespace) -> None:
+    config = AudioInputConfig(
+        sample_rate=args.sample_rate, chunk_duration_seconds=args.chunk_seconds
+    )
+    frames = int(args.sample_rate * args.chunk_seconds)
+    block = np.zeros(frames, dtype=np.int16).tobytes()
+
+    load_task = None
+    if args.executor_load > 0:
+        load_task = asyncio.create_task(
+            _executor_load(args.executor_load, args.executor_job_seconds)
+        )
+
+    try:
+        _summarise("queue + run_in_executor", await bench_legacy(args.blocks, args.chunk_seconds, block))
+        _summarise("ring + call_soon_threadsafe", await bench_ring(args.blocks, args.chunk_seconds, block, config))
+    finally:
+        if load_task is not None:
+            load_task.cancel()
+
+
+def main(argv: Iterable[str]) -> int:
+    args = parse_args(argv)
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
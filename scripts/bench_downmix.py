@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: per-chunk cost of the capture DSP stage vs. the legacy array downmix."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import Callable, Iterable
+
+import numpy as np
+
+if __name__ == "__main__":
+    ROOT = Path(__file__).resolve().parents[1]
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+
+from transcriber.dsp import CaptureDSP
+
+
+def legacy_downmix(data: bytes, channels: int) -> bytes:
+    """Copy of the pre-NumPy ``AudioChunkStream._downmix_to_mono`` implementation."""
+
+    sample_width = 2
+    total_samples = len(data) // sample_width
+    if channels == 1 or total_samples == 0:
+        return data
+
+    frames = total_samples // channels
+    src = array("h")
+    src.frombytes(data)
+    mono = array("h", [0]) * frames
+    idx = 0
+    for frame in range(frames):
+        acc = 0
+        for _ in range(channels):
+            acc += src[idx]
+            idx += 1
+        mono[frame] = int(acc / channels)
+    return mono.tobytes()
+
+
+def time_per_call(func: Callable[[], object], repeats: int) -> float:
+    func()  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start) / repeats
+
+
+def parse_args(argv: Iterable[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sample-rate", type=int, default=48_000)
+    parser.add_argument("--channels", type=int, default=2)
+    parser.add_argument("--chunk-seconds", type=float, default=0.5)
+    parser.add_argument("--repeats", type=int, default=50)
+    return parser.parse_args(argv)
+
+
+def main(argv: Iterable[str]) -> int:
+    args = parse_args(argv)
+    frames = int(args.sample_rate * args.chunk_seconds)
+    rng = np.random.default_rng(0)
+    block = rng.integers(-20_000, 20_000, size=frames * args.channels, dtype=np.int16).tobytes()
+
+    dsp_plain = CaptureDSP(channels=args.channels)
+    dsp_full = CaptureDSP(channels=args.channels, remove_dc=True, gain_db=3.0)
+
+    # Sanity check: the vectorised path must match the legacy truncating average.
+    expected = legacy_downmix(block, args.channels)
+    if dsp_plain.process(block).tobytes() != expected:
+        print("WARNING: vectorised downmix output differs from legacy implementation.")
+
+    legacy = time_per_call(lambda: legacy_downmix(block, args.channels), max(1, args.repeats // 10))
+    plain = time_per_call(lambda: dsp_plain.process(block), args.repeats)
+    full = time_per_call(lambda: dsp_full.process(block), args.repeats)
+
+    print(f"Chunk: {frames} frames x {args.channels} ch @ {args.sample_rate} Hz")
+    print(f"  legacy array loop      : {legacy * 1e3:9.3f} ms/chunk")
+    print(f"  numpy downmix          : {plain * 1e3:9.3f} ms/chunk ({legacy / plain:,.0f}x faster)")
+    print(f"  numpy downmix+dc+gain  : {full * 1e3:9.3f} ms/chunk ({legacy / full:,.0f}x faster)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Benchmark: CPU cost of the streaming polyphase resampler per minute of audio."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+if __name__ == "__main__":
+    ROOT = Path(__file__).resolve().parents[1]
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+
+from transcriber.resample import PolyphaseResampler
+
+DEFAULT_CONVERSIONS = "48000:16000,44100:16000,48000:8000,32000:16000,16000:48000"
+
+
+def parse_conversions(spec: str) -> List[Tuple[int, int]]:
+    pairs = []
+    for item in spec.split(","):
+        src, _, dst = item.strip().partition(":")
+        pairs.append((int(src), int(dst)))
+    return pairs
+
+
+def parse_args(argv: Iterable[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--conversions",
+        default=DEFAULT_CONVERSIONS,
+        help="Comma separated IN:OUT sample-rate pairs.",
+    )
+    parser.add_argument("--chunk-seconds", type=float, default=0.5)
+    parser.add_argument("--audio-seconds", type=float, default=60.0)
+    return parser.parse_args(argv)
+
+
+def main(argv: Iterable[str]) -> int:
+    args = parse_args(argv)
+    rng = np.random.default_rng(0)
+
+    print(f"{args.audio_seconds:g} s of audio in {args.chunk_seconds:g} s chunks")
+    print(f"{'conversion':>15}  {'L/M':>9}  {'taps':>5}  {'CPU s/audio min':>15}  {'x realtime':>10}")
+    for in_rate, out_rate in parse_conversions(args.conversions):
+        frames = int(in_rate * args.chunk_seconds)
+        chunks = max(1, int(args.audio_seconds / args.chunk_seconds))
+        block = rng.integers(-20_000, 20_000, size=frames, dtype=np.int16)
+        resampler = PolyphaseResampler(in_rate, out_rate)
+        resampler.process(block)  # warm-up
+        resampler.reset()
+
+        produced = 0
+        start = time.process_time()
+        for _ in range(chunks):
+            produced += resampler.process(block).size
+        elapsed = time.process_time() - start
+
+        audio_seconds = chunks * frames / in_rate
+        per_minute = elapsed * 60.0 / audio_seconds
+        expected = audio_seconds * out_rate
+        if abs(produced - expected) > 1:
+            print(f"WARNING: produced {produced} samples, expected ~{expected:.0f}.")
+        print(
+            f"{in_rate:>6}->{out_rate:<6}  {resampler.up:>4}/{resampler.down:<4}  "
+            f"{resampler.taps:>5}  {per_minute:>15.4f}  {audio_seconds / max(elapsed, 1e-9):>10,.0f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
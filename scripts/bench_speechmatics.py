@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""Benchmark SpeechmaticsRealtimeBackend against the local protocol stand-in.
+
+Streams paced audio through N concurrent backend sessions, each talking to
+:class:`speechmatics_standin.SpeechmaticsStandin` (next to this script), and
+reports end-to-end partial/final latency (audio sent -> transcript
+received), reconnect behaviour under scripted drops or errors, token
+issuance, event-loop lag and aggregate throughput. No network access or
+paid minutes are needed.
+
+With ``--serve`` only the stand-in is started, so the real CLI can be
+pointed at it through the printed environment variables.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import bisect
+import logging
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+if __name__ == "__main__":
+    ROOT = Path(__file__).resolve().parents[1]
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+
+from transcriber.asr.speechmatics_backend import (
+    SpeechmaticsRealtimeBackend,
+    SpeechmaticsRealtimeError,
+)
+from transcriber.config import SpeechmaticsConfig
+
+from speechmatics_standin import SpeechmaticsStandin, StandinScript
+
+_API_KEY = "standin-benchmark-key"
+
+
+@dataclass
+class ClientResult:
+    partial_latency: List[float] = field(default_factory=list)
+    final_latency: List[float] = field(default_factory=list)
+    resumes: int = 0
+    resume_seconds: List[float] = field(default_factory=list)
+    failovers: int = 0
+    failover_gaps: List[float] = field(default_factory=list)
+    audio_seconds: float = 0.0
+    uplink_bytes_per_second: float = 0.0
+    error: Optional[str] = None
+
+
+def parse_args(argv: Iterable[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Speechmatics backend benchmark (local stand-in).")
+    parser.add_argument("--sessions", type=int, default=8, help="Concurrent backend sessions.")
+    parser.add_argument("--duration", type=float, default=20.0, help="Audio seconds per session.")
+    parser.add_argument("--chunk-seconds", type=float, default=0.1)
+    parser.add_argument("--sample-rate", type=int, default=16_000)
+    parser.add_argument(
+        "--speed", type=float, default=1.0, help="Audio pacing relative to real time."
+    )
+    parser.add_argument("--partial-delay", type=float, default=0.05)
+    parser.add_argument("--final-delay", type=float, default=0.3)
+    parser.add_argument("--start-delay", type=float, default=0.0)
+    parser.add_argument(
+        "--drop-after", type=float, help="Close each client's first session after this much audio."
+    )
+    parser.add_argument(
+        "--error-after", type=float, help="Send a non-fatal Error after this much audio."
+    )
+    parser.add_argument("--hot-standby", action="store_true")
+    parser.add_argument("--send-queue-seconds", type=float, default=10.0)
+    parser.add_argument("--encoding", choices=("pcm_s16le", "mulaw"), default="pcm_s16le")
+    parser.add_argument("--serve", action="store_true", help="Only run the stand-in.")
+    parser.add_argument("--port", type=int, default=0, help="WebSocket port for --serve.")
+    parser.add_argument("--jwt-port", type=int, default=0, help="JWT endpoint port for --serve.")
+    parser.add_argument("--verbose", action="store_true")
+    return parser.parse_args(argv)
+
+
+async def _loop_lag(samples: List[float], interval: float = 0.01) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, loop.time() - expected))
+
+
+async def run_client(
+    index: int, standin: SpeechmaticsStandin, args: argparse.Namespace
+) -> ClientResult:
+    result = ClientResult()
+    config = SpeechmaticsConfig(
+        api_key=_API_KEY,
+        sample_rate=args.sample_rate,
+        connection_url=f"{standin.ws_url}?client={index}",
+        jwt_endpoint=standin.jwt_endpoint,
+        reconnect_backoff_seconds=0.1,
+        hot_standby=args.hot_standby,
+        send_queue_seconds=args.send_queue_seconds,
+        audio_encoding=args.encoding,
+    )
+    frames = int(args.sample_rate * args.chunk_seconds)
+    chunk = bytes(frames * 2)
+    chunks = max(1, int(args.duration / args.chunk_seconds))
+    sent_until: List[int] = []  # stream sample at the end of each chunk
+    sent_at: List[float] = []
+
+    backend = SpeechmaticsRealtimeBackend(config)
+
+    async def read() -> None:
+        async for segment in backend.transcript_results():
+            received = time.perf_counter()
+            if segment.end_time is None:
+                continue
+            position = bisect.bisect_left(sent_until, round(segment.end_time * args.sample_rate))
+            if position >= len(sent_at):
+                continue
+            latency = received - sent_at[position]
+            (result.final_latency if segment.is_final else result.partial_latency).append(latency)
+
+    try:
+        async with backend:
+            reader = asyncio.create_task(read())
+            interval = args.chunk_seconds / max(args.speed, 1e-3)
+            deadline = time.perf_counter()
+            for number in range(chunks):
+                sent_until.append((number + 1) * frames)
+                sent_at.append(time.perf_counter())
+                await backend.send_audio_chunk(chunk)
+                deadline += interval
+                await asyncio.sleep(max(0.0, deadline - time.perf_counter()))
+            result.audio_seconds = chunks * args.chunk_seconds
+            await backend.flush()
+            await asyncio.wait_for(reader, timeout=10.0)
+    except (SpeechmaticsRealtimeError, asyncio.TimeoutError) as exc:
+        result.error = str(exc) or type(exc).__name__
+    result.uplink_bytes_per_second = backend.uplink_bytes_per_second
+    result.resumes = backend.resume_count
+    if backend.resume_count and backend.last_resume_seconds is not None:
+        result.resume_seconds.append(backend.last_resume_seconds)
+    result.failovers = backend.failover_count
+    if backend.last_failover_gap is not None:
+        result.failover_gaps.append(backend.last_failover_gap)
+    return result
+
+
+def _summarise(label: str, values: List[float], unit: float = 1e3, suffix: str = "ms") -> None:
+    if not values:
+        print(f"{label:<22} no samples")
+        return
+    ordered = sorted(values)
+
+    def pick(q: float) -> float:
+        return ordered[int(q * (len(ordered) - 1))] * unit
+
+    print(
+        f"{label:<22} p50 {pick(0.5):8.1f} {suffix}  p95 {pick(0.95):8.1f} {suffix}  "
+        f"p99 {pick(0.99):8.1f} {suffix}  max {ordered[-1] * unit:8.1f} {suffix}  "
+        f"(mean {statistics.mean(values) * unit:.1f}, n={len(values)})"
+    )
+
+
+def _script(args: argparse.Namespace) -> StandinScript:
+    return StandinScript(
+        partial_delay=args.partial_delay,
+        final_delay=args.final_delay,
+        start_delay=args.start_delay,
+        drop_after=args.drop_after,
+        error_after=args.error_after,
+    )
+
+
+async def serve(args: argparse.Namespace) -> None:
+    standin = SpeechmaticsStandin(_script(args), ws_port=args.port, http_port=args.jwt_port)
+    async with standin:
+        print("Point the transcriber at the stand-in with:")
+        print(f"  SPEECHMATICS_CONNECTION_URL={standin.ws_url}")
+        print(f"  SPEECHMATICS_JWT_ENDPOINT={standin.jwt_endpoint}")
+        print("  SPEECHMATICS_API_KEY=<any value of 10+ characters>")
+        await asyncio.Event().wait()
+
+
+async def run(args: argparse.Namespace) -> int:
+    lag: List[float] = []
+    async with SpeechmaticsStandin(_script(args)) as standin:
+        lag_task = asyncio.create_task(_loop_lag(lag))
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(run_client(index, standin, args) for index in range(args.sessions))
+        )
+        wall = time.perf_counter() - started
+        lag_task.cancel()
+        stats = standin.stats
+
+    audio = sum(r.audio_seconds for r in results)
+    failed = [r.error for r in results if r.error]
+    print(
+        f"{args.sessions} sessions x {args.duration:.0f} s audio at {args.speed:g}x "
+        f"({args.chunk_seconds * 1e3:.0f} ms chunks, {args.encoding}) in {wall:.1f} s wall"
+    )
+    per_session = statistics.mean(r.uplink_bytes_per_second for r in results)
+    print(
+        f"throughput             {audio / wall:.1f} audio-s/s; "
+        f"{stats.audio_bytes / wall / 1024:.0f} KiB/s uplink total, "
+        f"{per_session * 8 / 1000:.0f} kbit/s per session"
+    )
+    _summarise("partial latency", [v for r in results for v in r.partial_latency])
+    _summarise("final latency", [v for r in results for v in r.final_latency])
+    _summarise("event-loop lag", lag)
+    if args.drop_after is not None or args.error_after is not None:
+        print(
+            f"resumes                {sum(r.resumes for r in results)} "
+            f"(failovers {sum(r.failovers for r in results)})"
+        )
+        _summarise("resume time", [v for r in results for v in r.resume_seconds])
+        _summarise("failover gap", [v for r in results for v in r.failover_gaps])
+    print(
+        f"stand-in               {stats.sessions_started} sessions, {stats.tokens_issued} JWTs "
+        f"issued, {stats.rejected_connections} rejected, {stats.dropped_sessions} dropped, "
+        f"{stats.errors_sent} errors sent"
+    )
+    for message in failed:
+        print(f"session failed: {message}")
+    return 1 if failed else 0
+
+
+def main(argv: Iterable[str]) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose or args.serve else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(message)s",
+    )
+    if args.serve:
+        try:
+            asyncio.run(serve(args))
+        except KeyboardInterrupt:
+            pass
+        return 0
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""Micro-benchmark the Speechmatics listener's message decode and parse path.
+
+Replays a log of server text messages (one per line, as written by
+``SPEECHMATICS_MESSAGE_LOG``) through three handlers and reports time per
+message and the memory retained by the resulting segments:
+
+* ``legacy``: stdlib ``json``, a plain dataclass keeping ``raw``, and an
+  unconditional ``logging.debug`` call, as the listener used to do;
+* ``lean (json)``: the current decode/parse path forced onto stdlib ``json``;
+* ``lean``: the current path with whichever JSON library it picked.
+
+Without ``--log`` a synthetic diarized session is generated.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional
+
+if __name__ == "__main__":
+    ROOT = Path(__file__).resolve().parents[1]
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+
+from transcriber.asr import speechmatics_backend
+from transcriber.asr.speechmatics_backend import SpeechmaticsRealtimeBackend
+from transcriber.config import SpeechmaticsConfig
+
+_WORDS = ("saluton", "al", "vi", "ĉiuj", "kaj", "bonvenon", "al", "la", "kunveno", "hodiaŭ")
+
+
+@dataclass
+class _LegacySegment:
+    text: str
+    is_final: bool
+    speaker: Optional[str] = None
+    start_time: Optional[float] = None
+    end_time: Optional[float] = None
+    raw: Optional[dict] = None
+
+
+def parse_args(argv: Iterable[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Speechmatics message decode benchmark.")
+    parser.add_argument("--log", help="Captured message log (SPEECHMATICS_MESSAGE_LOG).")
+    parser.add_argument(
+        "--generate-seconds", type=float, default=600.0, help="Synthetic session length."
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes per handler.")
+    return parser.parse_args(argv)
+
+
+def _word(index: int, start: float, end: float, speaker: str) -> dict:
+    return {
+        "type": "word",
+        "start_time": round(start, 2),
+        "end_time": round(end, 2),
+        "alternatives": [
+            {
+                "content": _WORDS[index % len(_WORDS)],
+                "confidence": 0.93,
+                "language": "eo",
+                "speaker": speaker,
+            }
+        ],
+    }
+
+
+def synthetic_log(seconds: float) -> List[str]:
+    """AudioAdded per 100 ms chunk, a partial every 250 ms and a final every ~2 s."""
+
+    messages: List[str] = []
+    words_per_second = 2.5
+    final_from = 0
+    seq_no = 0
+    for step in range(int(seconds * 10)):
+        now = (step + 1) / 10
+        seq_no += 1
+        messages.append(json.dumps({"message": "AudioAdded", "seq_no": seq_no}))
+        complete = int(now * words_per_second)
+        speaker = f"S{1 + (final_from // 20) % 3}"
+        kind = None
+        if complete - final_from >= 5:
+            kind, upto = "AddTranscript", final_from + 5
+        elif step % 3 == 0 and complete > final_from:
+            kind, upto = "AddPartialTranscript", complete
+        if kind is None:
+            continue
+        span = 1 / words_per_second
+        results = [_word(i, i * span, (i + 1) * span, speaker) for i in range(final_from, upto)]
+        messages.append(
+            json.dumps(
+                {
+                    "message": kind,
+                    "format": "2.9",
+                    "metadata": {
+                        "transcript": " ".join(r["alternatives"][0]["content"] for r in results),
+                        "start_time": results[0]["start_time"],
+                        "end_time": results[-1]["end_time"],
+                    },
+                    "results": results,
+                }
+            )
+        )
+        if kind == "AddTranscript":
+            final_from = upto
+    return messages
+
+
+def legacy_handler(message: str) -> Optional[_LegacySegment]:
+    payload = json.loads(message)
+    if payload.get("message") not in ("AddPartialTranscript", "AddTranscript"):
+        return None
+    md = payload.get("metadata") or {}
+    text = (md.get("transcript") or "").strip()
+    if not text:
+        return None
+    words = md.get("words") or []
+    segment = _LegacySegment(
+        text=text,
+        is_final=payload.get("message") == "AddTranscript",
+        speaker=md.get("speaker"),
+        start_time=words[0].get("start_time") if words else md.get("start_time"),
+        end_time=words[-1].get("end_time") if words else md.get("end_time"),
+        raw=payload,
+    )
+    logging.debug(
+        "Speechmatics transcript: %s (final=%s, speaker=%s)",
+        segment.text,
+        segment.is_final,
+        segment.speaker,
+    )
+    return segment
+
+
+def lean_handler(backend: SpeechmaticsRealtimeBackend) -> Callable[[str], object]:
+    decode = backend._decode_message  # pylint: disable=protected-access
+    parse = backend._parse_transcript  # pylint: disable=protected-access
+
+    def handle(message: str) -> object:
+        payload = decode(message)
+        if payload is None:
+            return None
+        if payload.get("message") not in ("AddPartialTranscript", "AddTranscript"):
+            return None
+        return parse(payload)
+
+    return handle
+
+
+def measure(label: str, handler: Callable[[str], object], messages: List[str], repeat: int) -> None:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for message in messages:
+            handler(message)
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    retained = [segment for segment in map(handler, messages) if segment is not None]
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<14} {best / len(messages) * 1e6:7.2f} us/message  "
+        f"{best * 1e3:8.1f} ms/pass  retained {current / 1024:9.1f} KiB "
+        f"for {len(retained)} segments"
+    )
+
+
+def main(argv: Iterable[str]) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    if args.log:
+        lines = Path(args.log).read_text(encoding="utf-8").splitlines()
+        messages = [line for line in lines if line]
+    else:
+        messages = synthetic_log(args.generate_seconds)
+    backend = SpeechmaticsRealtimeBackend(
+        SpeechmaticsConfig(api_key="benchmark-key", send_queue_seconds=0)
+    )
+    fast_loads = speechmatics_backend._json_loads  # pylint: disable=protected-access
+    print(f"{len(messages)} messages; JSON library: {fast_loads.__module__}")
+
+    measure("legacy", legacy_handler, messages, args.repeat)
+    speechmatics_backend._json_loads = json.loads  # pylint: disable=protected-access
+    try:
+        measure("lean (json)", lean_handler(backend), messages, args.repeat)
+    finally:
+        speechmatics_backend._json_loads = fast_loads  # pylint: disable=protected-access
+    measure("lean", lean_handler(backend), messages, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
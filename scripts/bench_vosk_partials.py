@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Benchmark Vosk CPU cost per audio minute at different partial-result rates.
+
+Decodes a WAV file with one recognizer per setting, on a simulated
+real-time clock so the throttle sees the same timing as live capture, and
+reports CPU seconds spent per minute of audio together with the number of
+partials extracted. Rows:
+
+* ``off``: no partials at all (lower bound);
+* ``every chunk``: the old behaviour, ``PartialResult()`` + ``json.loads``
+  after every chunk;
+* one row per ``--intervals`` value using :class:`PartialThrottle` with the
+  same minimum interval and minimum audio delta, plus the unchanged-result
+  shortcut.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+if __name__ == "__main__":
+    ROOT = Path(__file__).resolve().parents[1]
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+
+from vosk import KaldiRecognizer, SetLogLevel  # type: ignore
+
+from transcriber.asr.vosk_backend import PartialThrottle
+from transcriber.asr.vosk_models import shared_model_registry
+from transcriber.config import AudioInputConfig
+from transcriber.file_source import FileAudioSource
+
+
+def parse_args(argv: Iterable[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Vosk partial-rate CPU benchmark.")
+    parser.add_argument("--model", required=True, help="Vosk model directory.")
+    parser.add_argument("--input", required=True, help="WAV file with speech.")
+    parser.add_argument("--sample-rate", type=int, default=16_000)
+    parser.add_argument("--chunk-seconds", type=float, default=0.1)
+    parser.add_argument(
+        "--intervals",
+        default="0.1,0.2,0.3,0.5,1.0",
+        help="Comma-separated partial intervals (seconds) to compare.",
+    )
+    return parser.parse_args(argv)
+
+
+async def load_chunks(path: str, sample_rate: int, chunk_seconds: float) -> List[bytes]:
+    config = AudioInputConfig(sample_rate=sample_rate, chunk_duration_seconds=chunk_seconds)
+    source = FileAudioSource(path, config, speed=0, output_sample_rate=sample_rate)
+    chunks: List[bytes] = []
+    async with source.connect() as stream:
+        async for chunk in stream:
+            chunks.append(chunk)
+    return chunks
+
+
+def run_setting(
+    model, chunks: List[bytes], sample_rate: int, mode: str, interval: Optional[float] = None
+) -> tuple[float, int]:
+    """Return ``(cpu_seconds, partials_extracted)`` for one decode of ``chunks``."""
+
+    recognizer = KaldiRecognizer(model, sample_rate)
+    recognizer.SetWords(True)
+    throttle = None
+    if interval is not None:
+        throttle = PartialThrottle(interval, int(interval * sample_rate))
+    last_raw = ""
+    partials = 0
+    position = 0
+    started = time.process_time()
+    for chunk in chunks:
+        position += len(chunk) // 2
+        now = position / sample_rate  # simulated real-time arrival
+        if recognizer.AcceptWaveform(chunk):
+            json.loads(recognizer.Result())
+            if throttle is not None:
+                throttle.mark(position, now, extracted=False)
+            last_raw = ""
+        elif mode == "every":
+            json.loads(recognizer.PartialResult())
+            partials += 1
+        elif throttle is not None and throttle.due(position, now, backlogged=False):
+            raw = recognizer.PartialResult()
+            throttle.mark(position, now)
+            partials += 1
+            if raw != last_raw:
+                json.loads(raw)
+                last_raw = raw
+    json.loads(recognizer.FinalResult())
+    return time.process_time() - started, partials
+
+
+def main(argv: Iterable[str]) -> int:
+    args = parse_args(argv)
+    SetLogLevel(-1)
+    model = shared_model_registry().model(args.model)
+    chunks = asyncio.run(load_chunks(args.input, args.sample_rate, args.chunk_seconds))
+    minutes = sum(len(c) for c in chunks) / 2 / args.sample_rate / 60
+    if not minutes:
+        print("ERROR: input contains no audio", file=sys.stderr)
+        return 1
+    print(f"{minutes * 60:.1f} s of audio in {args.chunk_seconds * 1e3:.0f} ms chunks")
+
+    rows = [("off", "off", None), ("every chunk", "every", None)]
+    for value in args.intervals.split(","):
+        interval = float(value)
+        rows.append((f"every {interval:g} s", "throttled", interval))
+    baseline: Optional[float] = None
+    for label, mode, interval in rows:
+        cpu, partials = run_setting(model, chunks, args.sample_rate, mode, interval)
+        per_minute = cpu / minutes
+        if baseline is None:
+            baseline = per_minute
+        print(
+            f"{label:<14} {per_minute:6.2f} CPU-s per audio minute "
+            f"(+{per_minute - baseline:5.2f} for partials)  {partials:5d} partials"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
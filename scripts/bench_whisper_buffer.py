@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""Benchmark the Whisper backend's audio buffering over a long simulated session.
+
+Feeds ``--hours`` of synthetic 16 kHz PCM chunks through two buffer
+implementations and the two ways the backend hands audio to the model:
+
+* ``segments``: fixed ``--segment-seconds`` slices (the default mode);
+* ``sliding``: the whole window every ``--interval`` seconds of new audio,
+  trimmed once it passes half of ``--window-seconds`` (streaming mode).
+
+``legacy`` is the previous ``bytearray`` path (slice, delete from the
+front, ``np.frombuffer`` then ``astype`` and divide); ``window`` is
+:class:`~transcriber.ringbuffer.FloatAudioWindow`. For each pair the
+script reports wall time per chunk, bytes allocated along the way (sum of
+per-chunk tracemalloc peaks, a lower bound) and memory still held at the
+end. No model is loaded; the model input is only touched.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List
+
+import numpy as np
+
+if __name__ == "__main__":
+    ROOT = Path(__file__).resolve().parents[1]
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+
+from transcriber.dsp import pcm16_view
+from transcriber.ringbuffer import FloatAudioWindow
+
+SAMPLE_RATE = 16_000
+
+
+def parse_args(argv: Iterable[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Whisper buffering memory benchmark.")
+    parser.add_argument("--hours", type=float, default=3.0, help="Simulated session length.")
+    parser.add_argument("--chunk-seconds", type=float, default=0.1)
+    parser.add_argument("--segment-seconds", type=float, default=6.0)
+    parser.add_argument("--interval", type=float, default=0.5, help="Sliding re-decode interval.")
+    parser.add_argument("--window-seconds", type=float, default=15.0)
+    return parser.parse_args(argv)
+
+
+class LegacyBuffer:
+    """The ``bytearray`` buffering the backend used before ``FloatAudioWindow``."""
+
+    def __init__(self, capacity: int) -> None:  # noqa: ARG002 - same signature
+        self._buffer = bytearray()
+
+    def __len__(self) -> int:
+        return len(self._buffer) // 2
+
+    def append(self, chunk: bytes) -> None:
+        self._buffer.extend(chunk)
+
+    def take(self, samples: int) -> np.ndarray:
+        segment = self._buffer[: samples * 2]
+        del self._buffer[: samples * 2]
+        return np.frombuffer(segment, dtype=np.int16).astype(np.float32) / 32768.0
+
+    def window(self) -> np.ndarray:
+        return np.frombuffer(bytes(self._buffer), dtype=np.int16).astype(np.float32) / 32768.0
+
+    def trim(self, samples: int) -> None:
+        del self._buffer[: samples * 2]
+
+
+class WindowBuffer:
+    """The same operations on :class:`FloatAudioWindow`."""
+
+    def __init__(self, capacity: int) -> None:
+        self._window = FloatAudioWindow(capacity)
+
+    def __len__(self) -> int:
+        return len(self._window)
+
+    def append(self, chunk: bytes) -> None:
+        self._window.append(pcm16_view(chunk))
+
+    def take(self, samples: int) -> np.ndarray:
+        start = self._window.start
+        view = self._window.view(start, start + samples)
+        self._window.discard_until(start + samples)
+        return view
+
+    def window(self) -> np.ndarray:
+        return self._window.view(self._window.start, self._window.end)
+
+    def trim(self, samples: int) -> None:
+        self._window.discard_until(self._window.start + samples)
+
+
+def make_chunks(chunk_samples: int, count: int = 64) -> List[bytes]:
+    rng = np.random.default_rng(0)
+    return [
+        rng.normal(0, 3000, chunk_samples).clip(-32768, 32767).astype(np.int16).tobytes()
+        for _ in range(count)
+    ]
+
+
+def segments_steps(buffer, chunks: List[bytes], total: int, segment: int) -> Iterator[float]:
+    for index in range(total):
+        buffer.append(chunks[index % len(chunks)])
+        touched = 0.0
+        while len(buffer) >= segment:
+            touched += float(buffer.take(segment)[-1])
+        yield touched
+
+
+def sliding_steps(
+    buffer, chunks: List[bytes], total: int, interval: int, window: int
+) -> Iterator[float]:
+    pending = 0
+    for index in range(total):
+        chunk = chunks[index % len(chunks)]
+        buffer.append(chunk)
+        pending += len(chunk) // 2
+        touched = 0.0
+        if pending >= interval:
+            pending = 0
+            touched = float(buffer.window()[-1])
+            if len(buffer) > window // 2:
+                # Commit trims the window back to the last agreed word.
+                buffer.trim(len(buffer) - SAMPLE_RATE)
+        yield touched
+
+
+def measure(label: str, steps: Callable[[], Iterator[float]], total: int) -> None:
+    started = time.perf_counter()
+    for _ in steps():
+        pass
+    elapsed = time.perf_counter() - started
+
+    allocated = 0
+    tracemalloc.start()
+    iterator = steps()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in iterator:
+        current, peak = tracemalloc.get_traced_memory()
+        allocated += max(0, peak - before)
+        before = current
+        tracemalloc.reset_peak()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(
+        f"{label:<18} {elapsed / total * 1e6:7.2f} us/chunk  "
+        f"{allocated / 2**20:10.1f} MiB allocated  {retained / 2**10:9.1f} KiB held at end"
+    )
+
+
+def main(argv: Iterable[str]) -> int:
+    args = parse_args(argv)
+    chunk_samples = int(args.chunk_seconds * SAMPLE_RATE)
+    total = int(args.hours * 3600 / args.chunk_seconds)
+    segment = int(args.segment_seconds * SAMPLE_RATE)
+    interval = int(args.interval * SAMPLE_RATE)
+    window = int(args.window_seconds * SAMPLE_RATE)
+    capacity = window + segment + SAMPLE_RATE
+    chunks = make_chunks(chunk_samples)
+    print(
+        f"{args.hours:g} h session, {total} chunks of {args.chunk_seconds * 1e3:.0f} ms; "
+        f"window capacity {capacity * 8 / 2**20:.1f} MiB preallocated"
+    )
+
+    for name, factory in (("legacy", LegacyBuffer), ("window", WindowBuffer)):
+        measure(
+            f"segments {name}",
+            lambda f=factory: segments_steps(f(capacity), chunks, total, segment),
+            total,
+        )
+    for name, factory in (("legacy", LegacyBuffer), ("window", WindowBuffer)):
+        measure(
+            f"sliding {name}",
+            lambda f=factory: sliding_steps(f(capacity), chunks, total, interval, window),
+            total,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
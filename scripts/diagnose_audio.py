@@ -2,8 +2,17 @@
 """Audio device diagnostic script for Ubuntu troubleshooting."""
 
 import sys
+from pathlib import Path
+
 import sounddevice as sd
 
+# allow running from scripts/ by adding project root
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from transcriber.devices import default_registry
+
 
 def print_section(title):
     """Print a formatted section header."""
@@ -16,10 +25,11 @@ def main():
     """Run audio device diagnostics."""
     print_section("Audio Device Diagnostics")
 
-    # List all audio devices
+    # List all audio devices (same cached table the transcriber uses)
     print_section("All Available Audio Devices")
-    devices = sd.query_devices()
-    if isinstance(devices, list):
+    snapshot = default_registry().snapshot
+    devices = list(snapshot.devices)
+    if devices:
         for idx, device in enumerate(devices):
             device_type = []
             if device.get('max_input_channels', 0) > 0:
@@ -36,15 +46,16 @@ def main():
 
     # Show default devices
     print_section("Default Devices")
-    try:
-        default_input = sd.query_devices(kind='input')
+    default_input = snapshot.get(snapshot.default_input)
+    if default_input is not None:
         print(f"Default INPUT device:")
         print(f"  Index: {default_input.get('index', 'N/A')}")
         print(f"  Name: {default_input.get('name', 'N/A')}")
         print(f"  Channels: {default_input.get('max_input_channels', 0)}")
         print()
-    except Exception as exc:
-        print(f"Error querying default input device: {exc}\n")
+    else:
+        print("Error querying default input device: none reported\n")
+    print(f"Device table fingerprint: {snapshot.fingerprint[:12] or 'N/A'}\n")
 
     try:
         default_output = sd.query_devices(kind='output')
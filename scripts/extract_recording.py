@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Cut a time range out of a recorded session into a WAV replayable with --input-file."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable
+
+if __name__ == "__main__":
+    ROOT = Path(__file__).resolve().parents[1]
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+
+from transcriber.recorder import RecordingError, RecordingIndex, extract_range
+
+
+def parse_args(argv: Iterable[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("session_dir", help="Session directory under RECORDING_DIR.")
+    parser.add_argument("--start", default="0", help="Start: seconds into the session or ISO time.")
+    parser.add_argument("--end", required=True, help="End: seconds into the session or ISO time.")
+    parser.add_argument("-o", "--output", default="extract.wav")
+    return parser.parse_args(argv)
+
+
+def _parse_bound(value: str) -> tuple[float, str]:
+    try:
+        return float(value), "stream"
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp(), "wall"
+
+
+def main(argv: Iterable[str]) -> int:
+    args = parse_args(argv)
+    start, start_clock = _parse_bound(args.start)
+    end, end_clock = _parse_bound(args.end)
+    try:
+        if start_clock != end_clock:
+            # Mixed bounds: express both on the wall clock.
+            index = RecordingIndex.load(args.session_dir)
+            if start_clock == "stream":
+                start = index.started_at + start
+            else:
+                end = index.started_at + end
+            start_clock = end_clock = "wall"
+        samples = extract_range(args.session_dir, start, end, args.output, clock=start_clock)
+        sample_rate = RecordingIndex.load(args.session_dir).sample_rate
+    except (RecordingError, ValueError) as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+
+    print(f"Wrote {samples / sample_rate:.2f} s ({samples} samples @ {sample_rate} Hz) to {args.output}")
+    print(f"Replay: python -m transcriber.cli --input-file {args.output}")
+    return 0 if samples else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
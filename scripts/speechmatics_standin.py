@@ -0,0 +1,365 @@
+"""Local stand-in for the Speechmatics realtime API, for tests and benchmarks.
+
+A test double, kept out of the ``transcriber`` package on purpose; it is
+imported by ``bench_speechmatics.py`` from this directory.
+
+Speaks the subset of the realtime protocol that
+:class:`~transcriber.asr.speechmatics_backend.SpeechmaticsRealtimeBackend`
+uses (``StartRecognition``, binary audio, ``AudioAdded``,
+``RecognitionStarted``, ``AddPartialTranscript``/``AddTranscript``,
+``EndOfStream``/``EndOfTranscript`` and ``Error``) and serves a mock
+temporary-key endpoint. Transcripts are scripted: words are laid out at a
+fixed rate on the audio clock and emitted once enough audio has arrived,
+after a configurable delay, so client-side latency can be measured exactly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import json
+import logging
+import secrets
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from aiohttp import web
+from websockets.asyncio.server import Server, ServerConnection, serve
+from websockets.exceptions import ConnectionClosed
+from websockets.http11 import Request, Response
+
+_SAMPLE_BYTES = {"pcm_s16le": 2, "mulaw": 1}
+DEFAULT_WORDS = ("saluton", "al", "vi", "ĉiuj", "kaj", "bonvenon", "al", "la", "kunveno")
+
+
+@dataclass
+class StandinScript:
+    """What the stand-in says and when.
+
+    Word ``i`` spans ``[i / words_per_second, (i + 1) / words_per_second)``
+    seconds of received audio. A partial covering the open utterance is
+    emitted every ``partial_interval`` seconds of audio, and a final after
+    every ``words_per_final`` words; each is sent ``partial_delay`` /
+    ``final_delay`` seconds after the audio that completes it arrives.
+
+    Faults apply to the first ``fault_sessions`` sessions of each client
+    (clients are told apart by a ``client`` query parameter on the URL):
+    ``drop_after`` closes the socket and ``error_after`` sends an ``Error``
+    of type ``error_type`` once that much audio has been received.
+    """
+
+    words: Tuple[str, ...] = DEFAULT_WORDS
+    words_per_second: float = 2.5
+    words_per_final: int = 5
+    partial_interval: float = 0.25
+    partial_delay: float = 0.05
+    final_delay: float = 0.3
+    start_delay: float = 0.0
+    drop_after: Optional[float] = None
+    error_after: Optional[float] = None
+    error_type: str = "job_error"
+    fault_sessions: int = 1
+
+
+@dataclass
+class StandinStats:
+    tokens_issued: int = 0
+    sessions_started: int = 0
+    sessions_active: int = 0
+    rejected_connections: int = 0
+    dropped_sessions: int = 0
+    errors_sent: int = 0
+    audio_bytes: int = 0
+    partials_sent: int = 0
+    finals_sent: int = 0
+    sessions_per_client: Dict[str, int] = field(default_factory=dict)
+
+
+class _Session:
+    """One realtime session: turns received audio into scheduled transcript messages."""
+
+    def __init__(
+        self, websocket: ServerConnection, script: StandinScript, stats: StandinStats, faulty: bool
+    ) -> None:
+        self.websocket = websocket
+        self.script = script
+        self.stats = stats
+        self.faulty = faulty
+        self.sample_rate = 16_000
+        self.sample_bytes = 2
+        self.samples = 0
+        self.seq_no = 0
+        self.final_words = 0  # words already covered by finals
+        self.next_partial = script.partial_interval
+        self._outbox: List[Tuple[float, int, Dict[str, Any]]] = []
+        self._order = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._writer: Optional[asyncio.Task] = None
+
+    @property
+    def audio_seconds(self) -> float:
+        return self.samples / self.sample_rate
+
+    async def run(self) -> None:
+        start = json.loads(await self.websocket.recv())
+        if start.get("message") != "StartRecognition":
+            await self._send_now(self._error("protocol_error", "Expected StartRecognition"))
+            return
+        audio_format = start.get("audio_format") or {}
+        encoding = audio_format.get("encoding")
+        if encoding not in _SAMPLE_BYTES:
+            await self._send_now(
+                self._error("invalid_audio_type", f"Unsupported encoding {encoding!r}")
+            )
+            return
+        self.sample_bytes = _SAMPLE_BYTES[encoding]
+        self.sample_rate = int(audio_format.get("sample_rate") or self.sample_rate)
+        if self.script.start_delay:
+            await asyncio.sleep(self.script.start_delay)
+        await self._send_now({"message": "RecognitionStarted", "id": secrets.token_hex(8)})
+        self._writer = asyncio.create_task(self._write_loop())
+        try:
+            async for message in self.websocket:
+                if isinstance(message, bytes):
+                    if await self._on_audio(message):
+                        return
+                    continue
+                payload = json.loads(message)
+                if payload.get("message") == "EndOfStream":
+                    await self._drain()
+                    self._emit_final(int(self.audio_seconds * self.script.words_per_second), 0.0)
+                    await self._drain()
+                    await self._send_now({"message": "EndOfTranscript"})
+                    return
+        finally:
+            if self._writer is not None:
+                self._writer.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._writer
+
+    async def _on_audio(self, chunk: bytes) -> bool:
+        """Account for one audio message; return True when the session was ended by a fault."""
+
+        self.samples += len(chunk) // self.sample_bytes
+        self.seq_no += 1
+        self.stats.audio_bytes += len(chunk)
+        self._schedule(0.0, {"message": "AudioAdded", "seq_no": self.seq_no})
+        now = self.audio_seconds
+        script = self.script
+        if self.faulty and script.drop_after is not None and now >= script.drop_after:
+            self.stats.dropped_sessions += 1
+            await self.websocket.close(code=1011, reason="stand-in: scripted drop")
+            return True
+        if self.faulty and script.error_after is not None and now >= script.error_after:
+            self.stats.errors_sent += 1
+            await self._drain()
+            await self._send_now(self._error(script.error_type, "stand-in: scripted error"))
+            await self.websocket.close()
+            return True
+        complete = int(now * script.words_per_second)
+        while complete - self.final_words >= script.words_per_final:
+            self._emit_final(self.final_words + script.words_per_final, script.final_delay)
+        if now >= self.next_partial:
+            self.next_partial = now + script.partial_interval
+            # The partial includes the word still being spoken.
+            self._emit(
+                "AddPartialTranscript", self.final_words, complete + 1, now, script.partial_delay
+            )
+        return False
+
+    def _emit_final(self, upto: int, delay: float) -> None:
+        if upto <= self.final_words:
+            return
+        end = min(upto / self.script.words_per_second, self.audio_seconds)
+        self._emit("AddTranscript", self.final_words, upto, end, delay)
+        self.final_words = upto
+
+    def _emit(self, kind: str, first: int, last: int, end: float, delay: float) -> None:
+        script = self.script
+        span = 1.0 / script.words_per_second
+        results = []
+        for index in range(first, last):
+            results.append(
+                {
+                    "type": "word",
+                    "start_time": round(index * span, 3),
+                    "end_time": round(min((index + 1) * span, end), 3),
+                    "alternatives": [
+                        {"content": script.words[index % len(script.words)], "confidence": 1.0}
+                    ],
+                }
+            )
+        if not results:
+            return
+        self._schedule(
+            delay,
+            {
+                "message": kind,
+                "metadata": {
+                    "transcript": " ".join(r["alternatives"][0]["content"] for r in results),
+                    "start_time": results[0]["start_time"],
+                    "end_time": results[-1]["end_time"],
+                },
+                "results": results,
+            },
+        )
+        if kind == "AddTranscript":
+            self.stats.finals_sent += 1
+        else:
+            self.stats.partials_sent += 1
+
+    def _schedule(self, delay: float, message: Dict[str, Any]) -> None:
+        due = asyncio.get_running_loop().time() + delay
+        heapq.heappush(self._outbox, (due, next(self._order), message))
+        self._wakeup.set()
+
+    async def _write_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self._outbox:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            due = self._outbox[0][0]
+            wait = due - loop.time()
+            if wait > 0:
+                # asyncio.wait rather than wait_for: the latter can swallow our
+                # cancellation in _drain when the wakeup fires at the same time.
+                self._wakeup.clear()
+                waiter = asyncio.ensure_future(self._wakeup.wait())
+                try:
+                    await asyncio.wait({waiter}, timeout=wait)
+                finally:
+                    waiter.cancel()
+                continue
+            _, _, message = heapq.heappop(self._outbox)
+            await self._send_now(message)
+
+    async def _drain(self) -> None:
+        """Send everything still scheduled, immediately and in order."""
+
+        if self._writer is not None:
+            self._writer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._writer
+            self._writer = None
+        while self._outbox:
+            _, _, message = heapq.heappop(self._outbox)
+            await self._send_now(message)
+
+    async def _send_now(self, message: Dict[str, Any]) -> None:
+        await self.websocket.send(json.dumps(message))
+
+    @staticmethod
+    def _error(error_type: str, reason: str) -> Dict[str, Any]:
+        return {"message": "Error", "type": error_type, "reason": reason}
+
+
+class SpeechmaticsStandin:
+    """Run the stand-in realtime server and mock JWT endpoint on localhost.
+
+    Use as an async context manager, then point a backend at
+    :attr:`ws_url` (``SPEECHMATICS_CONNECTION_URL``) and
+    :attr:`jwt_endpoint` (``SPEECHMATICS_JWT_ENDPOINT``). Connections must
+    present a token issued by the mock endpoint, or ``static_token`` when
+    set; anything else is rejected with HTTP 401.
+    """
+
+    def __init__(
+        self,
+        script: Optional[StandinScript] = None,
+        host: str = "127.0.0.1",
+        ws_port: int = 0,
+        http_port: int = 0,
+        static_token: Optional[str] = None,
+    ) -> None:
+        self.script = script or StandinScript()
+        self.host = host
+        self._ws_port = ws_port
+        self._http_port = http_port
+        self.static_token = static_token
+        self.stats = StandinStats()
+        self._tokens: Set[str] = set()
+        self._server: Optional[Server] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def ws_url(self) -> str:
+        return f"ws://{self.host}:{self._ws_port}/v2"
+
+    @property
+    def jwt_endpoint(self) -> str:
+        return f"http://{self.host}:{self._http_port}/v1/api_keys"
+
+    async def __aenter__(self) -> "SpeechmaticsStandin":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+        await self.stop()
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_post("/v1/api_keys", self._issue_token)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self._http_port)
+        await site.start()
+        self._http_port = self._runner.addresses[0][1]
+
+        self._server = await serve(
+            self._handle,
+            self.host,
+            self._ws_port,
+            process_request=self._authorise,
+            max_size=4 * 1024 * 1024,
+        )
+        self._ws_port = next(iter(self._server.sockets)).getsockname()[1]
+        logging.info("Speechmatics stand-in on %s (JWT at %s)", self.ws_url, self.jwt_endpoint)
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _issue_token(self, request: web.Request) -> web.Response:
+        if not request.headers.get("Authorization", "").startswith("Bearer "):
+            return web.json_response({"detail": "missing API key"}, status=401)
+        if request.query.get("type") != "rt":
+            return web.json_response({"detail": "only rt keys are supported"}, status=400)
+        token = secrets.token_urlsafe(24)
+        self._tokens.add(token)
+        self.stats.tokens_issued += 1
+        return web.json_response({"key_value": token}, status=201)
+
+    def _authorise(self, connection: ServerConnection, request: Request) -> Optional[Response]:
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+        if token and (token in self._tokens or token == self.static_token):
+            return None
+        self.stats.rejected_connections += 1
+        return connection.respond(HTTPStatus.UNAUTHORIZED, "invalid or missing token\n")
+
+    async def _handle(self, websocket: ServerConnection) -> None:
+        query = parse_qs(urlparse(websocket.request.path).query)
+        client = (query.get("client") or [""])[0]
+        previous = self.stats.sessions_per_client.get(client, 0)
+        self.stats.sessions_per_client[client] = previous + 1
+        self.stats.sessions_started += 1
+        self.stats.sessions_active += 1
+        session = _Session(
+            websocket, self.script, self.stats, faulty=previous < self.script.fault_sessions
+        )
+        try:
+            await session.run()
+        except ConnectionClosed:
+            pass
+        finally:
+            self.stats.sessions_active -= 1
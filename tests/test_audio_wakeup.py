@@ -0,0 +1,57 @@
+"""AudioChunkStream wakes a ``wait_for_frames`` caller at its own threshold."""
+
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+
+from transcriber.audio import AudioChunkStream
+from transcriber.config import AudioInputConfig
+
+CHUNK = 8000  # 0.5 s at 16 kHz, the default chunk
+
+
+def capture(stream: AudioChunkStream, frames: int) -> None:
+    """Feed ``frames`` samples through the PortAudio callback."""
+
+    stream._callback(np.ones(frames, dtype=np.int16).tobytes(), frames, None, None)
+
+
+def stream_on_running_loop() -> AudioChunkStream:
+    stream = AudioChunkStream(AudioInputConfig())
+    stream._loop = asyncio.get_running_loop()
+    stream._data_ready = asyncio.Event()
+    return stream
+
+
+def test_a_waiter_for_less_than_a_chunk_is_woken_without_a_full_chunk() -> None:
+    async def scenario() -> None:
+        stream = stream_on_running_loop()
+        waiter = asyncio.create_task(stream.wait_for_frames(1600))
+        await asyncio.sleep(0)
+        capture(stream, 1000)
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        capture(stream, 1000)
+        await asyncio.wait_for(waiter, 1.0)
+        assert stream.buffer.available == 2000
+
+    asyncio.run(scenario())
+
+
+def test_a_waiter_for_more_than_a_chunk_is_not_woken_early() -> None:
+    async def scenario() -> None:
+        stream = stream_on_running_loop()
+        wakeups = []
+        wake = stream._wake_consumer
+        stream._wake_consumer = lambda: (wakeups.append(stream.buffer.available), wake())
+        waiter = asyncio.create_task(stream.wait_for_frames(CHUNK + 4000))
+        await asyncio.sleep(0)
+        capture(stream, CHUNK)
+        await asyncio.sleep(0.01)
+        capture(stream, 4000)
+        await asyncio.wait_for(waiter, 1.0)
+        assert wakeups == [CHUNK + 4000]
+
+    asyncio.run(scenario())
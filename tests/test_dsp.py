@@ -0,0 +1,115 @@
+"""Capture DSP (downmix, DC removal, gain) and G.711 mu-law encoding."""
+
+from __future__ import annotations
+
+import warnings
+
+import numpy as np
+import pytest
+
+from transcriber.dsp import CaptureDSP, mulaw_encode
+
+RATE = 16_000
+
+
+def interleave(*channels: np.ndarray) -> bytes:
+    return np.stack(channels, axis=1).astype(np.int16).tobytes()
+
+
+def sine(amplitude: float, frames: int, hz: float = 440.0, offset: float = 0.0) -> np.ndarray:
+    return offset + amplitude * np.sin(2 * np.pi * hz * np.arange(frames) / RATE)
+
+
+def test_stereo_downmix_applies_the_channel_weights() -> None:
+    left = np.full(4, 1000)
+    right = np.full(4, -2000)
+    weighted = CaptureDSP(2, channel_weights=(0.75, 0.25)).process(interleave(left, right))
+    assert weighted.dtype == np.int16
+    assert weighted.tolist() == [250] * 4
+    # Without weights the channels are averaged.
+    assert CaptureDSP(2).process(interleave(left, right)).tolist() == [-500] * 4
+
+
+def test_channel_weights_must_match_the_channel_count() -> None:
+    with pytest.raises(ValueError):
+        CaptureDSP(2, channel_weights=(1.0, 0.0, 0.0))
+
+
+def test_mono_without_processing_is_passed_through() -> None:
+    dsp = CaptureDSP(1)
+    pcm = np.arange(-5, 5, dtype=np.int16)
+    assert dsp.is_passthrough
+    assert dsp.process(pcm.tobytes()).tolist() == pcm.tolist()
+
+
+def test_dc_offset_is_removed_across_blocks() -> None:
+    dsp = CaptureDSP(1, remove_dc=True)
+    signal = sine(5000, RATE, offset=3000).astype(np.int16)
+    blocks = [dsp.process(block.tobytes()) for block in np.split(signal, 10)]
+    out = np.concatenate(blocks).astype(np.float64)
+    assert abs(out.mean()) < 30
+    # The sine itself is untouched.
+    assert out.max() == pytest.approx(5000, abs=30)
+    assert out.min() == pytest.approx(-5000, abs=30)
+
+
+def test_gain_scales_and_clips_to_int16() -> None:
+    dsp = CaptureDSP(1, gain_db=6.0)
+    out = dsp.process(np.array([1000, -1000, 20000, -20000], dtype=np.int16).tobytes())
+    assert out[:2].tolist() == pytest.approx([1995, -1995], abs=1)
+    assert out[2:].tolist() == [32767, -32768]
+    # On a downmix the gain is folded into the weights.
+    stereo = CaptureDSP(2, channel_weights=(1.0, 0.0), gain_db=6.0)
+    mixed = stereo.process(interleave(np.full(2, 1000), np.full(2, 9999)))
+    assert mixed.tolist() == pytest.approx([1995, 1995], abs=1)
+
+
+_SEG_UEND = (0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF)
+
+
+def reference_linear2ulaw(pcm: int) -> int:
+    """Scalar port of ``linear2ulaw`` from Sun's public-domain ``g711.c``."""
+
+    pcm >>= 2
+    if pcm < 0:
+        pcm, mask = -pcm, 0x7F
+    else:
+        mask = 0xFF
+    pcm = min(pcm, 8159) + (0x84 >> 2)
+    segment = next((index for index, end in enumerate(_SEG_UEND) if pcm <= end), 8)
+    if segment >= 8:
+        return 0x7F ^ mask
+    return ((segment << 4) | ((pcm >> (segment + 1)) & 0x0F)) ^ mask
+
+
+def every_int16() -> np.ndarray:
+    return np.arange(-32768, 32768, dtype=np.int16)
+
+
+def test_mulaw_is_bit_exact_with_the_reference_for_every_sample() -> None:
+    pcm = every_int16()
+    expected = bytes(reference_linear2ulaw(int(value)) for value in pcm)
+    assert mulaw_encode(pcm.tobytes()) == expected
+
+
+def test_mulaw_matches_audioop_when_available() -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        audioop = pytest.importorskip("audioop")  # removed in Python 3.13
+        expected = audioop.lin2ulaw(every_int16().tobytes(), 2)
+    assert mulaw_encode(every_int16().tobytes()) == expected
+
+
+@pytest.mark.parametrize(
+    "sample,code",
+    [(0, 0xFF), (-1, 0x7E), (32767, 0x80), (-32768, 0x00), (1000, 0xCE), (-1000, 0x4E)],
+)
+def test_mulaw_known_codes(sample: int, code: int) -> None:
+    assert mulaw_encode(np.array([sample], dtype=np.int16).tobytes()) == bytes([code])
+
+
+def test_mulaw_halves_the_payload_and_accepts_buffers() -> None:
+    pcm = np.arange(-800, 800, dtype=np.int16)
+    encoded = mulaw_encode(memoryview(pcm.tobytes()))
+    assert len(encoded) == pcm.size
+    assert mulaw_encode(b"") == b""
@@ -0,0 +1,92 @@
+"""LocalAgreement: committing the prefix two window hypotheses agree on."""
+
+from __future__ import annotations
+
+from typing import List, Sequence
+
+import pytest
+
+pytest.importorskip("vosk")
+pytest.importorskip("faster_whisper")
+
+from transcriber.asr.whisper_backend import LocalAgreement, _Word  # noqa: E402
+
+
+def hypothesis(text: str, start: float = 0.0, step: float = 0.5) -> List[_Word]:
+    return [
+        _Word(start + index * step, start + (index + 1) * step, word)
+        for index, word in enumerate(text.split())
+    ]
+
+
+def texts(words: Sequence[_Word]) -> List[str]:
+    return [word.text for word in words]
+
+
+def test_a_single_hypothesis_stays_tentative() -> None:
+    agreement = LocalAgreement()
+    assert agreement.insert(hypothesis("saluton al vi")) == []
+    assert agreement.tentative_text == "saluton al vi"
+    assert agreement.prompt == ""
+
+
+def test_the_agreed_prefix_is_committed_and_prompted() -> None:
+    agreement = LocalAgreement()
+    agreement.insert(hypothesis("saluton al vi"))
+    committed = agreement.insert(hypothesis("saluton al vi ĉiuj"))
+    assert texts(committed) == ["saluton", "al", "vi"]
+    assert agreement.committed_end == pytest.approx(1.5)
+    assert agreement.tentative_text == "ĉiuj"
+    assert agreement.prompt == "saluton al vi"
+
+
+def test_agreement_stops_at_the_first_differing_word() -> None:
+    agreement = LocalAgreement()
+    agreement.insert(hypothesis("mi estas tie"))
+    assert texts(agreement.insert(hypothesis("mi estis tie"))) == ["mi"]
+    assert agreement.tentative_text == "estis tie"
+
+
+def test_case_and_punctuation_do_not_break_agreement() -> None:
+    agreement = LocalAgreement()
+    agreement.insert(hypothesis("Bonan tagon, amikoj"))
+    committed = agreement.insert(hypothesis("bonan tagon amikoj!"))
+    # The newest spelling is the one committed.
+    assert texts(committed) == ["bonan", "tagon", "amikoj!"]
+
+
+def test_words_before_the_committed_end_are_ignored() -> None:
+    agreement = LocalAgreement()
+    agreement.insert(hypothesis("unu du"))
+    agreement.insert(hypothesis("unu du tri"))  # commits "unu du" up to 1.0 s
+    # The window still starts at 0 s: the old words come back with their times.
+    agreement.insert(hypothesis("unu du tri kvar"))
+    assert agreement.tentative_text == "kvar"
+    assert agreement.prompt == "unu du tri"
+
+
+def test_a_repeated_committed_tail_is_dropped() -> None:
+    agreement = LocalAgreement()
+    agreement.insert(hypothesis("la suno brilas"))
+    agreement.insert(hypothesis("la suno brilas"))
+    assert agreement.committed_end == pytest.approx(1.5)
+    # After a trim Whisper re-reads its prompt as the opening words.
+    repeated = hypothesis("suno brilas hodiaŭ", start=1.5)
+    assert agreement.insert(repeated) == []
+    assert agreement.tentative_text == "hodiaŭ"
+
+
+def test_commit_all_flushes_the_tentative_words() -> None:
+    agreement = LocalAgreement()
+    agreement.insert(hypothesis("ĝis revido"))
+    assert texts(agreement.commit_all()) == ["ĝis", "revido"]
+    assert agreement.tentative_text == ""
+    assert agreement.commit_all() == []
+
+
+def test_prompt_keeps_only_the_most_recent_words() -> None:
+    agreement = LocalAgreement(prompt_words=5)
+    words = " ".join(f"w{index}" for index in range(12))
+    agreement.insert(hypothesis(words))
+    agreement.commit_all()
+    assert agreement.prompt == "w7 w8 w9 w10 w11"
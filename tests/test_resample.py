@@ -0,0 +1,89 @@
+"""PolyphaseResampler: chunked output, rates and frequency response."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from transcriber.resample import PolyphaseResampler
+
+RATE_PAIRS = [(48_000, 16_000), (44_100, 16_000), (16_000, 48_000), (22_050, 16_000)]
+
+
+def noise(count: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.normal(0, 6000, count).clip(-32768, 32767).astype(np.int16)
+
+
+def tone(rate: int, freq: float, seconds: float, amplitude: float = 10_000.0) -> np.ndarray:
+    t = np.arange(int(rate * seconds)) / rate
+    return (amplitude * np.sin(2 * np.pi * freq * t)).astype(np.int16)
+
+
+def rms(samples: np.ndarray) -> float:
+    return float(np.sqrt(np.mean(samples.astype(np.float64) ** 2)))
+
+
+@pytest.mark.parametrize("in_rate,out_rate", RATE_PAIRS)
+def test_chunked_output_matches_one_shot_exactly(in_rate: int, out_rate: int) -> None:
+    signal = noise(in_rate)  # one second
+    expected = PolyphaseResampler(in_rate, out_rate).process(signal)
+
+    resampler = PolyphaseResampler(in_rate, out_rate)
+    rng = np.random.default_rng(1)
+    parts = []
+    position = 0
+    while position < signal.size:
+        size = int(rng.integers(1, in_rate // 10))
+        parts.append(resampler.process(signal[position : position + size]))
+        position += size
+    np.testing.assert_array_equal(np.concatenate(parts), expected)
+
+
+@pytest.mark.parametrize("in_rate,out_rate", RATE_PAIRS)
+def test_output_length_follows_the_rate_ratio(in_rate: int, out_rate: int) -> None:
+    resampler = PolyphaseResampler(in_rate, out_rate)
+    total = sum(resampler.process(noise(in_rate // 10, seed)).size for seed in range(10))
+    assert abs(total - out_rate) <= 1
+
+
+def test_equal_rates_pass_samples_through_untouched() -> None:
+    resampler = PolyphaseResampler(16_000, 16_000)
+    signal = noise(1000)
+    assert resampler.is_passthrough
+    assert resampler.process(signal) is signal
+
+
+def test_empty_chunk_keeps_state() -> None:
+    resampler = PolyphaseResampler(48_000, 16_000)
+    signal = noise(4800)
+    expected = PolyphaseResampler(48_000, 16_000).process(signal)
+    first = resampler.process(signal[:2400])
+    assert resampler.process(signal[:0]).size == 0
+    np.testing.assert_array_equal(
+        np.concatenate((first, resampler.process(signal[2400:]))), expected
+    )
+
+
+def test_reset_starts_a_fresh_stream() -> None:
+    resampler = PolyphaseResampler(48_000, 16_000)
+    signal = noise(4800)
+    first = resampler.process(signal)
+    resampler.process(noise(4800, seed=5))
+    resampler.reset()
+    np.testing.assert_array_equal(resampler.process(signal), first)
+
+
+def test_passband_tone_keeps_its_level() -> None:
+    resampler = PolyphaseResampler(48_000, 16_000)
+    out = resampler.process(tone(48_000, 1000.0, 1.0))
+    settled = out[int(resampler.delay_seconds * 16_000) + 100 :]
+    assert rms(settled) == pytest.approx(10_000 / np.sqrt(2), rel=0.02)
+
+
+def test_tone_above_the_new_nyquist_is_suppressed() -> None:
+    resampler = PolyphaseResampler(48_000, 16_000)
+    # 11 kHz would alias to 5 kHz at 16 kHz without the anti-aliasing filter.
+    out = resampler.process(tone(48_000, 11_000.0, 1.0))
+    settled = out[int(resampler.delay_seconds * 16_000) + 100 :]
+    assert rms(settled) < 10_000 / np.sqrt(2) * 10 ** (-40 / 20)
@@ -0,0 +1,166 @@
+"""Capture ring buffer and Whisper float window: wrap-around, overflow and eviction."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from transcriber.ringbuffer import AudioRingBuffer, FloatAudioWindow
+
+
+def ramp(start: int, count: int) -> np.ndarray:
+    return np.arange(start, start + count, dtype=np.int16)
+
+
+def samples(view: memoryview) -> np.ndarray:
+    return np.frombuffer(view, dtype=np.int16)
+
+
+def test_rejects_non_positive_capacity() -> None:
+    with pytest.raises(ValueError):
+        AudioRingBuffer(0)
+
+
+def test_reads_back_in_order_across_the_wrap_point() -> None:
+    ring = AudioRingBuffer(10)
+    written = []
+    read = []
+    position = 0
+    # Odd write/read sizes walk the positions through every wrap offset.
+    for size in (3, 7, 4, 6, 5, 9, 2, 8) * 4:
+        accepted = ring.write(ramp(position, size))
+        written.extend(range(position, position + accepted))
+        position += size
+        chunk = ring.read(ring.available)
+        if chunk is not None:
+            read.extend(np.frombuffer(chunk, dtype=np.int16).tolist())
+    assert read == written
+    assert ring.total_written == len(written)
+
+
+def test_peek_is_contiguous_across_the_wrap_and_does_not_consume() -> None:
+    ring = AudioRingBuffer(8)
+    ring.write(ramp(0, 6))
+    ring.consume(5)
+    ring.write(ramp(6, 6))  # occupies slots 6, 7 then 0..3
+    view = ring.peek(7)
+    assert view is not None and view.readonly
+    assert samples(view).tolist() == list(range(5, 12))
+    assert ring.available == 7
+    ring.consume(7)
+    assert ring.available == 0
+
+
+def test_peek_needs_enough_buffered_samples() -> None:
+    ring = AudioRingBuffer(8)
+    ring.write(ramp(0, 3))
+    assert ring.peek(4) is None
+    assert ring.peek(0) is None
+    assert ring.read(4) is None
+    assert ring.available == 3
+
+
+def test_overflow_drops_the_newest_samples_and_counts_them() -> None:
+    ring = AudioRingBuffer(8)
+    assert ring.write(ramp(0, 5)) == 5
+    assert ring.write(ramp(5, 6)) == 3
+    assert ring.dropped_samples == 3
+    assert ring.write(ramp(11, 2)) == 0
+    assert ring.dropped_samples == 5
+    assert samples(ring.peek(8)).tolist() == list(range(8))
+    assert ring.free == 0
+
+
+def test_clear_and_reset() -> None:
+    ring = AudioRingBuffer(4)
+    ring.write(ramp(0, 6))
+    ring.clear()
+    assert ring.available == 0 and ring.total_written == 4
+    ring.reset()
+    assert ring.total_written == 0 and ring.dropped_samples == 0
+
+
+def test_crossfade_blends_the_unread_tail_into_the_new_stream() -> None:
+    ring = AudioRingBuffer(16)
+    ring.write(np.full(6, 1000, dtype=np.int16))
+    consumed = ring.write_crossfade(np.full(8, -1000, dtype=np.int16), overlap=4)
+    assert consumed == 8
+    # 6 old samples (last 4 blended) + the 4 new samples that did not overlap.
+    assert ring.available == 10
+    out = samples(ring.peek(10))
+    assert out[:2].tolist() == [1000, 1000]
+    blended = out[2:6]
+    assert blended[0] == 1000 and blended[-1] == -1000
+    assert np.all(np.diff(blended.astype(np.int32)) < 0)
+    assert out[6:].tolist() == [-1000] * 4
+
+
+def test_crossfade_overlap_is_limited_to_unread_audio() -> None:
+    ring = AudioRingBuffer(16)
+    ring.write(ramp(0, 2))
+    assert ring.write_crossfade(ramp(100, 5), overlap=4) == 5
+    assert ring.available == 5  # 2 blended + 3 appended
+    ring.clear()
+    # Nothing unread: a plain write.
+    assert ring.write_crossfade(ramp(200, 3), overlap=4) == 3
+    assert samples(ring.peek(3)).tolist() == [200, 201, 202]
+
+
+def expected_float(values: np.ndarray) -> np.ndarray:
+    return values.astype(np.float32) / np.float32(32768.0)
+
+
+def test_window_scales_int16_to_float32() -> None:
+    window = FloatAudioWindow(8)
+    pcm = np.array([-32768, -1, 0, 1, 16384, 32767], dtype=np.int16)
+    assert window.append(pcm) == 0
+    out = window.view(0, 6)
+    assert out.dtype == np.float32
+    np.testing.assert_array_equal(out, expected_float(pcm))
+
+
+def test_window_views_are_contiguous_across_the_wrap_without_copying() -> None:
+    window = FloatAudioWindow(10)
+    stream = ramp(0, 37)
+    position = 0
+    for size in (4, 7, 3, 9, 6, 8):
+        window.append(stream[position : position + size])
+        position += size
+        start, end = window.start, window.end
+        out = window.view(start, end)
+        np.testing.assert_array_equal(out, expected_float(stream[start:end]))
+        assert out.base is not None  # a view into the window, not a copy
+        assert out.flags.c_contiguous
+
+
+def test_window_evicts_the_oldest_samples_and_reports_them() -> None:
+    window = FloatAudioWindow(10)
+    assert window.append(ramp(0, 6)) == 0
+    assert window.append(ramp(6, 7)) == 3
+    assert (window.start, window.end, len(window)) == (3, 13, 10)
+    # Discarded audio is not evicted again.
+    window.discard_until(8)
+    assert window.append(ramp(13, 4)) == 0
+    assert window.start == 8
+
+
+def test_window_append_larger_than_capacity_keeps_the_newest() -> None:
+    window = FloatAudioWindow(5)
+    window.append(ramp(0, 2))
+    window.append(ramp(2, 12))
+    assert (window.start, window.end) == (9, 14)
+    np.testing.assert_array_equal(window.view(0, 100), expected_float(ramp(9, 5)))
+
+
+def test_window_view_is_clamped_to_retained_samples() -> None:
+    window = FloatAudioWindow(8)
+    window.append(ramp(0, 6))
+    window.discard_until(2)
+    np.testing.assert_array_equal(window.view(0, 4), expected_float(ramp(2, 2)))
+    assert window.view(5, 3).size == 0
+    assert window.view(6, 9).size == 0
+    window.discard_until(100)  # never past the newest sample
+    assert window.start == window.end == 6
+    window.append(ramp(6, 2))
+    window.clear()
+    assert len(window) == 0 and window.end == 8
@@ -0,0 +1,157 @@
+"""AudioSendQueue: overflow policies, drop reporting and coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, List, Tuple
+
+import pytest
+
+# transcriber.asr imports every backend, so it needs their dependencies.
+pytest.importorskip("vosk")
+pytest.importorskip("faster_whisper")
+
+from transcriber.asr.send_queue import AudioSendQueue, OverflowPolicy  # noqa: E402
+
+BYTES_PER_SECOND = 100  # one 10-byte chunk per 0.1 s keeps the arithmetic readable
+
+
+class Uplink:
+    """Records sent frames; holds every send until ``gate`` is set."""
+
+    def __init__(self) -> None:
+        self.gate = asyncio.Event()
+        self.frames: List[bytes] = []
+
+    async def send(self, frame: bytes) -> None:
+        await self.gate.wait()
+        self.frames.append(frame)
+
+
+def chunk(index: int) -> bytes:
+    return bytes([index]) * 10
+
+
+def make_queue(uplink: Uplink, **kwargs: Any) -> Tuple[AudioSendQueue, List[Tuple[Any, int]]]:
+    drops: List[Tuple[Any, int]] = []
+    kwargs.setdefault("max_seconds", 0.3)
+    kwargs.setdefault("coalesce_max_seconds", 0.0)
+    queue = AudioSendQueue(
+        uplink.send,
+        bytes_per_second=BYTES_PER_SECOND,
+        on_drop=lambda tag, size: drops.append((tag, size)),
+        **kwargs,
+    )
+    return queue, drops
+
+
+def test_block_is_the_default_and_never_loses_audio() -> None:
+    async def scenario() -> None:
+        uplink = Uplink()
+        queue, drops = make_queue(uplink)
+        assert queue.overflow is OverflowPolicy.BLOCK
+        for index in range(3):
+            await queue.put(chunk(index), index)
+        producer = asyncio.create_task(queue.put(chunk(3), 3))
+        await asyncio.sleep(0.01)
+        assert not producer.done()  # full: the producer waits for the sender
+        queue.start()
+        uplink.gate.set()
+        await producer
+        assert await queue.join(1.0)
+        await queue.stop()
+        assert uplink.frames == [chunk(index) for index in range(4)]
+        assert drops == [] and queue.dropped_chunks == 0
+
+    asyncio.run(scenario())
+
+
+def test_drop_oldest_reports_each_discarded_chunk_with_its_tag() -> None:
+    async def scenario() -> None:
+        uplink = Uplink()
+        queue, drops = make_queue(uplink, overflow=OverflowPolicy.DROP_OLDEST)
+        for index in range(6):
+            await queue.put(chunk(index), index * 1000)
+        assert drops == [(0, 10), (1000, 10), (2000, 10)]
+        assert queue.dropped_bytes == 30
+        queue.start()
+        uplink.gate.set()
+        assert await queue.join(1.0)
+        await queue.stop()
+        assert uplink.frames == [chunk(3), chunk(4), chunk(5)]
+
+    asyncio.run(scenario())
+
+
+def test_drop_newest_discards_the_incoming_chunk() -> None:
+    async def scenario() -> None:
+        uplink = Uplink()
+        queue, drops = make_queue(uplink, overflow=OverflowPolicy.DROP_NEWEST)
+        for index in range(5):
+            await queue.put(chunk(index), index)
+        assert drops == [(3, 10), (4, 10)]
+        queue.start()
+        uplink.gate.set()
+        assert await queue.join(1.0)
+        await queue.stop()
+        assert uplink.frames == [chunk(0), chunk(1), chunk(2)]
+
+    asyncio.run(scenario())
+
+
+def test_backlog_is_coalesced_into_larger_frames() -> None:
+    async def scenario() -> None:
+        uplink = Uplink()
+        queue, _ = make_queue(uplink, max_seconds=1.0, coalesce_max_seconds=0.25)
+        for index in range(5):
+            await queue.put(chunk(index), index)
+        queue.start()
+        uplink.gate.set()
+        assert await queue.join(1.0)
+        await queue.stop()
+        assert uplink.frames == [
+            chunk(0) + chunk(1),
+            chunk(2) + chunk(3),
+            chunk(4),
+        ]
+        assert queue.coalesced_chunks == 2
+        assert queue.bytes_sent == 50
+
+    asyncio.run(scenario())
+
+
+def test_send_errors_are_reported_and_the_sender_keeps_going() -> None:
+    async def scenario() -> None:
+        errors: List[Exception] = []
+        sent: List[bytes] = []
+
+        async def flaky(frame: bytes) -> None:
+            if frame == chunk(0):
+                raise ConnectionError("socket closed")
+            sent.append(frame)
+
+        queue = AudioSendQueue(flaky, bytes_per_second=BYTES_PER_SECOND, on_error=errors.append)
+        queue.start()
+        await queue.put(chunk(0))
+        await asyncio.sleep(0)
+        await queue.put(chunk(1))
+        assert await queue.join(1.0)
+        await queue.stop()
+        assert [str(error) for error in errors] == ["socket closed"]
+        assert sent == [chunk(1)]
+
+    asyncio.run(scenario())
+
+
+def test_clear_discards_unsent_audio_without_counting_drops() -> None:
+    async def scenario() -> None:
+        uplink = Uplink()
+        queue, drops = make_queue(uplink)
+        for index in range(3):
+            await queue.put(chunk(index), index)
+        assert queue.clear() == 30
+        assert queue.queued_seconds == 0
+        assert drops == [] and queue.dropped_chunks == 0
+        assert await queue.join(0.1)
+
+    asyncio.run(scenario())
@@ -0,0 +1,91 @@
+"""Speechmatics session-clock to stream-clock mapping across uplink drops."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("vosk")
+pytest.importorskip("faster_whisper")
+
+from transcriber.asr.speechmatics_backend import SpeechmaticsRealtimeBackend  # noqa: E402
+from transcriber.config import SendOverflowPolicy, SpeechmaticsConfig  # noqa: E402
+
+RATE = 16_000
+CHUNK = b"\0\0" * (RATE // 10)  # 100 ms
+
+
+def pcm_bytes(seconds: float) -> int:
+    return int(seconds * RATE) * 2
+
+
+def backend() -> SpeechmaticsRealtimeBackend:
+    config = SpeechmaticsConfig(
+        api_key="test-key-0123456789",
+        sample_rate=RATE,
+        send_queue_seconds=0.5,
+        send_overflow_policy=SendOverflowPolicy.DROP_OLDEST,
+    )
+    return SpeechmaticsRealtimeBackend(config)
+
+
+def test_session_times_skip_audio_the_uplink_dropped() -> None:
+    async def scenario() -> SpeechmaticsRealtimeBackend:
+        client = backend()
+        # No sender task running: the queue fills and sheds its oldest chunks.
+        for _ in range(8):
+            await client.send_audio_chunk(CHUNK)
+        return client
+
+    client = asyncio.run(scenario())
+    # 0.8 s sent, 0.5 s fits: the server's first sample is stream time 0.3 s.
+    assert client._gap_at == [0]
+    assert client._gap_total == [int(0.3 * RATE)]
+    assert client._stream_time(0.0) == pytest.approx(0.3)
+    assert client._stream_time(0.25) == pytest.approx(0.55)
+    # An end time on the gap stays before it.
+    assert client._stream_time(0.0, end=True) == pytest.approx(0.0)
+
+
+def test_gaps_later_in_the_session_only_shift_later_times() -> None:
+    client = backend()
+    client._session_base_sample = 10 * RATE
+    client._on_send_drop(11 * RATE, pcm_bytes(0.5))  # stream 11.0-11.5 s lost
+    client._on_send_drop(12 * RATE, pcm_bytes(0.25))  # stream 12.0-12.25 s lost
+    assert client._stream_time(0.5) == pytest.approx(10.5)
+    assert client._stream_time(1.0, end=True) == pytest.approx(11.0)
+    assert client._stream_time(1.0) == pytest.approx(11.5)
+    # The second gap sits at server time 1.5 s (12.0 s minus the first 0.5 s gap).
+    assert client._stream_time(1.4) == pytest.approx(11.9)
+    assert client._stream_time(1.6) == pytest.approx(12.35)
+    # Drops queued for an earlier session are ignored.
+    client._on_send_drop(RATE, pcm_bytes(1.0))
+    assert len(client._gap_at) == 2
+
+
+def test_gated_silence_keeps_session_times_on_the_input_clock() -> None:
+    client = backend()
+    client._stream_samples = RATE  # 1.0 s sent
+    client.skip_audio(2 * RATE)  # the gate held back 2.0 s of silence
+    assert client._stream_samples == 3 * RATE
+    assert client._stream_time(0.5) == pytest.approx(0.5)
+    assert client._stream_time(1.0, end=True) == pytest.approx(1.0)
+    assert client._stream_time(1.2) == pytest.approx(3.2)
+
+
+def test_a_drop_queued_before_a_gate_skip_is_placed_in_stream_order() -> None:
+    client = backend()
+    client._stream_samples = RATE
+    client.skip_audio(2 * RATE)
+    # The queue then sheds a chunk it still held from before the skip.
+    client._on_send_drop(RATE // 2, pcm_bytes(0.25))  # stream 0.5-0.75 s lost
+    assert client._gap_at == [RATE // 2, int(0.75 * RATE)]
+    assert client._stream_time(0.6) == pytest.approx(0.85)
+    assert client._stream_time(0.75, end=True) == pytest.approx(1.0)
+    assert client._stream_time(0.75) == pytest.approx(3.0)
+    # Losing the chunk between them joins everything into one gap.
+    client._on_send_drop(int(0.75 * RATE), pcm_bytes(0.25))
+    assert client._gap_at == [RATE // 2]
+    assert client._gap_total == [int(2.5 * RATE)]
+    assert client._stream_time(0.6) == pytest.approx(3.1)
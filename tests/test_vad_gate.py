@@ -0,0 +1,69 @@
+"""VoiceActivityGate: suppression, preroll, keepalive frames and skip reporting."""
+
+from __future__ import annotations
+
+from typing import List
+
+import numpy as np
+
+from transcriber.vad import VoiceActivityDetector, VoiceActivityGate
+
+RATE = 1000  # one sample per millisecond
+CHUNK = 500
+
+
+class NonZeroDetector(VoiceActivityDetector):
+    """10 ms frames; a frame is speech when any of its samples is non-zero."""
+
+    frame_samples = 10
+
+    def speech_frames(self, samples: np.ndarray) -> np.ndarray:
+        count = samples.size // self.frame_samples
+        frames = samples[: count * self.frame_samples].reshape(count, self.frame_samples)
+        return np.any(frames != 0, axis=1)
+
+
+def chunk(speech: bool) -> bytes:
+    return np.full(CHUNK, 1000 if speech else 0, dtype=np.int16).tobytes()
+
+
+def run(gate: VoiceActivityGate, skips: List[int]) -> int:
+    """Speech, three silent chunks, speech; return the samples forwarded."""
+
+    sent = 0
+    for speech in (True, False, False, False, True):
+        for block in gate.process(chunk(speech)):
+            sent += len(block) // 2
+    assert sent + sum(skips) == 5 * CHUNK  # every input sample is accounted for
+    return sent
+
+
+def test_suppressed_audio_is_reported_before_speech_resumes() -> None:
+    skips: List[int] = []
+    gate = VoiceActivityGate(
+        NonZeroDetector(), RATE, hangover_seconds=0.0, preroll_seconds=0.05, on_skip=skips.append
+    )
+    assert run(gate, skips) == 2 * CHUNK + 50
+    assert skips == [3 * CHUNK - 50]  # the preroll is sent, the rest skipped
+
+
+def test_keepalive_frames_count_as_sent_audio() -> None:
+    skips: List[int] = []
+    gate = VoiceActivityGate(
+        NonZeroDetector(),
+        RATE,
+        hangover_seconds=0.0,
+        preroll_seconds=0.05,
+        keepalive_seconds=0.02,
+        on_skip=skips.append,
+    )
+    assert run(gate, skips) == 2 * CHUNK + 3 * 20 + 50
+    assert skips == [3 * (CHUNK - 20) - 50]
+    assert gate.stats.keepalive_frames == 3
+
+
+def test_hangover_forwards_silence_without_a_skip() -> None:
+    skips: List[int] = []
+    gate = VoiceActivityGate(NonZeroDetector(), RATE, hangover_seconds=2.0, on_skip=skips.append)
+    assert run(gate, skips) == 5 * CHUNK
+    assert skips == []
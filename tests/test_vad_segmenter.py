@@ -0,0 +1,119 @@
+"""UtteranceSegmenter ranges, driven by a scripted detector."""
+
+from __future__ import annotations
+
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from transcriber.vad import UtteranceSegmenter, VoiceActivityDetector
+
+RATE = 1000  # one sample per millisecond keeps the expected ranges readable
+
+
+class NonZeroDetector(VoiceActivityDetector):
+    """10 ms frames; a frame is speech when any of its samples is non-zero."""
+
+    frame_samples = 10
+
+    def speech_frames(self, samples: np.ndarray) -> np.ndarray:
+        count = samples.size // self.frame_samples
+        frames = samples[: count * self.frame_samples].reshape(count, self.frame_samples)
+        return np.any(frames != 0, axis=1)
+
+
+def segmenter() -> UtteranceSegmenter:
+    return UtteranceSegmenter(
+        NonZeroDetector(),
+        RATE,
+        min_seconds=0.2,
+        max_seconds=1.0,
+        pause_seconds=0.1,
+        preroll_seconds=0.05,
+    )
+
+
+def script(*parts: Tuple[int, bool]) -> np.ndarray:
+    """Concatenate ``(milliseconds, is_speech)`` stretches."""
+
+    return np.concatenate(
+        [np.full(ms, 1000 if speech else 0, dtype=np.int16) for ms, speech in parts]
+    )
+
+
+def feed_all(
+    seg: UtteranceSegmenter, audio: np.ndarray, sizes: Sequence[int]
+) -> List[Tuple[int, int]]:
+    ranges: List[Tuple[int, int]] = []
+    position = 0
+    for size in sizes:
+        ranges += seg.feed(audio[position : position + size])
+        position += size
+    ranges += seg.feed(audio[position:])
+    return ranges
+
+
+def test_silence_never_produces_a_range() -> None:
+    seg = segmenter()
+    assert seg.feed(script((3000, False))) == []
+    assert seg.finish() is None
+    assert seg.utterances == 0 and seg.emitted_samples == 0
+    assert seg.retain_from == 3000 - 200
+
+
+def test_utterance_closes_after_the_pause_with_preroll() -> None:
+    seg = segmenter()
+    ranges = seg.feed(script((500, False), (300, True), (500, False)))
+    # Opens 50 ms before the speech; ends half a pause after it.
+    assert ranges == [(450, 850)]
+    assert seg.last_speech_end == 800
+    assert not seg.in_utterance
+
+
+def test_short_utterance_is_widened_back_to_the_minimum() -> None:
+    seg = segmenter()
+    assert seg.feed(script((500, False), (50, True), (300, False))) == [(400, 600)]
+
+
+def test_long_speech_is_cut_hard_at_the_maximum() -> None:
+    seg = segmenter()
+    ranges = seg.feed(script((1500, True), (300, False)))
+    assert ranges == [(0, 1000), (1000, 1550)]
+
+
+def test_long_speech_is_split_at_its_latest_pause() -> None:
+    seg = segmenter()
+    ranges = seg.feed(script((400, True), (50, False), (750, True), (300, False)))
+    assert ranges == [(0, 450), (450, 1250)]
+
+
+def test_finish_closes_the_open_utterance() -> None:
+    seg = segmenter()
+    assert seg.feed(script((200, False), (400, True))) == []
+    assert seg.in_utterance
+    assert seg.finish() == (150, 600)
+    assert seg.finish() is None
+
+
+def test_chunking_does_not_change_the_ranges() -> None:
+    audio = script(
+        (300, False), (700, True), (60, False), (900, True), (400, False),
+        (30, True), (500, False), (1400, True), (200, False),
+    )
+    expected = segmenter().feed(audio)
+    rng = np.random.default_rng(0)
+    sizes = rng.integers(1, 97, size=200).tolist()
+    ranges = feed_all(segmenter(), audio, sizes)
+    assert ranges == expected
+    # Ordered, non-overlapping, and within the length limits.
+    for (start, end), (next_start, _) in zip(ranges, ranges[1:]):
+        assert end <= next_start
+    assert all(200 <= end - start <= 1000 for start, end in ranges)
+
+
+def test_retain_from_keeps_what_an_open_utterance_may_reach_back_to() -> None:
+    seg = segmenter()
+    seg.feed(script((1000, False), (100, True)))
+    assert seg.in_utterance
+    # The open utterance starts at 950 and may be widened back by the minimum.
+    assert seg.retain_from == 950 - 200
@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 import abc
+from array import array
 from dataclasses import dataclass
 from typing import AsyncGenerator, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptSegment:
-    """Represents one transcription update."""
+    """Represents one transcription update.
+
+    Word timings, when the backend provides them, are kept as parallel
+    ``array('d')`` columns rather than per-word dicts. ``raw`` holds the
+    decoded backend message only when the backend is asked to retain it.
+    """
 
     text: str
     is_final: bool
@@ -17,11 +23,17 @@ class TranscriptSegment:
     start_time: Optional[float] = None
     end_time: Optional[float] = None
     raw: Optional[dict] = None
+    word_starts: Optional[array] = None
+    word_ends: Optional[array] = None
 
 
 class StreamingTranscriptionBackend(abc.ABC):
     """Interface for realtime speech-to-text streaming backends."""
 
+    #: Duration of digital silence to send in place of each chunk suppressed by
+    #: the voice-activity gate. ``None`` means silent chunks are skipped.
+    silence_keepalive_seconds: Optional[float] = None
+
     @abc.abstractmethod
     async def __aenter__(self) -> "StreamingTranscriptionBackend":  # pragma: no cover - protocol
         ...
@@ -34,6 +46,27 @@ class StreamingTranscriptionBackend(abc.ABC):
     async def send_audio_chunk(self, chunk: bytes) -> None:
         """Stream raw PCM audio to the backend."""
 
+    def skip_audio(self, samples: int) -> None:
+        """Note ``samples`` of input that were held back before the next chunk.
+
+        Called by the voice-activity gate. Backends that report times on the
+        input clock advance it here; by default the gap is ignored.
+        """
+
     @abc.abstractmethod
     async def transcript_results(self) -> AsyncGenerator[TranscriptSegment, None]:
         """Yield successive transcript segments."""
+
+    def metrics_summary(self) -> Optional[str]:
+        """One-line health summary for periodic logs; ``None`` if the backend keeps none."""
+
+        return None
+
+    async def flush(self) -> None:
+        """Signal end of input.
+
+        Backends transcribe any buffered audio and then let
+        :meth:`transcript_results` finish once the remaining segments have
+        been yielded. The default implementation does nothing, leaving the
+        result stream open.
+        """
@@ -0,0 +1,202 @@
+"""Bounded, coalescing uplink queue between the audio pump and a backend socket."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+from ..capture_metrics import Histogram
+from ..config import SendOverflowPolicy as OverflowPolicy
+
+# Send-lag bucket upper bounds in milliseconds.
+SEND_LAG_BOUNDS_MS = (5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0, 5000.0)
+
+
+class AudioSendQueue:
+    """Decouple ``send_audio_chunk`` from the network with a background sender.
+
+    Chunks are queued with their arrival time and sent in order by one task.
+    When more than one chunk is waiting, consecutive chunks are merged into
+    frames of up to ``coalesce_max_seconds`` so a congested uplink catches up
+    with fewer, larger messages. The queue holds at most ``max_seconds`` of
+    audio; beyond that ``overflow`` either blocks the producer or discards
+    audio (oldest or newest), and every discard is counted and reported to
+    ``on_drop`` with the tag the chunk was queued with, so the owner can
+    keep its clock in step with what the server actually received. Send
+    failures are reported to ``on_error`` and the sender keeps running.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[bytes], Awaitable[None]],
+        bytes_per_second: int,
+        max_seconds: float = 10.0,
+        coalesce_max_seconds: float = 1.0,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        on_drop: Optional[Callable[[Any, int], None]] = None,
+    ) -> None:
+        self._send = send
+        self._on_error = on_error
+        self._on_drop = on_drop
+        self.bytes_per_second = bytes_per_second
+        self.max_bytes = max(1, int(max_seconds * bytes_per_second))
+        self.coalesce_max_bytes = int(coalesce_max_seconds * bytes_per_second)
+        self.overflow = OverflowPolicy(overflow)
+        self._items: Deque[Tuple[bytes, float, Any]] = deque()
+        self._queued_bytes = 0
+        self._not_empty = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._sending = False
+        self.lag_ms = Histogram(SEND_LAG_BOUNDS_MS)
+        self.reset_metrics()
+
+    def reset_metrics(self) -> None:
+        self.frames_sent = 0
+        self.bytes_sent = 0
+        self.coalesced_chunks = 0
+        self.dropped_chunks = 0
+        self.dropped_bytes = 0
+        self.high_water_bytes = 0
+        self.lag_ms.reset()
+
+    @property
+    def queued_seconds(self) -> float:
+        return self._queued_bytes / self.bytes_per_second
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="audio-send-queue")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self.clear()
+
+    async def put(self, chunk: bytes, tag: Any = None) -> None:
+        if not chunk:
+            return
+        while self._queued_bytes + len(chunk) > self.max_bytes and self._items:
+            if self.overflow is OverflowPolicy.BLOCK:
+                self._space.clear()
+                await self._space.wait()
+                continue
+            if self.overflow is OverflowPolicy.DROP_NEWEST:
+                self._count_drop(len(chunk), tag)
+                return
+            dropped, _, dropped_tag = self._items.popleft()
+            self._queued_bytes -= len(dropped)
+            self._count_drop(len(dropped), dropped_tag)
+        self._items.append((chunk, time.monotonic(), tag))
+        self._queued_bytes += len(chunk)
+        self.high_water_bytes = max(self.high_water_bytes, self._queued_bytes)
+        self._idle.clear()
+        self._not_empty.set()
+
+    def clear(self) -> int:
+        """Discard everything not yet sent; return the number of bytes dropped."""
+
+        dropped = self._queued_bytes
+        self._items.clear()
+        self._queued_bytes = 0
+        self._space.set()
+        if not self._sending:
+            self._idle.set()
+        return dropped
+
+    async def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued chunk has been handed to the socket."""
+
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def _count_drop(self, size: int, tag: Any) -> None:
+        self.dropped_chunks += 1
+        self.dropped_bytes += size
+        if self._on_drop is not None:
+            self._on_drop(tag, size)
+        if self.dropped_chunks == 1 or self.dropped_chunks % 50 == 0:
+            logging.warning(
+                "Uplink congested: dropped %d audio chunks (%.1f s) so far (policy %s).",
+                self.dropped_chunks,
+                self.dropped_bytes / self.bytes_per_second,
+                self.overflow.value,
+            )
+
+    def _next_frame(self) -> Tuple[bytes, float]:
+        chunk, enqueued, _ = self._items.popleft()
+        if not self._items or len(chunk) >= self.coalesce_max_bytes:
+            self._queued_bytes -= len(chunk)
+            return chunk, enqueued
+        parts = [chunk]
+        size = len(chunk)
+        while self._items and size + len(self._items[0][0]) <= self.coalesce_max_bytes:
+            part, _, _ = self._items.popleft()
+            parts.append(part)
+            size += len(part)
+        self._queued_bytes -= size
+        self.coalesced_chunks += len(parts) - 1
+        return b"".join(parts), enqueued
+
+    async def _run(self) -> None:
+        while True:
+            if not self._items:
+                self._idle.set()
+                self._not_empty.clear()
+                await self._not_empty.wait()
+                continue
+            frame, enqueued = self._next_frame()
+            self._space.set()
+            self._sending = True
+            try:
+                await self._send(frame)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # pylint: disable=broad-except
+                if self._on_error is not None:
+                    self._on_error(exc)
+                else:
+                    logging.error("Audio send failed: %s", exc)
+                continue
+            finally:
+                self._sending = False
+            self.frames_sent += 1
+            self.bytes_sent += len(frame)
+            self.lag_ms.record((time.monotonic() - enqueued) * 1000.0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "queued_seconds": self.queued_seconds,
+            "high_water_seconds": self.high_water_bytes / self.bytes_per_second,
+            "frames_sent": self.frames_sent,
+            "bytes_sent": self.bytes_sent,
+            "coalesced_chunks": self.coalesced_chunks,
+            "dropped_chunks": self.dropped_chunks,
+            "dropped_seconds": self.dropped_bytes / self.bytes_per_second,
+            "send_lag_ms": self.lag_ms.as_dict(),
+        }
+
+    def describe(self) -> str:
+        lag = self.lag_ms
+        high_water = self.high_water_bytes / self.bytes_per_second
+        return (
+            f"{self.frames_sent} frames sent, lag mean {lag.mean:.0f} ms / "
+            f"p99 <={lag.quantile(0.99):g} ms / max {lag.max:.0f} ms; "
+            f"queued {self.queued_seconds:.1f}s (high {high_water:.1f}s); "
+            f"{self.coalesced_chunks} chunks coalesced, "
+            f"dropped {self.dropped_bytes / self.bytes_per_second:.1f}s"
+        )
@@ -0,0 +1,202 @@
+"""Cached Speechmatics temporary keys (JWTs) with background refresh."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import aiohttp
+
+AUTHORIZE_ENDPOINT = "https://mp.speechmatics.com/v1/api_keys"
+
+# Treat a token as expired slightly early to absorb clock skew and handshake time.
+_EXPIRY_SKEW_SECONDS = 10.0
+
+
+@dataclass(frozen=True)
+class CachedToken:
+    token: str
+    issued_at: float  # time.monotonic()
+    expires_at: float  # time.monotonic()
+
+    def valid(self, now: Optional[float] = None) -> bool:
+        return (now or time.monotonic()) < self.expires_at - _EXPIRY_SKEW_SECONDS
+
+
+class SpeechmaticsTokenProvider:
+    """Issue and cache realtime JWTs keyed by region and TTL.
+
+    One pooled :class:`aiohttp.ClientSession` is reused for every request, so
+    only the first issue pays for the TLS handshake. While at least one
+    backend holds a lease (:meth:`acquire`), a background task re-issues
+    each cached token once ``refresh_fraction`` of its lifetime remains.
+    Reconnects therefore find a valid token in the cache and go straight to
+    the WebSocket handshake.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        ttl_seconds: int,
+        endpoint: str = AUTHORIZE_ENDPOINT,
+        refresh_fraction: float = 0.2,
+        request_timeout: float = 10.0,
+    ) -> None:
+        self._api_key = api_key.strip()
+        self.ttl_seconds = int(ttl_seconds)
+        self.endpoint = endpoint
+        self._refresh_fraction = min(max(refresh_fraction, 0.05), 0.9)
+        self._timeout = aiohttp.ClientTimeout(total=request_timeout)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._cache: Dict[Tuple[str, int], CachedToken] = {}
+        self._locks: Dict[Tuple[str, int], asyncio.Lock] = {}
+        self._refresh_tasks: Dict[Tuple[str, int], asyncio.Task] = {}
+        self._leases = 0
+
+    def _key(self, region: str) -> Tuple[str, int]:
+        return (region, self.ttl_seconds)
+
+    def cached(self, region: str) -> Optional[CachedToken]:
+        token = self._cache.get(self._key(region))
+        return token if token is not None and token.valid() else None
+
+    def invalidate(self, region: str) -> None:
+        """Drop a token the server rejected so the next call issues a fresh one."""
+
+        self._cache.pop(self._key(region), None)
+
+    async def get_token(self, region: str) -> Optional[str]:
+        """Return a valid JWT for ``region``, issuing one only on a cache miss."""
+
+        cached = self.cached(region)
+        if cached is not None:
+            return cached.token
+        key = self._key(region)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            cached = self.cached(region)  # another caller may have issued it meanwhile
+            if cached is not None:
+                return cached.token
+            issued = await self._issue(region)
+            if issued is None:
+                return None
+            self._cache[key] = issued
+            if self._leases:
+                self._ensure_refresh(region)
+            return issued.token
+
+    def acquire(self) -> None:
+        """Register a user; background refresh runs while any lease is held."""
+
+        self._leases += 1
+        for region, _ttl in list(self._cache):
+            self._ensure_refresh(region)
+
+    async def release(self) -> None:
+        """Drop a lease; the last one stops refresh and closes the HTTP pool."""
+
+        self._leases = max(0, self._leases - 1)
+        if self._leases == 0:
+            await self.close()
+
+    async def close(self) -> None:
+        tasks = list(self._refresh_tasks.values())
+        self._refresh_tasks.clear()
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _ensure_refresh(self, region: str) -> None:
+        key = self._key(region)
+        task = self._refresh_tasks.get(key)
+        if task is None or task.done():
+            self._refresh_tasks[key] = asyncio.create_task(
+                self._refresh_loop(region), name=f"speechmatics-jwt-refresh-{region}"
+            )
+
+    async def _refresh_loop(self, region: str) -> None:
+        key = self._key(region)
+        retry_delay = 5.0
+        while True:
+            cached = self._cache.get(key)
+            if cached is not None:
+                lifetime = cached.expires_at - cached.issued_at
+                refresh_at = cached.expires_at - lifetime * self._refresh_fraction
+                await asyncio.sleep(max(0.0, refresh_at - time.monotonic()))
+            issued = await self._issue(region)
+            if issued is None:
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, 120.0)
+                continue
+            retry_delay = 5.0
+            self._cache[key] = issued
+            logging.debug("Refreshed Speechmatics JWT for region %s.", region)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=self._timeout,
+                connector=aiohttp.TCPConnector(limit=4, keepalive_timeout=300),
+            )
+        return self._session
+
+    async def _issue(self, region: str) -> Optional[CachedToken]:
+        # Management Platform temporary token endpoint (per official SDK semantics)
+        # POST https://mp.speechmatics.com/v1/api_keys?type=rt&sm-sdk=python-<ver>
+        # Headers: Authorization: Bearer <API_KEY>
+        # Body: {"ttl": <seconds>, "region": "eu"|"us"|"ca"|"ap"}
+        if not self._api_key:
+            return None
+        params = {"type": "rt", "sm-sdk": "python-custom"}
+        payload = {"ttl": self.ttl_seconds, "region": region}
+        headers = {"Authorization": f"Bearer {self._api_key}", "Content-Type": "application/json"}
+        requested_at = time.monotonic()
+        try:
+            session = self._get_session()
+            async with session.post(
+                self.endpoint, params=params, json=payload, headers=headers
+            ) as resp:
+                if resp.status not in (200, 201):
+                    text = await resp.text()
+                    logging.error("JWT authorize failed (%s): %s", resp.status, text)
+                    return None
+                data = await resp.json()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # pylint: disable=broad-except
+            logging.exception("JWT authorize error: %s", exc)
+            return None
+        token = data.get("key_value") or data.get("token") or data.get("jwt")
+        if not token:
+            logging.error("JWT authorize response missing token: %s", data)
+            return None
+        return CachedToken(
+            token=token,
+            issued_at=requested_at,
+            expires_at=requested_at + self.ttl_seconds,
+        )
+
+
+_providers: Dict[Tuple[str, int, str], SpeechmaticsTokenProvider] = {}
+
+
+def shared_token_provider(
+    api_key: str, ttl_seconds: int, endpoint: str = AUTHORIZE_ENDPOINT
+) -> SpeechmaticsTokenProvider:
+    """Process-wide provider per API key, so parallel sessions share tokens and the pool."""
+
+    key = (api_key.strip(), int(ttl_seconds), endpoint)
+    provider = _providers.get(key)
+    if provider is None:
+        provider = SpeechmaticsTokenProvider(api_key, ttl_seconds, endpoint=endpoint)
+        _providers[key] = provider
+    return provider
@@ -6,25 +6,73 @@ import asyncio
 import contextlib
 import json
 import logging
-from typing import AsyncGenerator, Dict, Optional
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from dataclasses import dataclass, field
+from typing import IO, AsyncGenerator, Deque, Dict, List, Optional, Set, Tuple
 from urllib.parse import urlparse, urlunparse
 
-import aiohttp
-
 import websockets
 from websockets import WebSocketClientProtocol
 
-from ..config import SpeechmaticsConfig
+from ..config import SpeechmaticsConfig, UplinkEncoding
+from ..dsp import mulaw_encode
 from .base import StreamingTranscriptionBackend, TranscriptSegment
+from .send_queue import AudioSendQueue
+from .speechmatics_auth import shared_token_provider
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - optional dependency
+    _json_loads = json.loads
 
 
 class SpeechmaticsRealtimeError(Exception):
     """Raised when communication with Speechmatics fails."""
 
 
+# Server error types that a fresh session cannot fix; everything else is resumed.
+_FATAL_ERROR_TYPES = frozenset(
+    {
+        "invalid_message",
+        "invalid_model",
+        "invalid_config",
+        "invalid_audio_type",
+        "not_authorised",
+        "insufficient_funds",
+        "not_allowed",
+        "quota_exceeded",
+        "protocol_error",
+    }
+)
+_SAMPLE_BYTES = 2  # pcm_s16le
+# AudioAdded acks arrive once per chunk and carry nothing the listener uses;
+# in the server's compact form they are recognised without decoding.
+_AUDIO_ADDED_PREFIX = '{"message":"AudioAdded"'
+
+
+@dataclass
+class _StandbySession:
+    """A started realtime session that has not received any audio yet."""
+
+    websocket: WebSocketClientProtocol
+    opened_at: float
+    ready: asyncio.Event = field(default_factory=asyncio.Event)
+    failed: bool = False
+    watcher: Optional[asyncio.Task] = None
+
+
 class SpeechmaticsRealtimeBackend(StreamingTranscriptionBackend):
     """Manage realtime transcription sessions with Speechmatics."""
 
+    # Keep a trickle of audio flowing during gated silence so the realtime
+    # session is not considered idle.
+    silence_keepalive_seconds = 0.02
+
     def __init__(self, config: SpeechmaticsConfig) -> None:
         self.config = config
         self._websocket: Optional[WebSocketClientProtocol] = None
@@ -33,6 +81,51 @@ class SpeechmaticsRealtimeBackend(StreamingTranscriptionBackend):
         self._connected = asyncio.Event()
         self._recognition_started = asyncio.Event()
         self._listener_error: Optional[SpeechmaticsRealtimeError] = None
+        self._end_of_transcript = asyncio.Event()
+        self._audio_seq_no = 0
+        self._input_finished = False
+        self._tokens = shared_token_provider(
+            config.api_key, config.jwt_ttl_seconds, endpoint=config.jwt_endpoint
+        )
+        self._token_lease = False
+        # Session resumption: recently sent audio on the stream-sample clock.
+        self._history: Deque[Tuple[int, bytes]] = deque()
+        self._history_samples = 0
+        self._stream_samples = 0
+        self._committed_sample = 0  # end of the last final transcript
+        self._session_base_sample = 0  # stream sample at which the current session began
+        # Audio the current session never received (uplink drops, gated
+        # silence): samples the server had before each gap, and the total
+        # skipped up to and including it.
+        self._gap_at: List[int] = []
+        self._gap_total: List[int] = []
+        self._resume_task: Optional[asyncio.Task[None]] = None
+        self.resume_count = 0
+        self.last_resume_seconds: Optional[float] = None
+        # Hot standby: a second pre-started session to fail over onto.
+        self._standby: Optional[_StandbySession] = None
+        self._standby_task: Optional[asyncio.Task[None]] = None
+        self._closing: Set[asyncio.Task] = set()
+        self.failover_count = 0
+        self.last_failover_gap: Optional[float] = None
+        # Uplink sender decoupling the audio pump from socket writes.
+        self._sender: Optional[AudioSendQueue] = None
+        if config.send_queue_seconds > 0:
+            self._sender = AudioSendQueue(
+                self._send_live,
+                bytes_per_second=config.sample_rate * _SAMPLE_BYTES,
+                max_seconds=config.send_queue_seconds,
+                coalesce_max_seconds=config.send_coalesce_seconds,
+                overflow=config.send_overflow_policy,
+                on_error=self._on_send_error,
+                on_drop=self._on_send_drop,
+            )
+        self._sender_error: Optional[SpeechmaticsRealtimeError] = None
+        self._message_log: Optional[IO[str]] = None
+        # Uplink accounting on the wire, after encoding.
+        self._mulaw = config.audio_encoding is UplinkEncoding.MULAW
+        self.wire_bytes = 0
+        self._wire_since: Optional[float] = None
 
     async def __aenter__(self) -> "SpeechmaticsRealtimeBackend":
         await self.connect()
@@ -40,14 +133,37 @@ class SpeechmaticsRealtimeBackend(StreamingTranscriptionBackend):
 
     async def __aexit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
         await self.close()
+        if self._token_lease:
+            self._token_lease = False
+            await self._tokens.release()
 
     async def connect(self) -> None:
         """Establish the websocket connection and send the start message."""
 
         self._connected.clear()
         self._recognition_started.clear()
+        self._end_of_transcript.clear()
         self._listener_error = None
+        self._sender_error = None
+        self.wire_bytes = 0
+        self._wire_since = None
+        self._audio_seq_no = 0
+        self._input_finished = False
+        self._history.clear()
+        self._history_samples = 0
+        self._stream_samples = 0
+        self._committed_sample = 0
+        self._session_base_sample = 0
+        self._gap_at.clear()
+        self._gap_total.clear()
         self._reset_transcript_queue()
+        if self.config.message_log_path and self._message_log is None:
+            self._message_log = open(  # noqa: SIM115 - closed in close()
+                self.config.message_log_path, "a", encoding="utf-8"
+            )
+        if not self._token_lease and not self.config.jwt_token:
+            self._tokens.acquire()
+            self._token_lease = True
         max_attempts = max(0, self.config.max_reconnect_attempts)
         backoff = max(self.config.reconnect_backoff_seconds, 0.1)
         attempt = 0
@@ -68,6 +184,11 @@ class SpeechmaticsRealtimeBackend(StreamingTranscriptionBackend):
                 ws_url, headers = await self._build_connection_params()
                 await self._open_connection(ws_url, headers)
                 logging.info("Connected to Speechmatics realtime endpoint.")
+                self._wire_since = time.monotonic()
+                if self._sender is not None:
+                    self._sender.reset_metrics()
+                    self._sender.start()
+                self._start_standby()
                 return
             except SpeechmaticsRealtimeError as exc:
                 last_exc = exc
@@ -80,44 +201,18 @@ class SpeechmaticsRealtimeBackend(StreamingTranscriptionBackend):
         ) from last_exc
 
     async def _authorize_jwt(self) -> Optional[str]:
-        """Exchange API key for a short-lived JWT via HTTPS.
+        """Return a short-lived JWT for the configured region.
 
-        Builds the authorize URL from the configured WebSocket endpoint by
-        switching scheme to https and appending the authorize path.
+        Tokens come from the shared provider's cache, so reconnects within
+        the TTL skip the HTTPS round trip entirely.
         """
 
-        api_key = (self.config.api_key or "").strip()
-        if not api_key:
+        if not (self.config.api_key or "").strip():
             return None
+        return await self._tokens.get_token(self._region())
 
-        # Management Platform temporary token endpoint (per official SDK semantics)
-        # POST https://mp.speechmatics.com/v1/api_keys?type=rt&sm-sdk=python-<ver>
-        # Headers: Authorization: Bearer <API_KEY>
-        # Body: {"ttl": <seconds>, "region": "eu"|"us"|"ca"|"ap"}
-
-        parsed_ws = urlparse(self.config.connection_url)
-        region = self._infer_region_from_host(parsed_ws.hostname)
-
-        endpoint = "https://mp.speechmatics.com/v1/api_keys"
-        params = {"type": "rt", "sm-sdk": "python-custom"}
-        payload = {"ttl": int(self.config.jwt_ttl_seconds), "region": region}
-        headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
-        timeout = aiohttp.ClientTimeout(total=10)
-        try:
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(endpoint, params=params, json=payload, headers=headers) as resp:
-                    if resp.status not in (200, 201):
-                        text = await resp.text()
-                        logging.error("JWT authorize failed (%s): %s", resp.status, text)
-                        return None
-                    data = await resp.json()
-                    token = data.get("key_value") or data.get("token") or data.get("jwt")
-                    if not token:
-                        logging.error("JWT authorize response missing token: %s", data)
-                    return token
-        except Exception as exc:  # pylint: disable=broad-except
-            logging.exception("JWT authorize error: %s", exc)
-            return None
+    def _region(self) -> str:
+        return self._infer_region_from_host(urlparse(self.config.connection_url).hostname)
 
     @staticmethod
     def _augment_ws_url_with_language(base_url: str, language: str) -> str:
@@ -161,8 +256,16 @@ class SpeechmaticsRealtimeBackend(StreamingTranscriptionBackend):
         return ws_url, headers
 
     async def _open_connection(self, ws_url: str, headers: Dict[str, str]) -> None:
+        self._websocket = await self._connect_websocket(ws_url, headers)
+        await self._send_start_message()
+        self._connected.set()
+        self._listen_task = asyncio.create_task(self._listen_loop(), name="speechmatics-listener")
+
+    async def _connect_websocket(
+        self, ws_url: str, headers: Dict[str, str]
+    ) -> WebSocketClientProtocol:
         try:
-            self._websocket = await websockets.connect(
+            return await websockets.connect(
                 ws_url,
                 additional_headers=headers,
                 max_size=4 * 1024 * 1024,
@@ -172,19 +275,69 @@ class SpeechmaticsRealtimeBackend(StreamingTranscriptionBackend):
                 max_queue=32,
             )
         except Exception as exc:  # pylint: disable=broad-except
+            if self._is_auth_rejection(exc) and not self.config.jwt_token:
+                # A cached token was revoked or expired early; issue a new one on retry.
+                self._tokens.invalidate(self._region())
             raise SpeechmaticsRealtimeError(f"Failed to connect to Speechmatics: {exc}") from exc
 
-        await self._send_start_message()
-        self._connected.set()
-        self._listen_task = asyncio.create_task(self._listen_loop(), name="speechmatics-listener")
+    @staticmethod
+    def _is_auth_rejection(exc: Exception) -> bool:
+        response = getattr(exc, "response", None)
+        status = getattr(response, "status_code", None) or getattr(exc, "status_code", None)
+        return status in (401, 403)
 
     async def close(self) -> None:
         """Close the websocket connection gracefully."""
 
-        if self._listen_task:
-            self._listen_task.cancel()
+        if self._resume_task is not None and self._resume_task is not asyncio.current_task():
+            self._resume_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
-                await self._listen_task
+                await self._resume_task
+            self._resume_task = None
+        if self._sender is not None:
+            await self._sender.stop()
+        await self._stop_standby()
+        await self._close_session()
+        if self.wire_bytes:
+            logging.info(
+                "Speechmatics uplink: %.1f MiB of %s audio at %.0f kbit/s.",
+                self.wire_bytes / (1 << 20),
+                self.config.audio_encoding.value,
+                self.uplink_bytes_per_second * 8 / 1000,
+            )
+        if self._message_log is not None:
+            self._message_log.close()
+            self._message_log = None
+        if self._closing:
+            await asyncio.wait(set(self._closing), timeout=5.0)
+
+    def _detach_session(self) -> None:
+        """Drop the current session immediately; its socket is closed in the background."""
+
+        task, self._listen_task = self._listen_task, None
+        websocket, self._websocket = self._websocket, None
+        self._connected.clear()
+        self._recognition_started.clear()
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        if websocket is not None:
+            self._close_in_background(websocket)
+
+    def _close_in_background(self, websocket: WebSocketClientProtocol) -> None:
+        async def close_quietly() -> None:
+            with contextlib.suppress(Exception):
+                await websocket.close()
+
+        closer = asyncio.create_task(close_quietly(), name="speechmatics-close")
+        self._closing.add(closer)
+        closer.add_done_callback(self._closing.discard)
+
+    async def _close_session(self) -> None:
+        if self._listen_task:
+            if self._listen_task is not asyncio.current_task():
+                self._listen_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError, SpeechmaticsRealtimeError):
+                    await self._listen_task
             self._listen_task = None
 
         if self._websocket:
@@ -195,11 +348,133 @@ class SpeechmaticsRealtimeBackend(StreamingTranscriptionBackend):
         self._connected.clear()
         self._recognition_started.clear()
 
+    @property
+    def _resume_enabled(self) -> bool:
+        return self.config.resume_buffer_seconds > 0 and not self._input_finished
+
+    @property
+    def _time_offset(self) -> float:
+        """Stream time at which the current session's clock starts."""
+
+        return self._session_base_sample / self.config.sample_rate
+
     async def send_audio_chunk(self, chunk: bytes) -> None:
-        """Send raw PCM audio bytes to the websocket."""
+        """Send raw PCM audio bytes to the websocket.
+
+        With resumption enabled the chunk is also kept in a bounded history.
+        If the session drops, chunks are buffered while a background task
+        reconnects and replays everything after the last final transcript.
+        """
 
         if self._listener_error is not None:
             raise self._listener_error
+        if self._sender_error is not None:
+            raise self._sender_error
+        position = self._stream_samples
+        self._stream_samples += len(chunk) // _SAMPLE_BYTES
+        if self._resume_enabled:
+            self._remember_audio(position, chunk)
+            if self._resume_task is not None:
+                return
+        if self._sender is not None:
+            await self._sender.put(chunk, position)
+            return
+        try:
+            await self._send_live(chunk)
+        except SpeechmaticsRealtimeError as exc:
+            if not self._resume_enabled:
+                raise
+            self._begin_resume(exc)
+
+    def _on_send_error(self, exc: Exception) -> None:
+        """Called by the uplink sender when a queued frame could not be sent."""
+
+        error = (
+            exc
+            if isinstance(exc, SpeechmaticsRealtimeError)
+            else SpeechmaticsRealtimeError(f"Failed to stream audio: {exc}")
+        )
+        if self._resume_enabled:
+            self._begin_resume(error)
+        elif self._sender_error is None:
+            self._sender_error = error
+
+    def skip_audio(self, samples: int) -> None:
+        """Advance the stream clock over input the voice-activity gate held back."""
+
+        position = self._stream_samples
+        self._stream_samples += samples
+        if self._resume_task is None:
+            # While resuming, the replay records holes in the history itself.
+            self._record_gap(position, samples)
+
+    def _on_send_drop(self, position: int, size: int) -> None:
+        """Record audio the uplink discarded; the server clock skips over it."""
+
+        if position < self._session_base_sample:
+            return  # queued for a session that has since been replaced
+        self._record_gap(position, size // _SAMPLE_BYTES)
+
+    def _record_gap(self, position: int, samples: int) -> None:
+        """Note that stream samples ``[position, position + samples)`` never reach the server."""
+
+        offset = position - self._session_base_sample
+        gap_at, gap_total = self._gap_at, self._gap_total
+        # Gaps usually arrive in stream order, but a queued chunk can be dropped
+        # after a later gate skip was recorded: find the gaps that end before it.
+        index = len(gap_at)
+        while index and gap_at[index - 1] + gap_total[index - 1] > offset:
+            index -= 1
+        before = gap_total[index - 1] if index else 0
+        at = offset - before
+        # Later gaps now come that much earlier on the server clock.
+        for later in range(index, len(gap_at)):
+            gap_at[later] -= samples
+            gap_total[later] += samples
+        if index and gap_at[index - 1] == at:
+            # Back-to-back gaps widen the same one.
+            gap_total[index - 1] += samples
+            index -= 1
+        else:
+            gap_at.insert(index, at)
+            gap_total.insert(index, before + samples)
+        if index + 1 < len(gap_at) and gap_at[index + 1] == gap_at[index]:
+            del gap_at[index]
+            del gap_total[index]
+
+    def _stream_time(self, session_time: float, end: bool = False) -> float:
+        """Map a time on the current session's clock onto the stream clock.
+
+        Every gap before ``session_time`` is added back; an end time
+        that falls exactly on a gap stays before it.
+        """
+
+        rate = self.config.sample_rate
+        find = bisect_left if end else bisect_right
+        index = find(self._gap_at, round(session_time * rate))
+        skipped = self._gap_total[index - 1] if index else 0
+        return session_time + (self._session_base_sample + skipped) / rate
+
+    @property
+    def uplink_bytes_per_second(self) -> float:
+        """Average audio bytes actually written to the socket since connect."""
+
+        if self._wire_since is None:
+            return 0.0
+        return self.wire_bytes / max(time.monotonic() - self._wire_since, 1e-3)
+
+    def metrics_summary(self) -> Optional[str]:
+        parts = [
+            f"sending {self.uplink_bytes_per_second * 8 / 1000:.0f} kbit/s "
+            f"{self.config.audio_encoding.value}"
+        ]
+        if self._sender is not None:
+            parts.append(f"uplink {self._sender.describe()}")
+        parts.append(f"{self.resume_count} resumes, {self.failover_count} failovers")
+        return "; ".join(parts)
+
+    async def _send_live(self, chunk: bytes) -> None:
+        websocket = self._websocket
         if self._websocket is None or not self._connected.is_set():
             raise SpeechmaticsRealtimeError("Connection is not established.")
         if not self._recognition_started.is_set():
@@ -207,10 +482,286 @@ class SpeechmaticsRealtimeBackend(StreamingTranscriptionBackend):
                 await asyncio.wait_for(self._recognition_started.wait(), timeout=5.0)
             except asyncio.TimeoutError as exc:
                 raise SpeechmaticsRealtimeError("Recognition did not start in time.") from exc
+        if self._websocket is not websocket:
+            # The session was replaced while waiting; the resumed one replays this audio.
+            raise SpeechmaticsRealtimeError("Session replaced before audio could be sent.")
+        # Buffers, history and replay stay in PCM; encoding happens at the socket.
+        payload = mulaw_encode(chunk) if self._mulaw else chunk
         try:
-            await self._websocket.send(chunk)
+            await websocket.send(payload)
         except Exception as exc:  # pylint: disable=broad-except
             raise SpeechmaticsRealtimeError(f"Failed to stream audio: {exc}") from exc
+        self._audio_seq_no += 1
+        self.wire_bytes += len(payload)
+
+    def _remember_audio(self, position: int, chunk: bytes) -> None:
+        samples = len(chunk) // _SAMPLE_BYTES
+        self._history.append((position, chunk))
+        self._history_samples += samples
+        limit = int(self.config.resume_buffer_seconds * self.config.sample_rate)
+        while self._history:
+            start, oldest = self._history[0]
+            oldest_samples = len(oldest) // _SAMPLE_BYTES
+            if start + oldest_samples > self._committed_sample and self._history_samples <= limit:
+                break
+            self._history.popleft()
+            self._history_samples -= oldest_samples
+
+    def _begin_resume(self, cause: Exception) -> None:
+        if self._resume_task is not None or self._input_finished:
+            return
+        if self._sender is not None:
+            # Everything still queued is in the history and will be replayed.
+            self._sender.clear()
+        logging.warning("Speechmatics session lost (%s); resuming in the background.", cause)
+        self._resume_task = asyncio.create_task(self._resume(), name="speechmatics-resume")
+
+    async def _resume(self) -> None:
+        """Reconnect with backoff, then replay buffered audio faster than real time."""
+
+        started = time.monotonic()
+        deadline = started + self.config.resume_timeout_seconds
+        backoff = max(self.config.reconnect_backoff_seconds, 0.1)
+        attempt = 0
+        try:
+            while True:
+                self._detach_session()
+                try:
+                    replayed = await self._reopen_and_replay(started)
+                except SpeechmaticsRealtimeError as exc:
+                    attempt += 1
+                    delay = min(backoff * (2 ** (attempt - 1)), 30.0)
+                    if time.monotonic() + delay > deadline:
+                        raise SpeechmaticsRealtimeError(
+                            f"Could not resume Speechmatics session within "
+                            f"{self.config.resume_timeout_seconds:.0f} s: {exc}"
+                        ) from exc
+                    logging.warning(
+                        "Speechmatics resume attempt %d failed (%s); retrying in %.1f s.",
+                        attempt,
+                        exc,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                # No await between the final replay send and clearing the task,
+                # so live chunks cannot slip in out of order.
+                self._resume_task = None
+                self.resume_count += 1
+                self.last_resume_seconds = time.monotonic() - started
+                logging.info(
+                    "Speechmatics session resumed after %.1f s; replayed %.1f s of audio.",
+                    self.last_resume_seconds,
+                    replayed / self.config.sample_rate,
+                )
+                return
+        except SpeechmaticsRealtimeError as exc:
+            logging.error("%s", exc)
+            self._resume_task = None
+            await self._handle_listener_failure(exc)
+
+    async def _reopen_and_replay(self, lost_at: float) -> int:
+        """Open (or promote) a new session and send the backlog; return samples replayed."""
+
+        oldest = self._history[0][0] if self._history else self._stream_samples
+        start = max(self._committed_sample, oldest)
+        if oldest > self._committed_sample:
+            logging.warning(
+                "Speechmatics resume buffer exceeded; %.1f s of audio will not be transcribed.",
+                (oldest - self._committed_sample) / self.config.sample_rate,
+            )
+        standby = await self._take_standby()
+        self._audio_seq_no = 0
+        self._session_base_sample = start
+        # The replay resends dropped audio too; only gated silence leaves gaps.
+        self._gap_at.clear()
+        self._gap_total.clear()
+        if standby is not None:
+            self._websocket = standby.websocket
+            self._connected.set()
+            self._recognition_started.set()
+            self._listen_task = asyncio.create_task(
+                self._listen_loop(), name="speechmatics-listener"
+            )
+        else:
+            ws_url, headers = await self._build_connection_params()
+            await self._open_connection(ws_url, headers)
+            try:
+                await asyncio.wait_for(self._recognition_started.wait(), timeout=10.0)
+            except asyncio.TimeoutError as exc:
+                raise SpeechmaticsRealtimeError(
+                    "Recognition did not start after reconnect."
+                ) from exc
+
+        first_send = True
+        sent_until = start
+        while True:
+            pending = [
+                item
+                for item in self._history
+                if item[0] + len(item[1]) // _SAMPLE_BYTES > sent_until
+            ]
+            if not pending:
+                if self._stream_samples > sent_until:
+                    self._record_gap(sent_until, self._stream_samples - sent_until)
+                return sent_until - start
+            for chunk_start, chunk in pending:
+                if chunk_start > sent_until:
+                    # Input the voice-activity gate held back.
+                    self._record_gap(sent_until, chunk_start - sent_until)
+                skip = max(0, sent_until - chunk_start) * _SAMPLE_BYTES
+                await self._send_live(chunk[skip:])
+                sent_until = chunk_start + len(chunk) // _SAMPLE_BYTES
+                if first_send:
+                    first_send = False
+                    if standby is not None:
+                        self.failover_count += 1
+                        self.last_failover_gap = time.monotonic() - lost_at
+                        logging.info(
+                            "Failed over to standby Speechmatics session; audio resumed %.1f ms "
+                            "after the primary failed.",
+                            self.last_failover_gap * 1000.0,
+                        )
+
+    def _start_standby(self) -> None:
+        if not self.config.hot_standby or self._standby_task is not None:
+            return
+        if self.config.resume_buffer_seconds <= 0:
+            logging.warning(
+                "Speechmatics hot standby needs SPEECHMATICS_RESUME_BUFFER_SECONDS > 0."
+            )
+            return
+        self._standby_task = asyncio.create_task(
+            self._maintain_standby(), name="speechmatics-standby"
+        )
+
+    async def _stop_standby(self) -> None:
+        if self._standby_task is not None:
+            self._standby_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._standby_task
+            self._standby_task = None
+        standby, self._standby = self._standby, None
+        if standby is not None:
+            self._discard_standby(standby)
+
+    def _discard_standby(self, standby: _StandbySession) -> None:
+        if standby.watcher is not None:
+            standby.watcher.cancel()
+        self._close_in_background(standby.websocket)
+
+    async def _maintain_standby(self) -> None:
+        """Keep one ready standby session open, replacing it when used, lost or stale."""
+
+        backoff = max(self.config.reconnect_backoff_seconds, 0.1)
+        failures = 0
+        while True:
+            standby = self._standby
+            if standby is None or standby.failed:
+                if standby is not None:
+                    self._standby = None
+                    self._discard_standby(standby)
+                try:
+                    self._standby = await self._open_standby()
+                except SpeechmaticsRealtimeError as exc:
+                    failures += 1
+                    delay = min(backoff * (2 ** (failures - 1)), 60.0)
+                    logging.warning(
+                        "Standby Speechmatics session unavailable (%s); retry in %.0f s.",
+                        exc,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                failures = 0
+                logging.info("Standby Speechmatics session ready.")
+                continue
+            age = time.monotonic() - standby.opened_at
+            if age >= self.config.standby_recycle_seconds:
+                # Replace idle sessions before the server's idle limits apply.
+                self._standby = None
+                self._discard_standby(standby)
+                continue
+            assert standby.watcher is not None  # nosec B101
+            await asyncio.wait(
+                {standby.watcher},
+                timeout=min(1.0, self.config.standby_recycle_seconds - age),
+            )
+
+    async def _open_standby(self) -> _StandbySession:
+        ws_url, headers = await self._build_connection_params()
+        websocket = await self._connect_websocket(ws_url, headers)
+        standby = _StandbySession(websocket=websocket, opened_at=time.monotonic())
+        try:
+            await self._send_start_message(websocket)
+            standby.watcher = asyncio.create_task(
+                self._watch_standby(standby), name="speechmatics-standby-watch"
+            )
+            await asyncio.wait_for(standby.ready.wait(), timeout=10.0)
+        except BaseException as exc:
+            self._discard_standby(standby)
+            if isinstance(exc, asyncio.TimeoutError):
+                raise SpeechmaticsRealtimeError(
+                    "Standby recognition did not start in time."
+                ) from exc
+            raise
+        return standby
+
+    async def _watch_standby(self, standby: _StandbySession) -> None:
+        """Read the standby socket until promotion; any close or error marks it failed."""
+
+        try:
+            async for message in standby.websocket:
+                if isinstance(message, bytes):
+                    continue
+                payload = _json_loads(message)
+                msg_type = payload.get("message") or payload.get("type")
+                if msg_type == "RecognitionStarted":
+                    standby.ready.set()
+                elif msg_type in ("Error", "error"):
+                    logging.warning("Standby Speechmatics session error: %s", payload)
+                    break
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # pylint: disable=broad-except
+            logging.debug("Standby Speechmatics session lost: %s", exc)
+        standby.failed = True
+
+    async def _take_standby(self) -> Optional[_StandbySession]:
+        """Detach the ready standby for promotion, if there is one."""
+
+        standby = self._standby
+        if standby is None or standby.failed or not standby.ready.is_set():
+            return None
+        self._standby = None
+        if standby.watcher is not None:
+            standby.watcher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await standby.watcher
+        if standby.failed:
+            self._close_in_background(standby.websocket)
+            return None
+        return standby
+
+    async def flush(self, timeout: float = 10.0) -> None:
+        """Send EndOfStream and wait for the final transcripts."""
+
+        if self._resume_task is not None:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(asyncio.shield(self._resume_task), timeout=timeout)
+        if self._sender is not None and not await self._sender.join(timeout):
+            logging.warning("Uplink queue did not drain within %.0f s.", timeout)
+        if self._websocket is not None and self._connected.is_set():
+            end_message = {"message": "EndOfStream", "last_seq_no": self._audio_seq_no}
+            try:
+                await self._websocket.send(json.dumps(end_message))
+                await asyncio.wait_for(self._end_of_transcript.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                logging.warning("Speechmatics did not confirm EndOfTranscript within %.0f s.", timeout)
+            except Exception as exc:  # pylint: disable=broad-except
+                logging.warning("Failed to finish Speechmatics stream cleanly: %s", exc)
+        self._input_finished = True
+        await self._transcript_queue.put(None)
 
     async def transcript_results(self) -> AsyncGenerator[TranscriptSegment, None]:
         """Yield transcript results as they arrive."""
@@ -220,11 +771,16 @@ class SpeechmaticsRealtimeBackend(StreamingTranscriptionBackend):
             if result is None:
                 if self._listener_error is not None:
                     raise self._listener_error
+                if self._input_finished:
+                    return
                 continue
             yield result
 
-    async def _send_start_message(self) -> None:
-        if self._websocket is None:
+    async def _send_start_message(
+        self, websocket: Optional[WebSocketClientProtocol] = None
+    ) -> None:
+        websocket = websocket or self._websocket
+        if websocket is None:
             raise SpeechmaticsRealtimeError("Websocket is not connected.")
 
         diarization_mode = "speaker" if self.config.enable_diarization else None
@@ -236,25 +792,33 @@ class SpeechmaticsRealtimeBackend(StreamingTranscriptionBackend):
             },
             "audio_format": {
                 "type": "raw",
-                "encoding": "pcm_s16le",
+                "encoding": self.config.audio_encoding.value,
                 "sample_rate": self.config.sample_rate,
             },
         }
         if diarization_mode:
             start_message["transcription_config"]["diarization"] = diarization_mode
-        await self._websocket.send(json.dumps(start_message))
+        try:
+            await websocket.send(json.dumps(start_message))
+        except Exception as exc:  # pylint: disable=broad-except
+            raise SpeechmaticsRealtimeError(f"Failed to start recognition: {exc}") from exc
         logging.debug("Sent Speechmatics StartRecognition: %s", start_message)
 
     async def _listen_loop(self) -> None:
         """Receive transcript messages and push them into the queue."""
 
-        assert self._websocket is not None  # nosec B101
+        websocket = self._websocket
+        assert websocket is not None  # nosec B101
         try:
-            async for message in self._websocket:
+            async for message in websocket:
                 if isinstance(message, bytes):
                     logging.debug("Received binary %d bytes (ignored)", len(message))
                     continue
-                payload = json.loads(message)
+                if self._message_log is not None:
+                    self._message_log.write(message + "\n")
+                payload = self._decode_message(message)
+                if payload is None:
+                    continue
                 msg_type = payload.get("message") or payload.get("type")
                 if msg_type == "RecognitionStarted":
                     self._recognition_started.set()
@@ -262,29 +826,63 @@ class SpeechmaticsRealtimeBackend(StreamingTranscriptionBackend):
                 elif msg_type in ("AddPartialTranscript", "AddTranscript"):
                     transcript = self._parse_transcript(payload)
                     if transcript:
+                        if transcript.is_final and transcript.end_time is not None:
+                            self._committed_sample = max(
+                                self._committed_sample,
+                                int(transcript.end_time * self.config.sample_rate),
+                            )
                         await self._transcript_queue.put(transcript)
+                elif msg_type == "EndOfTranscript":
+                    self._end_of_transcript.set()
+                    logging.info("Speechmatics end of transcript.")
                 elif msg_type in ("Warning",):
                     logging.warning("Speechmatics warning: %s", payload)
                 elif msg_type in ("Error", "error"):
                     logging.error("Speechmatics error: %s", payload)
-                    await self._handle_listener_failure(
-                        SpeechmaticsRealtimeError(f"Speechmatics returned error: {payload}")
-                    )
+                    error = SpeechmaticsRealtimeError(f"Speechmatics returned error: {payload}")
+                    if self._resume_enabled and payload.get("type") not in _FATAL_ERROR_TYPES:
+                        self._begin_resume(error)
+                    else:
+                        await self._handle_listener_failure(error)
                     break
                 else:
                     logging.debug("Speechmatics message ignored: %s", payload)
+            else:
+                if (
+                    not self._end_of_transcript.is_set()
+                    and self._resume_enabled
+                    and self._websocket is websocket
+                ):
+                    self._begin_resume(SpeechmaticsRealtimeError("connection closed by server"))
         except asyncio.CancelledError:
             logging.info("Speechmatics listener cancelled.")
             raise
         except Exception as exc:  # pylint: disable=broad-except
+            if self._resume_enabled:
+                logging.warning("Speechmatics stream interrupted: %s", exc)
+                self._begin_resume(exc)
+                return
             logging.exception("Error while listening to Speechmatics stream: %s", exc)
             await self._handle_listener_failure(
                 SpeechmaticsRealtimeError("Speechmatics listener stopped unexpectedly.")
             )
             raise SpeechmaticsRealtimeError("Listener stopped unexpectedly.") from exc
         finally:
-            self._connected.clear()
-            self._recognition_started.clear()
+            # A superseded session must not clear the flags of its replacement.
+            if self._websocket is websocket:
+                self._connected.clear()
+                self._recognition_started.clear()
+
+    @staticmethod
+    def _decode_message(message: str) -> Optional[Dict]:
+        """Decode a server text message; ``None`` for acks the listener ignores."""
+
+        if message.startswith(_AUDIO_ADDED_PREFIX):
+            return None
+        payload = _json_loads(message)
+        if payload.get("message") == "AudioAdded":
+            return None
+        return payload
 
     def _parse_transcript(self, payload: Dict) -> Optional[TranscriptSegment]:
         md = payload.get("metadata") or {}
@@ -292,9 +890,34 @@ class SpeechmaticsRealtimeBackend(StreamingTranscriptionBackend):
         if not text:
             return None
         is_final = (payload.get("message") == "AddTranscript")
-        words = md.get("words") or []
-        start_time = words[0].get("start_time") if words else None
-        end_time = words[-1].get("end_time") if words else None
+        # Re-base onto the stream clock so times stay monotonic across resumed
+        # sessions; the per-word mapping is only needed once audio was skipped.
+        offset = self._time_offset
+        gapped = bool(self._gap_at)
+        stream_time = self._stream_time
+        word_starts = array("d")
+        word_ends = array("d")
+        for word in md.get("words") or payload.get("results") or ():
+            start = word.get("start_time")
+            end = word.get("end_time")
+            if start is None or end is None or word.get("type", "word") != "word":
+                continue
+            if gapped:
+                word_starts.append(stream_time(start))
+                word_ends.append(stream_time(end, end=True))
+            else:
+                word_starts.append(start + offset)
+                word_ends.append(end + offset)
+        if word_starts:
+            start_time, end_time = word_starts[0], word_ends[-1]
+        else:
+            start_time, end_time = md.get("start_time"), md.get("end_time")
+            if gapped:
+                start_time = stream_time(start_time) if start_time is not None else None
+                end_time = stream_time(end_time, end=True) if end_time is not None else None
+            elif offset:
+                start_time = start_time + offset if start_time is not None else None
+                end_time = end_time + offset if end_time is not None else None
 
         transcript = TranscriptSegment(
             text=text,
@@ -302,14 +925,17 @@ class SpeechmaticsRealtimeBackend(StreamingTranscriptionBackend):
             speaker=md.get("speaker"),
             start_time=start_time,
             end_time=end_time,
-            raw=payload,
-        )
-        logging.debug(
-            "Speechmatics transcript: %s (final=%s, speaker=%s)",
-            transcript.text,
-            transcript.is_final,
-            transcript.speaker,
+            raw=payload if self.config.keep_raw_messages else None,
+            word_starts=word_starts or None,
+            word_ends=word_ends or None,
         )
+        if logging.root.isEnabledFor(logging.DEBUG):
+            logging.debug(
+                "Speechmatics transcript: %s (final=%s, speaker=%s)",
+                transcript.text,
+                transcript.is_final,
+                transcript.speaker,
+            )
         return transcript
 
     async def _handle_listener_failure(self, error: SpeechmaticsRealtimeError) -> None:
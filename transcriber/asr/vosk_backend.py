@@ -5,84 +5,303 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from typing import AsyncGenerator, Optional
+import threading
+import time
+from collections import deque
+from typing import Any, AsyncGenerator, Deque, Optional
 
-from vosk import KaldiRecognizer, Model  # type: ignore
+from vosk import KaldiRecognizer  # type: ignore
 
 from ..config import VoskConfig
 from .base import StreamingTranscriptionBackend, TranscriptSegment
+from .vosk_models import shared_model_registry
+
+_SAMPLE_BYTES = 2
+_STOP = object()
 
 
 class VoskBackendError(Exception):
     """Raised when Vosk streaming fails."""
 
 
+class PartialThrottle:
+    """Decide when a partial hypothesis is worth extracting from Kaldi.
+
+    ``PartialResult()`` walks the lattice and serialises JSON, so it is only
+    called once both ``min_interval`` seconds of wall time and
+    ``min_audio_samples`` of new audio have passed since the last
+    extraction or final, and never while more audio is already queued
+    (the next chunk would supersede it anyway).
+    """
+
+    def __init__(self, min_interval: float, min_audio_samples: int) -> None:
+        self.min_interval = min_interval
+        self.min_audio_samples = min_audio_samples
+        self._last_time = float("-inf")
+        self._last_position = -min_audio_samples
+        self.extracted = 0
+        self.throttled = 0
+
+    def due(self, position: int, now: float, backlogged: bool) -> bool:
+        if (
+            backlogged
+            or position - self._last_position < self.min_audio_samples
+            or now - self._last_time < self.min_interval - 1e-6
+        ):
+            self.throttled += 1
+            return False
+        return True
+
+    def mark(self, position: int, now: float, extracted: bool = True) -> None:
+        self._last_position = position
+        self._last_time = now
+        if extracted:
+            self.extracted += 1
+
+
 class VoskStreamingBackend(StreamingTranscriptionBackend):
-    """Lightweight offline transcription using Vosk."""
+    """Lightweight offline transcription using Vosk.
+
+    Kaldi decoding runs on a dedicated worker thread (the cffi bindings
+    release the GIL), so the event loop only enqueues audio and receives
+    finished segments via ``call_soon_threadsafe``. The input queue holds
+    at most ``max_backlog_seconds`` of audio; beyond that
+    :meth:`send_audio_chunk` waits for the recognizer to catch up.
+
+    The model comes from the process-wide registry and the recognizer is
+    borrowed from its pool for the lifetime of the context manager, so
+    further streams and restarts reuse the warm model.
+    """
 
     def __init__(self, config: VoskConfig) -> None:
         self.config = config
+        self._registry = shared_model_registry()
         try:
-            self._model = Model(model_path=config.model_path)
+            self._model = self._registry.model(config.model_path)
         except Exception as exc:  # pylint: disable=broad-except
             raise VoskBackendError(f"Failed to load Vosk model: {exc}") from exc
 
-        self._recognizer = KaldiRecognizer(self._model, config.sample_rate)
-        self._recognizer.SetWords(True)
-        self._queue: "asyncio.Queue[TranscriptSegment]" = asyncio.Queue()
+        self._recognizer: Optional[KaldiRecognizer] = None
+        self._queue: "asyncio.Queue[Optional[TranscriptSegment]]" = asyncio.Queue()
         self._last_partial: Optional[str] = None
         self._closed = False
+        # Worker thread state; _items and _backlog_samples are guarded by _cond.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._cond = threading.Condition()
+        self._items: Deque[Any] = deque()
+        self._backlog_samples = 0
+        self._max_backlog_samples = max(1, int(config.max_backlog_seconds * config.sample_rate))
+        self._space = asyncio.Event()
+        self._worker_error: Optional[VoskBackendError] = None
+        self.max_backlog_seconds_seen = 0.0
+        self.decoded_seconds = 0.0
+        self.decode_cpu_seconds = 0.0
+        self._partials = PartialThrottle(
+            config.partial_min_interval_seconds,
+            int(config.partial_min_audio_seconds * config.sample_rate),
+        )
+        self._last_partial_raw = ""
+        self.partials_unchanged = 0
 
     async def __aenter__(self) -> "VoskStreamingBackend":
+        try:
+            self._recognizer = self._registry.acquire(
+                self.config.model_path, self.config.sample_rate
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            raise VoskBackendError(f"Failed to create Vosk recognizer: {exc}") from exc
+        self._loop = asyncio.get_running_loop()
+        self._thread = threading.Thread(target=self._run, name="vosk-recognizer", daemon=True)
+        self._thread.start()
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
         self._closed = True
+        if self._thread is not None:
+            self._enqueue(_STOP, 0)
+            await asyncio.to_thread(self._thread.join)
+            self._thread = None
+        if self._recognizer is not None:
+            if self._worker_error is None:
+                self._registry.release(
+                    self.config.model_path, self.config.sample_rate, self._recognizer
+                )
+            self._recognizer = None
+
+    @property
+    def backlog_seconds(self) -> float:
+        """Audio queued for the recognizer but not yet decoded."""
+
+        return self._backlog_samples / self.config.sample_rate
 
     async def send_audio_chunk(self, chunk: bytes) -> None:
         if self._closed:
             raise VoskBackendError("Backend already closed.")
+        if self._worker_error is not None:
+            raise self._worker_error
+        if self._thread is None:
+            raise VoskBackendError("Backend not started; use it as an async context manager.")
 
-        accepted = self._recognizer.AcceptWaveform(chunk)
-        if accepted:
-            await self._emit_result(self._recognizer.Result(), is_final=True)
-        elif self.config.enable_partials:
-            await self._emit_result(self._recognizer.PartialResult(), is_final=False)
+        while self._backlog_samples >= self._max_backlog_samples:
+            # The worker sets the event from the loop thread, so no wakeup is lost.
+            self._space.clear()
+            await self._space.wait()
+            if self._worker_error is not None:
+                raise self._worker_error
+        self._enqueue(chunk, len(chunk) // _SAMPLE_BYTES)
+
+    async def flush(self) -> None:
+        if self._closed or self._thread is None:
+            return
+        done = asyncio.get_running_loop().create_future()
+        if self._enqueue(("flush", done), 0):
+            await done
 
     async def transcript_results(self) -> AsyncGenerator[TranscriptSegment, None]:
         while True:
             result = await self._queue.get()
+            if result is None:
+                return
             yield result
 
-    async def _emit_result(self, result_text: str, is_final: bool) -> None:
+    def metrics_summary(self) -> Optional[str]:
+        rtf = self.decode_cpu_seconds / self.decoded_seconds if self.decoded_seconds else 0.0
+        return (
+            f"recognizer backlog {self.backlog_seconds:.2f} s "
+            f"(max {self.max_backlog_seconds_seen:.2f} s), "
+            f"decoded {self.decoded_seconds:.0f} s at CPU RTF {rtf:.2f}, "
+            f"partials {self._partials.extracted} extracted / "
+            f"{self._partials.throttled} throttled / {self.partials_unchanged} unchanged"
+        )
+
+    def _enqueue(self, item: Any, samples: int) -> bool:
+        with self._cond:
+            if self._worker_error is not None:
+                return False
+            self._items.append(item)
+            self._backlog_samples += samples
+            backlog = self.backlog_seconds
+            self.max_backlog_seconds_seen = max(self.max_backlog_seconds_seen, backlog)
+            self._cond.notify()
+        return True
+
+    def _post(self, callback, *args: Any) -> None:  # noqa: ANN001
+        assert self._loop is not None  # nosec B101
+        try:
+            self._loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            pass  # loop already closed during shutdown
+
+    def _run(self) -> None:
+        """Worker thread: decode queued audio and hand segments back to the loop."""
+
+        recognizer = self._recognizer
+        assert recognizer is not None  # nosec B101
+        position = 0  # samples decoded so far
+        while True:
+            with self._cond:
+                while not self._items:
+                    self._cond.wait()
+                item = self._items.popleft()
+            if item is _STOP:
+                return
+            if isinstance(item, tuple):
+                _, done = item
+                try:
+                    final = recognizer.FinalResult()
+                except Exception as exc:  # pylint: disable=broad-except
+                    self._fail(exc, done)
+                    return
+                self._deliver(final, is_final=True)
+                self._post(self._queue.put_nowait, None)
+                self._post(_resolve, done)
+                continue
+
+            samples = len(item) // _SAMPLE_BYTES
+            position += samples
+            started = time.perf_counter()
+            cpu_started = time.thread_time()
+            try:
+                if recognizer.AcceptWaveform(item):
+                    result, is_final = recognizer.Result(), True
+                    self._partials.mark(position, started, extracted=False)
+                    self._last_partial_raw = ""
+                elif self.config.enable_partials and self._partials.due(
+                    position, started, backlogged=bool(self._items)
+                ):
+                    result, is_final = recognizer.PartialResult(), False
+                    self._partials.mark(position, started)
+                    if result == self._last_partial_raw:
+                        # Hypothesis unchanged: skip the JSON decode and comparison.
+                        self.partials_unchanged += 1
+                        result = ""
+                    else:
+                        self._last_partial_raw = result
+                else:
+                    result, is_final = "", False
+            except Exception as exc:  # pylint: disable=broad-except
+                self._fail(exc)
+                return
+            # Thread CPU time, so GIL and scheduler waits do not count as decoding.
+            self.decode_cpu_seconds += time.thread_time() - cpu_started
+            self.decoded_seconds += samples / self.config.sample_rate
+            with self._cond:
+                was_full = self._backlog_samples >= self._max_backlog_samples
+                self._backlog_samples -= samples
+            if was_full:
+                self._post(self._space.set)
+            self._deliver(result, is_final)
+
+    def _fail(self, exc: Exception, done: Optional["asyncio.Future[None]"] = None) -> None:
+        """Record a recognizer failure and release everyone waiting on the worker."""
+
+        logging.exception("Vosk recognizer failed: %s", exc)
+        with self._cond:
+            self._worker_error = VoskBackendError(f"Vosk recognizer failed: {exc}")
+            pending, self._items = list(self._items), deque()
+        self._post(self._space.set)
+        self._post(self._queue.put_nowait, None)
+        if done is not None:
+            self._post(_resolve, done)
+        for leftover in pending:
+            if isinstance(leftover, tuple):
+                self._post(_resolve, leftover[1])
+
+    def _deliver(self, result_text: str, is_final: bool) -> None:
+        segment = self._parse_result(result_text, is_final)
+        if segment is not None:
+            self._post(self._queue.put_nowait, segment)
+
+    def _parse_result(self, result_text: str, is_final: bool) -> Optional[TranscriptSegment]:
         if not result_text:
-            return
+            return None
         try:
             payload = json.loads(result_text)
         except json.JSONDecodeError as exc:
             logging.debug("Invalid Vosk JSON payload %s: %s", result_text, exc)
-            return
+            return None
 
-        text = payload.get("text", "").strip()
+        text = payload.get("text", payload.get("partial", "")).strip()
         if not text:
             if not is_final and self._last_partial:
                 # Reset partial when Vosk clears interim hypothesis.
-                await self._queue.put(
-                    TranscriptSegment(text="", is_final=False, raw=payload)
-                )
                 self._last_partial = None
-            return
+                return TranscriptSegment(text="", is_final=False, raw=payload)
+            return None
 
         if not is_final:
             if text == self._last_partial:
-                return
+                return None
             self._last_partial = text
+        else:
+            self._last_partial = None
 
         words = payload.get("result") or []
         start_time = words[0].get("start") if words else None
         end_time = words[-1].get("end") if words else None
 
-        segment = TranscriptSegment(
+        return TranscriptSegment(
             text=text,
             is_final=is_final,
             speaker=None,
@@ -90,7 +309,8 @@ class VoskStreamingBackend(StreamingTranscriptionBackend):
             end_time=end_time,
             raw=payload,
         )
-        await self._queue.put(segment)
 
-        if is_final:
-            self._last_partial = None
+
+def _resolve(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
@@ -0,0 +1,114 @@
+"""Process-wide cache of Vosk models and pooled recognizers."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from vosk import KaldiRecognizer, Model  # type: ignore
+
+
+def _model_key(model_path: str) -> str:
+    return str(Path(model_path).expanduser().resolve())
+
+
+class VoskModelRegistry:
+    """Load each Vosk model once and recycle its recognizers.
+
+    A Kaldi model is read-only once loaded and can back any number of
+    recognizers concurrently, so every backend in the process shares one
+    instance per model directory. Released recognizers are ``Reset()`` and
+    kept (up to ``max_idle`` per model and sample rate) for the next
+    stream, so a pipeline restart after an error starts decoding at once
+    instead of reloading hundreds of MB from disk.
+    """
+
+    def __init__(self, max_idle: int = 4) -> None:
+        self.max_idle = max_idle
+        self._lock = threading.Lock()
+        self._models: Dict[str, Model] = {}
+        self._loading: Dict[str, threading.Lock] = {}
+        self._idle: Dict[Tuple[str, int], List[KaldiRecognizer]] = {}
+        self.models_loaded = 0
+        self.recognizers_created = 0
+        self.recognizers_reused = 0
+
+    def model(self, model_path: str) -> Model:
+        """Return the shared model for ``model_path``, loading it on first use.
+
+        Concurrent callers for the same path wait for a single load; loads
+        of different models proceed in parallel. Load errors propagate and
+        are not cached.
+        """
+
+        key = _model_key(model_path)
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None:
+                return model
+            loading = self._loading.setdefault(key, threading.Lock())
+        with loading:
+            with self._lock:
+                model = self._models.get(key)
+            if model is None:
+                started = time.perf_counter()
+                model = Model(model_path=key)
+                logging.info(
+                    "Loaded Vosk model %s in %.1f s.", key, time.perf_counter() - started
+                )
+                with self._lock:
+                    self._models[key] = model
+                    self.models_loaded += 1
+        return model
+
+    def acquire(self, model_path: str, sample_rate: int) -> KaldiRecognizer:
+        """Take an idle recognizer for ``(model_path, sample_rate)`` or create one."""
+
+        key = (_model_key(model_path), int(sample_rate))
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self.recognizers_reused += 1
+                recognizer = idle.pop()
+                recognizer.SetWords(True)
+                return recognizer
+        recognizer = KaldiRecognizer(self.model(model_path), sample_rate)
+        recognizer.SetWords(True)
+        with self._lock:
+            self.recognizers_created += 1
+        return recognizer
+
+    def release(self, model_path: str, sample_rate: int, recognizer: KaldiRecognizer) -> None:
+        """Return a recognizer to the pool once its stream has finished."""
+
+        try:
+            recognizer.Reset()
+        except Exception as exc:  # pylint: disable=broad-except
+            logging.debug("Discarding Vosk recognizer that failed to reset: %s", exc)
+            return
+        key = (_model_key(model_path), int(sample_rate))
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle:
+                idle.append(recognizer)
+
+    def evict(self, model_path: str) -> None:
+        """Forget a model and its idle recognizers (e.g. after the files changed)."""
+
+        key = _model_key(model_path)
+        with self._lock:
+            self._models.pop(key, None)
+            for pool_key in [k for k in self._idle if k[0] == key]:
+                del self._idle[pool_key]
+
+
+_registry = VoskModelRegistry()
+
+
+def shared_model_registry() -> VoskModelRegistry:
+    """The process-wide registry used by every :class:`VoskStreamingBackend`."""
+
+    return _registry
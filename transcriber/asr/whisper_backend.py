@@ -4,114 +4,621 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import AsyncGenerator, Optional
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, AsyncGenerator, Deque, List, Optional
 
 import numpy as np
 from faster_whisper import WhisperModel  # type: ignore
 
-from ..config import WhisperConfig
+from ..config import VadConfig, WhisperBacklogPolicy, WhisperConfig
+from ..dsp import pcm16_view
+from ..ringbuffer import FloatAudioWindow
+from ..vad import EnergyZcrDetector, UtteranceSegmenter
 from .base import StreamingTranscriptionBackend, TranscriptSegment
+from .whisper_workers import (
+    WhisperWorkerCrashed,
+    WhisperWorkerError,
+    WhisperWorkerPool,
+    shared_worker_pool,
+    transcribe_text,
+    transcribe_words,
+)
+
+_PUNCTUATION = ".,;:!?\"'«»„“”()-"
 
 
 class WhisperBackendError(Exception):
     """Raised when the Whisper backend fails."""
 
 
+@dataclass(slots=True)
+class _Job:
+    """Absolute sample range ``[start, end)`` waiting for inference."""
+
+    start: int
+    end: int
+    final_flush: bool = False
+    done: Optional["asyncio.Future[None]"] = None
+
+    @property
+    def samples(self) -> int:
+        return self.end - self.start
+
+
+@dataclass(slots=True)
+class _Word:
+    start: float  # seconds since the stream started
+    end: float
+    text: str
+
+
+def _norm(text: str) -> str:
+    return text.strip(_PUNCTUATION + " ").lower()
+
+
+class LocalAgreement:
+    """Commit the words on which consecutive window hypotheses agree.
+
+    This is the LocalAgreement-2 policy of whisper_streaming: a word becomes
+    final once two successive decodes of the growing window produce the
+    same prefix up to it. Words starting before the end of the committed
+    text are ignored, and a hypothesis that opens by repeating the committed
+    tail (Whisper re-reading its context) has that n-gram removed.
+    """
+
+    def __init__(self, max_ngram: int = 5, prompt_words: int = 32) -> None:
+        self.max_ngram = max_ngram
+        self.committed_end = 0.0
+        self._tentative: List[_Word] = []
+        self._recent: Deque[str] = deque(maxlen=max(max_ngram, prompt_words))
+
+    @property
+    def tentative_text(self) -> str:
+        return " ".join(word.text for word in self._tentative)
+
+    @property
+    def prompt(self) -> str:
+        """Recently committed text, passed to Whisper as ``initial_prompt``."""
+
+        return " ".join(self._recent)
+
+    def insert(self, words: List[_Word]) -> List[_Word]:
+        """Feed the latest hypothesis and return the newly committed words."""
+
+        fresh = [word for word in words if word.start >= self.committed_end - 0.1]
+        if fresh and self._recent and abs(fresh[0].start - self.committed_end) < 1.0:
+            recent = [_norm(text) for text in self._recent]
+            for size in range(min(self.max_ngram, len(fresh), len(recent)), 0, -1):
+                if [_norm(word.text) for word in fresh[:size]] == recent[-size:]:
+                    fresh = fresh[size:]
+                    break
+        agreed = 0
+        for previous, current in zip(self._tentative, fresh):
+            if _norm(previous.text) != _norm(current.text):
+                break
+            agreed += 1
+        committed = fresh[:agreed]
+        self._tentative = fresh[agreed:]
+        self._commit(committed)
+        return committed
+
+    def commit_all(self) -> List[_Word]:
+        """Commit the pending hypothesis as is (end of stream or full window)."""
+
+        committed, self._tentative = self._tentative, []
+        self._commit(committed)
+        return committed
+
+    def _commit(self, words: List[_Word]) -> None:
+        if words:
+            self.committed_end = words[-1].end
+            self._recent.extend(word.text for word in words)
+
+
 class WhisperStreamingBackend(StreamingTranscriptionBackend):
-    """Chunked transcription using faster-whisper."""
+    """Chunked transcription using faster-whisper.
+
+    Ingestion and inference are decoupled: :meth:`send_audio_chunk` only
+    buffers audio and cuts it into segments, which a worker task feeds to a
+    dedicated single-thread executor. The work queue holds at most
+    ``max_backlog_seconds`` of audio; once inference is half that far
+    behind real time the configured :class:`WhisperBacklogPolicy` applies,
+    and beyond the bound the oldest segments are dropped, so the audio pump
+    never waits on the model.
+
+    With ``vad_segmentation`` segments are utterances cut at detected
+    pauses (:class:`~transcriber.vad.UtteranceSegmenter`, tuned by the
+    shared :class:`VadConfig`) rather than fixed slices, and audio without
+    speech is never sent to the model.
 
-    def __init__(self, config: WhisperConfig, sample_rate: int) -> None:
+    Audio lives in a preallocated :class:`FloatAudioWindow`: chunks are
+    converted to float32 in place on arrival and the model reads views of
+    it, so queued segments are just sample ranges and steady-state
+    buffering allocates nothing.
+
+    With ``streaming`` enabled the buffer is a sliding window instead:
+    every ``partial_interval_seconds`` of new audio the whole window is
+    re-decoded with word timestamps, words agreed on by two consecutive
+    decodes are emitted as finals (:class:`LocalAgreement`), the rest as a
+    partial, and the window is trimmed at the last committed word.
+
+    With ``inference_workers`` the model runs in resident worker processes
+    (:class:`~transcriber.asr.whisper_workers.WhisperWorkerPool`) shared by
+    every backend in the process; a crashed worker is respawned and the
+    audio it was given is skipped rather than ending the stream.
+    """
+
+    # faster-whisper expects 16 kHz mono float arrays.
+    MODEL_SAMPLE_RATE = 16_000
+
+    def __init__(
+        self,
+        config: WhisperConfig,
+        sample_rate: int = MODEL_SAMPLE_RATE,
+        vad: Optional[VadConfig] = None,
+    ) -> None:
         self.config = config
         self.sample_rate = sample_rate
-        try:
-            self._model = WhisperModel(
-                model_size_or_path=config.model_size,
-                device=config.device,
-                compute_type=config.compute_type,
+        self._model: Optional[WhisperModel] = None
+        self._fallback_model: Optional[WhisperModel] = None
+        self._pool: Optional[WhisperWorkerPool] = None
+        self._wants_fallback = (
+            config.backlog_policy is WhisperBacklogPolicy.DOWNGRADE
+            and config.fallback_model_size != config.model_size
+        )
+        self._fallback_ready = False
+        if config.inference_workers:
+            preload = [config.model_size]
+            if self._wants_fallback:
+                preload.append(config.fallback_model_size)
+                self._fallback_ready = True
+            self._pool = shared_worker_pool(
+                config.inference_workers, config.device, config.compute_type, preload
             )
-        except Exception as exc:  # pylint: disable=broad-except
-            raise WhisperBackendError(f"Failed to load Whisper model: {exc}") from exc
+            # Like the in-process model, workers are up before capture starts.
+            try:
+                self._pool.start()
+            except WhisperWorkerError as exc:
+                raise WhisperBackendError(f"Failed to start Whisper workers: {exc}") from exc
+        else:
+            self._model = self._load_model(config.model_size)
 
         self._segment_samples = int(self.sample_rate * config.segment_duration)
-        self._buffer = bytearray()
-        self._queue: "asyncio.Queue[TranscriptSegment]" = asyncio.Queue()
-        self._processed_samples = 0
+        self._segmenter: Optional[UtteranceSegmenter] = None
+        if config.vad_segmentation:
+            vad = vad or VadConfig()
+            self._segmenter = UtteranceSegmenter(
+                EnergyZcrDetector(
+                    sample_rate,
+                    frame_ms=vad.frame_ms,
+                    threshold_db=vad.threshold_db,
+                    margin_db=vad.margin_db,
+                ),
+                sample_rate,
+                min_seconds=config.min_segment_seconds,
+                max_seconds=(
+                    config.max_window_seconds if config.streaming else config.segment_duration
+                ),
+                pause_seconds=config.pause_seconds,
+                preroll_seconds=vad.preroll_seconds,
+            )
+        # Sized for the largest backlog plus the running segment/window, so
+        # queued ranges and in-flight views are not overwritten.
+        self._window = FloatAudioWindow(
+            int(
+                (
+                    config.max_backlog_seconds
+                    + config.max_window_seconds
+                    + 2 * config.segment_duration
+                    + 2.0
+                )
+                * sample_rate
+            )
+        )
+        self._cut_pos = 0  # start of the next fixed-length segment
+        self._queue: "asyncio.Queue[Optional[TranscriptSegment]]" = asyncio.Queue()
         self._closed = False
-        self._lock = asyncio.Lock()
+        # Work queue between ingestion and the inference worker task.
+        self._pending: Deque[_Job] = deque()
+        self._pending_samples = 0
+        self._inflight_samples = 0
+        self._inflight_start: Optional[int] = None
+        self._max_backlog_samples = max(
+            self._segment_samples, int(config.max_backlog_seconds * sample_rate)
+        )
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._behind = False
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._worker: Optional["asyncio.Task[None]"] = None
+        self._worker_error: Optional[WhisperBackendError] = None
+        self.max_backlog_seconds_seen = 0.0
+        self.transcribed_seconds = 0.0
+        self.inference_seconds = 0.0
+        self.skipped_seconds = 0.0
+        self.shortened_seconds = 0.0
+        self.fallback_segments = 0
+        # Streaming mode state.
+        self._agreement = LocalAgreement()
+        self._flush_waiters: List["asyncio.Future[None]"] = []
+        self._interval_samples = max(1, int(config.partial_interval_seconds * sample_rate))
+        self._window_samples = int(config.max_window_seconds * sample_rate)
+        self._last_partial = ""
+        self._utterance_closed = False
+        self.window_decodes = 0
+        self.silent_windows = 0
 
     async def __aenter__(self) -> "WhisperStreamingBackend":
+        if self._pool is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="whisper-inference"
+            )
+            if self._wants_fallback:
+                # Queued ahead of the first segment so the fallback is warm when needed.
+                asyncio.get_running_loop().run_in_executor(self._executor, self._load_fallback)
+        run = self._run_streaming if self.config.streaming else self._run
+        self._worker = asyncio.create_task(run(), name="whisper-inference")
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
-        await self._flush_buffer()
+        if self._worker is not None:
+            if exc_type is not None:
+                # Aborting: do not transcribe the backlog on the way out.
+                self._pending.clear()
+                self._pending_samples = 0
+                self._window.clear()
+            elif not self.config.streaming and self._worker_error is None:
+                self._submit(self._cut_tail())
+            self._stopping = True
+            self._wakeup.set()
+            try:
+                await self._worker
+            finally:
+                self._worker = None
         self._closed = True
+        if self._executor is not None:
+            await asyncio.to_thread(self._executor.shutdown)
+            self._executor = None
+
+    @property
+    def backlog_seconds(self) -> float:
+        """Audio cut into segments but not yet transcribed."""
+
+        return (self._pending_samples + self._inflight_samples) / self.sample_rate
+
+    @property
+    def real_time_factor(self) -> float:
+        """Inference wall time per second of audio transcribed (below 1 keeps up)."""
+
+        if not self.transcribed_seconds:
+            return 0.0
+        return self.inference_seconds / self.transcribed_seconds
 
     async def send_audio_chunk(self, chunk: bytes) -> None:
         if self._closed:
             raise WhisperBackendError("Backend already closed.")
-        async with self._lock:
-            self._buffer.extend(chunk)
-            await self._process_ready_segments()
+        if self._worker_error is not None:
+            raise self._worker_error
+        if self._worker is None:
+            raise WhisperBackendError("Backend not started; use it as an async context manager.")
+        samples = pcm16_view(chunk)
+        if not self._append(samples):
+            return
+        segmenter = self._segmenter
+        if self.config.streaming:
+            self._pending_samples += samples.size
+            if segmenter is not None and segmenter.feed(samples):
+                self._utterance_closed = True
+            excess = len(self._window) - (self._window_samples + self._max_backlog_samples)
+            if excess > 0:
+                # Inference is hopelessly behind: forget the oldest audio.
+                self._trim_window(self._window.start + excess)
+                self.skipped_seconds += excess / self.sample_rate
+            self.max_backlog_seconds_seen = max(
+                self.max_backlog_seconds_seen, self.backlog_seconds
+            )
+            self._wakeup.set()
+            return
+        if segmenter is not None:
+            for start, end in segmenter.feed(samples):
+                self._submit(_Job(start, end))
+        else:
+            while self._window.end - self._cut_pos >= self._segment_samples:
+                self._submit(_Job(self._cut_pos, self._cut_pos + self._segment_samples))
+                self._cut_pos += self._segment_samples
+        self._release()
+
+    async def flush(self) -> None:
+        if self._worker is None or self._worker_error is not None:
+            await self._queue.put(None)
+            return
+        done = asyncio.get_running_loop().create_future()
+        if self.config.streaming:
+            self._flush_waiters.append(done)
+            self._wakeup.set()
+        else:
+            self._submit(self._cut_tail(done))
+        await done
 
     async def transcript_results(self) -> AsyncGenerator[TranscriptSegment, None]:
         while True:
             result = await self._queue.get()
+            if result is None:
+                return
             yield result
 
-    async def _process_ready_segments(self) -> None:
-        bytes_per_segment = self._segment_samples * 2  # int16
-        while len(self._buffer) >= bytes_per_segment:
-            segment_bytes = self._buffer[:bytes_per_segment]
-            del self._buffer[:bytes_per_segment]
-            await self._transcribe_segment(segment_bytes)
+    def metrics_summary(self) -> Optional[str]:
+        return (
+            f"inference backlog {self.backlog_seconds:.1f} s "
+            f"(max {self.max_backlog_seconds_seen:.1f} s), "
+            f"transcribed {self.transcribed_seconds:.0f} s at RTF {self.real_time_factor:.2f}, "
+            f"skipped {self.skipped_seconds:.0f} s, shortened {self.shortened_seconds:.0f} s, "
+            f"fallback segments {self.fallback_segments}"
+            + (f", {self.window_decodes} window decodes" if self.config.streaming else "")
+            + (f", {self._pool.restarts} worker restarts" if self._pool is not None else "")
+            + self._segmentation_summary()
+        )
 
-    async def _flush_buffer(self) -> None:
-        if not self._buffer:
-            return
-        # Flush remaining audio as a final short segment.
-        await self._transcribe_segment(bytes(self._buffer), final_flush=True)
-        self._buffer.clear()
+    def _segmentation_summary(self) -> str:
+        segmenter = self._segmenter
+        if segmenter is None:
+            return ""
+        if self.config.streaming:
+            return f", {self.silent_windows} silent windows skipped"
+        silence = (segmenter.position - segmenter.emitted_samples) / self.sample_rate
+        return f", {segmenter.utterances} utterances, {silence:.0f} s of silence not decoded"
 
-    async def _transcribe_segment(self, segment_bytes: bytes, final_flush: bool = False) -> None:
-        if not segment_bytes:
-            return
+    def _append(self, samples: np.ndarray) -> bool:
+        window = self._window
+        if (
+            self._inflight_start is not None
+            and window.end + samples.size - self._inflight_start > window.capacity
+        ):
+            # The running decode still reads the oldest audio; never overwrite it.
+            self.skipped_seconds += samples.size / self.sample_rate
+            logging.warning(
+                "Whisper inference stalled; dropped %.2f s of incoming audio.",
+                samples.size / self.sample_rate,
+            )
+            return False
+        evicted = window.append(samples)
+        if evicted:
+            self.skipped_seconds += evicted / self.sample_rate
+        return True
 
-        loop = asyncio.get_running_loop()
-        audio_int16 = np.frombuffer(segment_bytes, dtype=np.int16)
-        if audio_int16.size == 0:
-            return
+    def _release(self) -> None:
+        """Let the window forget audio no queued or future segment can need."""
 
-        audio_float32 = audio_int16.astype(np.float32) / 32768.0
+        if self._segmenter is not None:
+            floor = self._segmenter.retain_from
+        else:
+            floor = self._cut_pos
+        if self._pending:
+            floor = min(floor, self._pending[0].start)
+        self._window.discard_until(floor)
 
-        try:
-            segments_text = await loop.run_in_executor(
-                None,
-                self._run_transcription,
-                audio_float32,
+    def _cut_tail(self, done: Optional["asyncio.Future[None]"] = None) -> _Job:
+        start, end = self._cut_pos, self._window.end
+        if self._segmenter is not None:
+            span = self._segmenter.finish()
+            start, end = span if span is not None else (end, end)
+        self._cut_pos = self._window.end
+        return _Job(start, end, final_flush=True, done=done)
+
+    def _submit(self, job: _Job) -> None:
+        self._pending.append(job)
+        self._pending_samples += job.samples
+        backlog = self._pending_samples + self._inflight_samples
+        if not self._behind and backlog >= self._max_backlog_samples // 2:
+            self._behind = True
+            logging.warning(
+                "Whisper inference is %.1f s behind real time (RTF %.2f); applying %s policy.",
+                backlog / self.sample_rate,
+                self.real_time_factor,
+                self.config.backlog_policy.value,
             )
-        except Exception as exc:  # pylint: disable=broad-except
-            logging.exception("Whisper transcription failed: %s", exc)
-            raise WhisperBackendError("Whisper transcription failed.") from exc
+        if self._behind and self.config.backlog_policy is WhisperBacklogPolicy.SKIP:
+            self._drop_oldest(self._max_backlog_samples // 2)
+        self._drop_oldest(self._max_backlog_samples)
+        self.max_backlog_seconds_seen = max(self.max_backlog_seconds_seen, self.backlog_seconds)
+        self._wakeup.set()
 
-        start_time = self._processed_samples / self.sample_rate
-        end_time = (self._processed_samples + audio_int16.size) / self.sample_rate
-        self._processed_samples += audio_int16.size
+    def _drop_oldest(self, limit: int) -> None:
+        """Discard queued segments (never the newest or a flush) until the backlog fits."""
 
-        if segments_text:
-            await self._queue.put(
+        while (
+            self._pending_samples + self._inflight_samples > limit
+            and len(self._pending) > 1
+            and not self._pending[0].final_flush
+        ):
+            job = self._pending.popleft()
+            self._pending_samples -= job.samples
+            self.skipped_seconds += job.samples / self.sample_rate
+            logging.debug(
+                "Skipped %.1f s of audio at %.1f s to catch up with real time.",
+                job.samples / self.sample_rate,
+                job.start / self.sample_rate,
+            )
+
+    async def _run(self) -> None:
+        """Worker task: feed queued segments to the inference executor in order."""
+
+        while True:
+            while not self._pending:
+                if self._stopping:
+                    return
+                self._wakeup.clear()
+                await self._wakeup.wait()
+            job = self._pending.popleft()
+            self._pending_samples -= job.samples
+            self._inflight_samples = job.samples
+            self._inflight_start = job.start
+            try:
+                await self._transcribe_job(job)
+            except WhisperBackendError as exc:
+                self._worker_error = exc
+                self._inflight_samples = 0
+                self._inflight_start = None
+                for leftover in (job, *self._pending):
+                    if leftover.done is not None and not leftover.done.done():
+                        leftover.done.set_result(None)
+                self._pending.clear()
+                self._pending_samples = 0
+                self._queue.put_nowait(None)
+                return
+            self._inflight_samples = 0
+            self._inflight_start = None
+            if job.done is not None:
+                self._queue.put_nowait(None)
+                if not job.done.done():
+                    job.done.set_result(None)
+            if self._behind and self._pending_samples <= self._segment_samples:
+                self._behind = False
+                logging.info(
+                    "Whisper inference caught up with real time (RTF %.2f).",
+                    self.real_time_factor,
+                )
+
+    async def _run_streaming(self) -> None:
+        """Worker task: re-decode the sliding window and commit agreed words."""
+
+        while True:
+            finishing = bool(self._flush_waiters) or self._stopping
+            closed, self._utterance_closed = self._utterance_closed, False
+            if not (finishing or closed) and self._pending_samples < self._interval_samples:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            waiters, self._flush_waiters = self._flush_waiters, []
+            try:
+                await self._decode_window(final=finishing or closed)
+            except WhisperBackendError as exc:
+                self._worker_error = exc
+                for waiter in (*waiters, *self._flush_waiters):
+                    if not waiter.done():
+                        waiter.set_result(None)
+                self._queue.put_nowait(None)
+                return
+            if waiters:
+                self._queue.put_nowait(None)
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(None)
+            if self._stopping and not self._flush_waiters:
+                return
+
+    async def _decode_window(self, final: bool) -> None:
+        window = self._window
+        window_start = window.start
+        words: List[_Word] = []
+        segmenter = self._segmenter
+        if segmenter is not None and segmenter.last_speech_end <= window_start:
+            # No speech anywhere in the window: nothing worth decoding.
+            if self._pending_samples:
+                self.silent_windows += 1
+            self._pending_samples = 0
+        if self._pending_samples and len(window):
+            audio = window.view(window_start, window.end)
+            new_samples, self._pending_samples = self._pending_samples, 0
+            self._inflight_samples = new_samples
+            self._inflight_start = window_start
+            started = time.perf_counter()
+            offset = window_start / self.sample_rate
+            try:
+                words = [
+                    _Word(offset + start, offset + end, text)
+                    for start, end, text in await self._infer(
+                        audio, words=True, prompt=self._agreement.prompt
+                    )
+                ]
+            except WhisperWorkerCrashed as exc:
+                logging.error("Skipping window decode: %s", exc)
+            finally:
+                self._inflight_samples = 0
+                self._inflight_start = None
+            self.inference_seconds += time.perf_counter() - started
+            self.transcribed_seconds += new_samples / self.sample_rate
+            self.window_decodes += 1
+            window_samples = audio.size
+            committed = self._agreement.insert(words)
+        else:
+            window_samples = len(window)
+            self._pending_samples = 0
+            committed = []
+        window_end = window_start + window_samples
+
+        forced = final or window_samples >= self._window_samples
+        if forced:
+            committed += self._agreement.commit_all()
+        if committed:
+            self._queue.put_nowait(
                 TranscriptSegment(
-                    text=segments_text,
+                    text=" ".join(word.text for word in committed),
                     is_final=True,
                     speaker=None,
-                    start_time=start_time,
-                    end_time=end_time,
+                    start_time=committed[0].start,
+                    end_time=committed[-1].end,
                 )
             )
-        elif final_flush:
-            # Emit silence marker to signal end.
-            await self._queue.put(
+        tentative = self._agreement.tentative_text
+        if tentative != self._last_partial:
+            self._last_partial = tentative
+            self._queue.put_nowait(TranscriptSegment(text=tentative, is_final=False))
+
+        if final:
+            cut = window_end
+        elif committed and (forced or window_samples > self._window_samples // 2):
+            cut = int(committed[-1].end * self.sample_rate)
+        elif forced or not words:
+            # Nothing (new) said: keep a second in case a word is just starting.
+            cut = window_end - self.sample_rate
+        else:
+            return
+        self._trim_window(min(cut, window_end))
+
+    def _trim_window(self, upto_sample: int) -> None:
+        self._window.discard_until(upto_sample)
+        self._pending_samples = min(self._pending_samples, len(self._window))
+
+    async def _transcribe_job(self, job: _Job) -> None:
+        start, end = max(job.start, self._window.start), job.end
+        if end <= start:
+            return
+        fallback = False
+        if self._behind and not job.final_flush:
+            policy = self.config.backlog_policy
+            if policy is WhisperBacklogPolicy.SHORTEN:
+                window = int(self.config.shortened_window_seconds * self.sample_rate)
+                if end - start > window:
+                    self.shortened_seconds += (end - start - window) / self.sample_rate
+                    start = end - window
+            elif policy is WhisperBacklogPolicy.DOWNGRADE and self._fallback_ready:
+                fallback = True
+                self.fallback_segments += 1
+
+        started = time.perf_counter()
+        try:
+            segments_text = await self._infer(self._window.view(start, end), fallback=fallback)
+        except WhisperWorkerCrashed as exc:
+            logging.error("Skipping %.1f s segment: %s", (end - start) / self.sample_rate, exc)
+            self.skipped_seconds += (end - start) / self.sample_rate
+            if not job.final_flush:
+                return
+            segments_text = ""
+        self.inference_seconds += time.perf_counter() - started
+        self.transcribed_seconds += (end - start) / self.sample_rate
+
+        start_time = start / self.sample_rate
+        end_time = end / self.sample_rate
+        if segments_text or job.final_flush:
+            # An empty final after a flush signals the end of the stream.
+            self._queue.put_nowait(
                 TranscriptSegment(
-                    text="",
+                    text=segments_text,
                     is_final=True,
                     speaker=None,
                     start_time=start_time,
@@ -119,18 +626,47 @@ class WhisperStreamingBackend(StreamingTranscriptionBackend):
                 )
             )
 
-    def _run_transcription(self, audio: np.ndarray) -> str:
-        segments, _info = self._model.transcribe(
-            audio=audio,
-            language=self.config.language,
-            beam_size=self.config.beam_size,
-            vad_filter=self.config.vad_filter,
-            condition_on_previous_text=False,
-        )
+    def _load_model(self, model_size: str) -> WhisperModel:
+        try:
+            return WhisperModel(
+                model_size_or_path=model_size,
+                device=self.config.device,
+                compute_type=self.config.compute_type,
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            raise WhisperBackendError(f"Failed to load Whisper model: {exc}") from exc
+
+    def _load_fallback(self) -> None:
+        try:
+            self._fallback_model = self._load_model(self.config.fallback_model_size)
+            self._fallback_ready = True
+        except WhisperBackendError as exc:
+            logging.warning("%s; downgrade policy will only drop segments.", exc)
 
-        texts = []
-        for segment in segments:
-            text = segment.text.strip()
-            if text:
-                texts.append(text)
-        return " ".join(texts).strip()
+    async def _infer(
+        self, audio: np.ndarray, fallback: bool = False, words: bool = False, prompt: str = ""
+    ) -> Any:
+        """Transcribe ``audio`` on the worker pool or the in-process executor."""
+
+        options = {
+            "language": self.config.language,
+            "beam_size": self.config.beam_size,
+            "vad_filter": self.config.vad_filter,
+        }
+        try:
+            loop = asyncio.get_running_loop()
+            if self._pool is not None:
+                size = self.config.fallback_model_size if fallback else self.config.model_size
+                call = partial(self._pool.transcribe, audio, size, options, words, prompt)
+                return await loop.run_in_executor(self._pool.executor, call)
+            model = self._fallback_model if fallback else self._model
+            if words:
+                call = partial(transcribe_words, model, audio, options, prompt)
+            else:
+                call = partial(transcribe_text, model, audio, options)
+            return await loop.run_in_executor(self._executor, call)
+        except WhisperWorkerCrashed:
+            raise
+        except Exception as exc:  # pylint: disable=broad-except
+            logging.exception("Whisper transcription failed: %s", exc)
+            raise WhisperBackendError("Whisper transcription failed.") from exc
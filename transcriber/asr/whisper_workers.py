@@ -0,0 +1,377 @@
+"""Out-of-process faster-whisper inference workers."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from faster_whisper import WhisperModel  # type: ignore
+
+_SAMPLE_RATE = 16_000
+# Shared input blocks are sized in whole units of Whisper's 30 s window and
+# replaced by a larger block when a longer input comes along.
+_BLOCK_SAMPLES = 30 * _SAMPLE_RATE
+
+WordTuple = Tuple[float, float, str]
+
+
+class WhisperWorkerError(Exception):
+    """Raised when the inference worker pool cannot serve a request."""
+
+
+class WhisperWorkerCrashed(WhisperWorkerError):
+    """Raised when a request kept crashing its worker process (or it could not respawn)."""
+
+
+def transcribe_text(model: WhisperModel, audio: np.ndarray, options: Dict[str, Any]) -> str:
+    """Transcribe ``audio`` and return the joined, stripped segment texts."""
+
+    segments, _info = model.transcribe(audio=audio, condition_on_previous_text=False, **options)
+    texts = []
+    for segment in segments:
+        text = segment.text.strip()
+        if text:
+            texts.append(text)
+    return " ".join(texts).strip()
+
+
+def transcribe_words(
+    model: WhisperModel, audio: np.ndarray, options: Dict[str, Any], prompt: str
+) -> List[WordTuple]:
+    """Transcribe ``audio`` with word timestamps relative to its first sample."""
+
+    segments, _info = model.transcribe(
+        audio=audio,
+        condition_on_previous_text=False,
+        initial_prompt=prompt or None,
+        word_timestamps=True,
+        **options,
+    )
+    words: List[WordTuple] = []
+    for segment in segments:
+        for word in segment.words or ():
+            text = word.word.strip()
+            if text:
+                words.append((word.start, word.end, text))
+    return words
+
+
+def _worker_main(
+    conn: Connection,
+    shm_name: str,
+    device: str,
+    compute_type: str,
+    preload: Sequence[str],
+) -> None:
+    """Worker process: keep models resident and transcribe audio from shared memory."""
+
+    shm = SharedMemory(name=shm_name)
+    audio = np.ndarray((shm.size // 4,), dtype=np.float32, buffer=shm.buf)
+    models: Dict[str, WhisperModel] = {}
+
+    def model_for(size: str) -> WhisperModel:
+        model = models.get(size)
+        if model is None:
+            model = WhisperModel(
+                model_size_or_path=size, device=device, compute_type=compute_type
+            )
+            models[size] = model
+        return model
+
+    try:
+        for size in preload:
+            model_for(size)
+    except Exception as exc:  # pylint: disable=broad-except
+        conn.send(("error", f"Failed to load Whisper model: {exc}"))
+        return
+    conn.send(("ready", None))
+    try:
+        while True:
+            try:
+                request = conn.recv()
+            except EOFError:
+                return
+            if request is None:
+                return
+            name, size, samples, options, words, prompt = request
+            if name != shm.name:
+                # The parent grew the input block; the old one is already unlinked.
+                del audio
+                shm.close()
+                shm = SharedMemory(name=name)
+                audio = np.ndarray((shm.size // 4,), dtype=np.float32, buffer=shm.buf)
+            try:
+                model = model_for(size)
+                if words:
+                    result: Any = transcribe_words(model, audio[:samples], options, prompt)
+                else:
+                    result = transcribe_text(model, audio[:samples], options)
+            except Exception as exc:  # pylint: disable=broad-except
+                conn.send(("error", f"{type(exc).__name__}: {exc}"))
+            else:
+                conn.send(("ok", result))
+    finally:
+        del audio
+        shm.close()
+
+
+class _Worker:
+    """One worker process with its shared-memory input block."""
+
+    def __init__(self, name: str, device: str, compute_type: str, preload: Sequence[str]) -> None:
+        self.name = name
+        self._args = (device, compute_type, tuple(preload))
+        self._shm = SharedMemory(create=True, size=_BLOCK_SAMPLES * 4)
+        self._audio = np.ndarray((_BLOCK_SAMPLES,), dtype=np.float32, buffer=self._shm.buf)
+        self._conn: Optional[Connection] = None
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+
+    def start(self) -> None:
+        """Spawn the process and wait until its models are loaded."""
+
+        ctx = multiprocessing.get_context("spawn")
+        parent, child = ctx.Pipe()
+        process = ctx.Process(
+            target=_worker_main,
+            args=(child, self._shm.name, *self._args),
+            name=self.name,
+            daemon=True,
+        )
+        started = time.perf_counter()
+        process.start()
+        child.close()
+        self._conn, self._process = parent, process
+        try:
+            status, detail = parent.recv()
+        except (EOFError, OSError) as exc:
+            self.stop()
+            raise WhisperWorkerError(
+                f"{self.name} exited during start-up (code {process.exitcode})"
+            ) from exc
+        if status != "ready":
+            self.stop()
+            raise WhisperWorkerError(f"{self.name}: {detail}")
+        logging.info(
+            "Whisper worker %s (pid %s) ready in %.1f s.",
+            self.name,
+            process.pid,
+            time.perf_counter() - started,
+        )
+
+    def run(self, audio: np.ndarray, request: Tuple[Any, ...]) -> Any:
+        """Copy ``audio`` into shared memory and return the worker's result.
+
+        Raises :class:`EOFError` or :class:`OSError` when the process died.
+        """
+
+        if self._conn is None:
+            raise WhisperWorkerError(f"{self.name} is not running")
+        samples = audio.size
+        self._reserve(samples)
+        self._audio[:samples] = audio
+        self._conn.send((self._shm.name, request[0], samples, *request[1:]))
+        status, payload = self._conn.recv()
+        if status != "ok":
+            raise WhisperWorkerError(f"{self.name}: {payload}")
+        return payload
+
+    def _reserve(self, samples: int) -> None:
+        """Replace the shared block with a larger one if ``samples`` do not fit."""
+
+        if samples <= self._audio.size:
+            return
+        blocks = -(-samples // _BLOCK_SAMPLES)
+        shm = SharedMemory(create=True, size=blocks * _BLOCK_SAMPLES * 4)
+        del self._audio
+        self._shm.close()
+        # The worker keeps its mapping until it attaches to the new block.
+        self._shm.unlink()
+        self._shm = shm
+        self._audio = np.ndarray((blocks * _BLOCK_SAMPLES,), dtype=np.float32, buffer=shm.buf)
+
+    def stop(self) -> None:
+        conn, process = self._conn, self._process
+        self._conn = self._process = None
+        if conn is not None:
+            try:
+                conn.send(None)
+            except (OSError, ValueError):
+                pass
+            conn.close()
+        if process is not None:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.kill()
+                process.join()
+
+    def close(self) -> None:
+        self.stop()
+        del self._audio
+        self._shm.close()
+        self._shm.unlink()
+
+
+class WhisperWorkerPool:
+    """Worker processes that each keep a ``WhisperModel`` resident.
+
+    Audio is handed over through a per-worker shared-memory block, grown
+    as needed so inputs are never cut, and only the small request and
+    result cross the pipe. Requests from any number of backends are spread
+    over idle workers; one that dies (e.g. a native crash in CTranslate2)
+    is respawned and the request retried once, so the pipeline carries on
+    without reloading. A worker that cannot be respawned is retired; once
+    none are left every request fails with :class:`WhisperWorkerError`.
+    Methods block; from the event loop submit :meth:`transcribe` to
+    :attr:`executor`, which has one thread per worker, so waiting requests
+    queue there instead of parking threads in the loop's default executor.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        device: str,
+        compute_type: str,
+        preload: Sequence[str],
+    ) -> None:
+        self.size = workers
+        self._worker_args = (device, compute_type, tuple(preload))
+        self._lock = threading.Lock()
+        self._workers: List[_Worker] = []
+        # ``None`` marks a pool whose workers have all been retired.
+        self._idle: "queue.Queue[Optional[_Worker]]" = queue.Queue()
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="whisper-pool")
+        self.restarts = 0
+        self.failed_requests = 0
+
+    def start(self) -> None:
+        """Spawn the workers (once) and wait for their models to load."""
+
+        with self._lock:
+            if self._workers:
+                return
+            workers = [
+                _Worker(f"whisper-worker-{index}", *self._worker_args)
+                for index in range(self.size)
+            ]
+            errors: List[str] = []
+
+            def start_one(worker: _Worker) -> None:
+                try:
+                    worker.start()
+                except WhisperWorkerError as exc:
+                    errors.append(str(exc))
+
+            # Models load in parallel; each worker reads the files independently.
+            threads = [threading.Thread(target=start_one, args=(w,)) for w in workers]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            if errors:
+                for worker in workers:
+                    worker.close()
+                raise WhisperWorkerError(errors[0])
+            self._workers = workers
+            for worker in workers:
+                self._idle.put(worker)
+
+    def transcribe(
+        self,
+        audio: np.ndarray,
+        model_size: str,
+        options: Dict[str, Any],
+        words: bool = False,
+        prompt: str = "",
+    ) -> Any:
+        """Run one request on the next idle worker (blocking)."""
+
+        worker = self._idle.get()
+        if worker is None:
+            self._idle.put(None)
+            raise WhisperWorkerError("No Whisper workers left; all failed to respawn.")
+        request = (model_size, options, words, prompt)
+        alive = True
+        try:
+            try:
+                return worker.run(audio, request)
+            except (EOFError, OSError) as exc:
+                alive = self._restart(worker, exc)
+                if not alive:
+                    raise self._crashed(worker, audio) from exc
+            try:
+                return worker.run(audio, request)
+            except (EOFError, OSError) as exc:
+                alive = self._restart(worker, exc)
+                raise self._crashed(worker, audio) from exc
+        finally:
+            if alive:
+                self._idle.put(worker)
+
+    def _crashed(self, worker: _Worker, audio: np.ndarray) -> WhisperWorkerCrashed:
+        self.failed_requests += 1
+        return WhisperWorkerCrashed(
+            f"{worker.name} crashed on a {audio.size / _SAMPLE_RATE:.1f} s input"
+        )
+
+    def _restart(self, worker: _Worker, exc: BaseException) -> bool:
+        """Respawn a dead worker; retire it and return ``False`` if that fails."""
+
+        logging.error("Whisper worker %s died (%r); restarting it.", worker.name, exc)
+        self.restarts += 1
+        worker.stop()
+        try:
+            worker.start()
+        except WhisperWorkerError as start_exc:
+            logging.error("Could not respawn %s (%s); retiring it.", worker.name, start_exc)
+            with self._lock:
+                if worker in self._workers:
+                    self._workers.remove(worker)
+                    worker.close()
+                if not self._workers:
+                    self._idle.put(None)
+            return False
+        return True
+
+    def close(self) -> None:
+        with self._lock:
+            workers, self._workers = self._workers, []
+            for worker in workers:
+                worker.close()
+            # Release any request still waiting for a worker.
+            self._idle.put(None)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pools: Dict[Tuple[Any, ...], WhisperWorkerPool] = {}
+_pools_lock = threading.Lock()
+
+
+def shared_worker_pool(
+    workers: int, device: str, compute_type: str, preload: Sequence[str]
+) -> WhisperWorkerPool:
+    """The process-wide pool for these settings, shared by every backend using them."""
+
+    key = (workers, device, compute_type, tuple(preload))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = WhisperWorkerPool(workers, device, compute_type, preload)
+        return pool
+
+
+@atexit.register
+def _close_pools() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -4,15 +4,28 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import queue
+import threading
 import time
 from contextlib import asynccontextmanager
-from array import array
-from typing import AsyncGenerator, List, Optional
+from typing import AsyncGenerator, Dict, List, Optional
 
-import sounddevice as sd
+import numpy as np
 
+try:
+    import sounddevice as sd
+except (ImportError, OSError) as _sd_exc:  # pragma: no cover - depends on host audio stack
+    # Allow file replay and tooling on hosts without PortAudio.
+    sd = None
+    _SOUNDDEVICE_IMPORT_ERROR: Optional[Exception] = _sd_exc
+else:
+    _SOUNDDEVICE_IMPORT_ERROR = None
+
+from .capture_metrics import CaptureMetrics
 from .config import AudioInputConfig
+from .devices import DeviceRegistry
+from .dsp import CaptureDSP, pcm16_view
+from .resample import PolyphaseResampler
+from .ringbuffer import AudioRingBuffer
 
 
 class AudioCaptureError(Exception):
@@ -22,10 +35,47 @@ class AudioCaptureError(Exception):
 class AudioChunkStream:
     """Async iterator producing raw PCM audio chunks with automatic device reconnection."""
 
-    def __init__(self, config: AudioInputConfig, check_interval: float = 2.0) -> None:
+    def __init__(
+        self,
+        config: AudioInputConfig,
+        check_interval: float = 2.0,
+        registry: Optional[DeviceRegistry] = None,
+        output_sample_rate: Optional[int] = None,
+    ) -> None:
         self.config = config
-        self._queue: "queue.Queue[bytes]" = queue.Queue(maxsize=10)
+        # Rate of the chunks handed to consumers; capture may run at another
+        # rate (see ``native_sample_rate``) and is resampled in the callback.
+        self.output_sample_rate = output_sample_rate or self.config.sample_rate
+        self._devices = registry or DeviceRegistry(
+            poll_interval=check_interval, max_poll_interval=max(10.0, 5 * check_interval)
+        )
+        self._frames_per_chunk = int(
+            self.output_sample_rate * self.config.chunk_duration_seconds
+        )
+        self._ring = AudioRingBuffer(
+            max(
+                int(self.output_sample_rate * self.config.buffer_seconds),
+                2 * max(self._frames_per_chunk, 1),
+            )
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._data_ready = asyncio.Event()
+        self._wakeup_pending = False
+        # Buffered samples the waiting consumer needs before it is woken.
+        self._wake_threshold = max(self._frames_per_chunk, 1)
         self._stream: Optional[sd.RawInputStream] = None
+        self._producer_lock = threading.Lock()
+        self._generation = 0
+        self._active_generation = 0
+        self._pending_generation: Optional[int] = None
+        self._crossfade_samples = int(
+            self.output_sample_rate * self.config.switch_crossfade_ms / 1000.0
+        )
+        # Per-stream resamplers keyed by generation; each device may capture
+        # at a different native rate.
+        self._resamplers: Dict[int, PolyphaseResampler] = {}
+        self._capture_rates: Dict[int, int] = {}
+        self.metrics = CaptureMetrics(self._ring.capacity, self.output_sample_rate)
         self._stopped = asyncio.Event()
         self._check_interval = check_interval
         self._current_device: Optional[int] = None
@@ -35,93 +85,132 @@ class AudioChunkStream:
         self._last_chunk_time: float = 0.0
         self._chunk_timeout: float = 5.0  # Consider stream dead if no chunks for 5 seconds
         self._last_missing_device_index: Optional[int] = None
+        try:
+            self._dsp = CaptureDSP(
+                channels=self.config.channels,
+                channel_weights=self.config.channel_weights,
+                remove_dc=self.config.remove_dc_offset,
+                gain_db=self.config.gain_db,
+            )
+        except ValueError as exc:
+            raise AudioCaptureError(f"Invalid audio DSP configuration: {exc}") from exc
         self._needs_downmix = self.config.channels > 1
         self._downmix_warning_logged = False
         self._fatal_error: Optional[AudioCaptureError] = None
 
+    @property
+    def devices(self) -> DeviceRegistry:
+        """Device registry backing device lookups for this stream."""
+
+        return self._devices
+
     def _get_default_input_device(self) -> Optional[int]:
-        """Best-effort lookup of the current system default input device."""
-        try:
-            default_input = sd.query_devices(kind="input")
-            if default_input:
-                return default_input.get("index")
-        except Exception as exc:
-            logging.warning("Failed to query default input device: %s", exc)
-        return None
+        """Current system default input device according to the cached device table."""
+        return self._devices.snapshot.default_input
 
     def _get_effective_device(self) -> Optional[int]:
         """Get the device index to use (configured or system default)."""
         if self.config.device_index is not None:
-            try:
-                sd.query_devices(self.config.device_index, kind="input")
+            if self._devices.snapshot.is_input(self.config.device_index):
                 self._last_missing_device_index = None
                 return self.config.device_index
-            except Exception as exc:
-                if self._last_missing_device_index != self.config.device_index:
-                    logging.warning(
-                        "Configured audio device index %s unavailable (%s); falling back to default.",
-                        self.config.device_index,
-                        exc,
-                    )
-                    self._last_missing_device_index = self.config.device_index
+            if self._last_missing_device_index != self.config.device_index:
+                logging.warning(
+                    "Configured audio device index %s unavailable; falling back to default.",
+                    self.config.device_index,
+                )
+                self._last_missing_device_index = self.config.device_index
         return self._get_default_input_device()
 
-    def _callback(self, indata: bytes, frames: int, _time, status: sd.CallbackFlags) -> None:
-        if status:
-            if status.input_overflow:
-                logging.warning("Audio stream input overflow")
-            elif status.input_underflow:
-                logging.warning("Audio stream input underflow")
+    def _make_callback(self, generation: int):
+        def callback(indata: bytes, frames: int, time_info, status: sd.CallbackFlags) -> None:
+            self._callback(indata, frames, time_info, status, generation=generation)
+
+        return callback
+
+    def _callback(
+        self,
+        indata: bytes,
+        frames: int,
+        _time,
+        status: sd.CallbackFlags,
+        generation: int = 0,
+    ) -> None:
+        crossfade = False
+        # During a device switch two streams briefly run side by side; the
+        # lock keeps the ring buffer single-producer while they overlap.
+        with self._producer_lock:
+            if generation != self._active_generation:
+                if generation != self._pending_generation:
+                    return  # Stream being torn down; its audio is superseded.
+                # First block from the replacement stream: take over in place.
+                self._active_generation = generation
+                self._pending_generation = None
+                crossfade = True
+                self.metrics.restart_interval()
+
+            if status:
+                if status.input_overflow:
+                    self.metrics.overflows += 1
+                    logging.warning("Audio stream input overflow")
+                elif status.input_underflow:
+                    self.metrics.underflows += 1
+                    logging.warning("Audio stream input underflow")
+                else:
+                    self.metrics.status_errors += 1
+                    logging.warning("Audio stream status: %s", status)
+                    # Signal that stream may need restart
+                    self._stream_error.set()
+
+            # Update last chunk timestamp
+            self._last_chunk_time = time.time()
+
+            if self._dsp.is_passthrough:
+                samples = pcm16_view(indata)
             else:
-                logging.warning("Audio stream status: %s", status)
-                # Signal that stream may need restart
-                self._stream_error.set()
+                if self._needs_downmix and not self._downmix_warning_logged:
+                    logging.info(
+                        "Downmixing %s-channel audio to mono to satisfy backend requirements.",
+                        self.config.channels,
+                    )
+                    self._downmix_warning_logged = True
+                samples = self._dsp.process(indata)
 
-        # Update last chunk timestamp
-        self._last_chunk_time = time.time()
+            resampler = self._resamplers.get(generation)
+            if resampler is not None:
+                samples = resampler.process(samples)
 
-        chunk = bytes(indata)
-        if self._needs_downmix:
-            if not self._downmix_warning_logged:
-                logging.info(
-                    "Downmixing %s-channel audio to mono to satisfy backend requirements.",
-                    self.config.channels,
-                )
-                self._downmix_warning_logged = True
-            chunk = self._downmix_to_mono(chunk)
+            if crossfade:
+                accepted = self._ring.write_crossfade(samples, self._crossfade_samples)
+            else:
+                accepted = self._ring.write(samples)
+            self.metrics.record_callback(
+                frames,
+                self._capture_rates.get(generation, self.config.sample_rate),
+                self._ring.available,
+                self._ring.dropped_samples,
+            )
+        if accepted < samples.size:
+            logging.debug(
+                "Audio ring buffer full; dropped %d samples (%d total).",
+                samples.size - accepted,
+                self._ring.dropped_samples,
+            )
+        if self._ring.available >= self._wake_threshold and not self._wakeup_pending:
+            loop = self._loop
+            if loop is not None:
+                self._wakeup_pending = True
+                try:
+                    loop.call_soon_threadsafe(self._wake_consumer)
+                except RuntimeError:
+                    # Event loop already closed during shutdown.
+                    self._wakeup_pending = False
 
-        try:
-            self._queue.put_nowait(chunk)
-        except queue.Full:
-            # Drop oldest chunk to prevent runaway latency.
-            try:
-                _ = self._queue.get_nowait()
-                self._queue.put_nowait(chunk)
-                logging.debug("Dropped one audio chunk to keep up with realtime processing.")
-            except queue.Empty:
-                logging.debug("Audio buffer overflow handled, but queue empty when trimming.")
-
-    def _downmix_to_mono(self, data: bytes) -> bytes:
-        """Average multi-channel int16 PCM data down to mono."""
-
-        sample_width = 2  # pcm_s16le
-        total_samples = len(data) // sample_width
-        channels = max(1, self.config.channels)
-        if channels == 1 or total_samples == 0:
-            return data
-
-        frames = total_samples // channels
-        src = array("h")
-        src.frombytes(data)
-        mono = array("h", [0]) * frames
-        idx = 0
-        for frame in range(frames):
-            acc = 0
-            for _ in range(channels):
-                acc += src[idx]
-                idx += 1
-            mono[frame] = int(acc / channels)
-        return mono.tobytes()
+    def _wake_consumer(self) -> None:
+        """Runs on the event loop: signal that the waiter's frames are buffered."""
+
+        self._wakeup_pending = False
+        self._data_ready.set()
 
     def _device_label(self, device: Optional[int]) -> str:
         """Human readable label for logging."""
@@ -129,55 +218,78 @@ class AudioChunkStream:
             return "system default input"
         return f"device index {device}"
 
-    def _open_stream(self, frames_per_chunk: int, device: Optional[int]) -> None:
-        """Instantiate and start the RawInputStream for a specific device."""
-        device_info = None
-        if device is not None:
-            device_info = sd.query_devices(device, kind="input")
-        else:
-            try:
-                device_info = sd.query_devices(kind="input")
-            except Exception:
-                device_info = None
+    def _capture_rate(self, device_info: Optional[dict]) -> int:
+        """Sample rate to open the device at."""
+        if self.config.native_sample_rate and device_info:
+            native = int(device_info.get("default_samplerate") or 0)
+            if native > 0:
+                return native
+        return self.config.sample_rate
+
+    def _open_stream(self, device: Optional[int], generation: int) -> sd.RawInputStream:
+        """Instantiate and start a RawInputStream for a specific device (blocking)."""
+        snapshot = self._devices.snapshot
+        device_info = snapshot.get(device if device is not None else snapshot.default_input)
 
         device_name = device_info.get("name") if device_info else "default"
-        logging.info("Starting audio stream on %s (%s)", device_name, self._device_label(device))
-
-        stream = sd.RawInputStream(
-            samplerate=self.config.sample_rate,
-            channels=self.config.channels,
-            dtype="int16",
-            callback=self._callback,
-            blocksize=(
-                frames_per_chunk if self.config.blocksize is None else self.config.blocksize
-            ),
-            device=device,
+        capture_rate = self._capture_rate(device_info)
+        logging.info(
+            "Starting audio stream on %s (%s) at %d Hz",
+            device_name,
+            self._device_label(device),
+            capture_rate,
         )
+
+        self._capture_rates[generation] = capture_rate
+        if capture_rate != self.output_sample_rate:
+            self._resamplers[generation] = PolyphaseResampler(
+                capture_rate, self.output_sample_rate
+            )
+            logging.info(
+                "Resampling capture audio %d Hz -> %d Hz.", capture_rate, self.output_sample_rate
+            )
+        else:
+            self._resamplers.pop(generation, None)
+
         try:
-            stream.start()
+            stream = sd.RawInputStream(
+                samplerate=capture_rate,
+                channels=self.config.channels,
+                dtype="int16",
+                callback=self._make_callback(generation),
+                blocksize=(
+                    int(capture_rate * self.config.chunk_duration_seconds)
+                    if self.config.blocksize is None
+                    else self.config.blocksize
+                ),
+                device=device,
+            )
+            try:
+                stream.start()
+            except Exception:
+                stream.close()
+                raise
         except Exception:
-            stream.close()
+            self._resamplers.pop(generation, None)
+            self._capture_rates.pop(generation, None)
             raise
 
-        self._stream = stream
-        self._current_device = device
-        self._stream_error.clear()
-        self._last_chunk_time = time.time()
         logging.info("Audio stream started successfully on %s", device_name)
+        return stream
 
-    def _start_stream(self, device: Optional[int]) -> None:
-        """Start the audio stream with the specified device."""
-        frames_per_chunk = int(self.config.sample_rate * self.config.chunk_duration_seconds)
-        if frames_per_chunk <= 0:
-            raise AudioCaptureError("Chunk duration and sample rate produce zero frames.")
-
-        if self._stream is not None:
-            try:
-                self._stream.stop()
-                self._stream.close()
-            except Exception as exc:
-                logging.debug("Error closing old stream: %s", exc)
+    @staticmethod
+    def _close_stream(stream: sd.RawInputStream) -> None:
+        """Stop and close a stream (blocking; run off the event loop)."""
+        try:
+            stream.stop()
+            stream.close()
+        except Exception as exc:  # noqa: BLE001
+            logging.debug("Error closing old stream: %s", exc)
 
+    def _open_first_available(
+        self, device: Optional[int], generation: int
+    ) -> tuple[sd.RawInputStream, Optional[int]]:
+        """Try the requested device and fallbacks in order (blocking)."""
         attempt_devices: List[Optional[int]] = []
 
         def add_candidate(candidate: Optional[int]) -> None:
@@ -196,8 +308,7 @@ class AudioChunkStream:
         last_exc: Optional[Exception] = None
         for candidate in attempt_devices:
             try:
-                self._open_stream(frames_per_chunk, candidate)
-                return
+                return self._open_stream(candidate, generation), candidate
             except Exception as exc:
                 last_exc = exc
                 logging.warning(
@@ -208,6 +319,70 @@ class AudioChunkStream:
 
         raise AudioCaptureError(f"Failed to initialise audio input: {last_exc}") from last_exc
 
+    async def _start_stream(self, device: Optional[int], gapless: bool = True) -> None:
+        """Start the audio stream on ``device``, replacing any running stream.
+
+        Opening and closing PortAudio streams happens in worker threads so the
+        event loop keeps serving WebSocket and caption traffic. With
+        ``gapless`` the new stream is started while the old one is still
+        capturing; the first block from the new stream takes over the ring
+        buffer with a short crossfade, and only then is the old stream closed.
+        Without it (e.g. the old stream has failed) the new stream takes over
+        as soon as it is open.
+        """
+        if self._frames_per_chunk <= 0:
+            raise AudioCaptureError("Chunk duration and sample rate produce zero frames.")
+
+        old_stream = self._stream
+        reconnect_started = time.monotonic() if old_stream is not None else None
+        self._generation += 1
+        generation = self._generation
+        self._pending_generation = generation
+
+        try:
+            try:
+                stream, opened_device = await asyncio.to_thread(
+                    self._open_first_available, device, generation
+                )
+            except AudioCaptureError:
+                if old_stream is None:
+                    raise
+                # Some devices cannot be opened twice; release the old stream and retry.
+                logging.info("Closing previous stream before retrying audio device open.")
+                self._stream = None
+                await asyncio.to_thread(self._close_stream, old_stream)
+                old_stream = None
+                stream, opened_device = await asyncio.to_thread(
+                    self._open_first_available, device, generation
+                )
+        except BaseException:
+            if self._pending_generation == generation:
+                self._pending_generation = None
+            raise
+
+        if old_stream is not None and gapless:
+            deadline = time.monotonic() + max(1.0, 2 * self.config.chunk_duration_seconds)
+            while self._active_generation != generation and time.monotonic() < deadline:
+                await asyncio.sleep(0.01)
+        if self._active_generation != generation:
+            with self._producer_lock:
+                self._active_generation = generation
+                self._pending_generation = None
+
+        self._stream = stream
+        self._current_device = opened_device
+        for stale in [key for key in self._resamplers if key != generation]:
+            del self._resamplers[stale]
+        for stale in [key for key in self._capture_rates if key != generation]:
+            del self._capture_rates[stale]
+        self._stream_error.clear()
+        self._last_chunk_time = time.time()
+        if reconnect_started is not None:
+            self.metrics.record_reconnect(time.monotonic() - reconnect_started)
+
+        if old_stream is not None:
+            await asyncio.to_thread(self._close_stream, old_stream)
+
     def _is_stream_alive(self) -> bool:
         """Check if the stream is receiving data."""
         if self._last_chunk_time == 0.0:
@@ -220,7 +395,9 @@ class AudioChunkStream:
         """Monitor for device changes and reconnect if necessary."""
         while not self._stopped.is_set():
             try:
-                await asyncio.sleep(self._check_interval)
+                # Wake early when the registry sees a device change; otherwise
+                # run the stream health checks every check interval.
+                await self._devices.wait_for_change(self._check_interval)
 
                 if self._stopped.is_set():
                     break
@@ -230,7 +407,7 @@ class AudioChunkStream:
                     logging.warning("Audio stream error detected, attempting reconnect...")
                     async with self._reconnect_lock:
                         try:
-                            self._start_stream(self._current_device)
+                            await self._start_stream(self._current_device, gapless=False)
                             logging.info("Audio stream reconnected after error")
                         except Exception as exc:
                             logging.error("Failed to reconnect after stream error: %s", exc)
@@ -246,16 +423,17 @@ class AudioChunkStream:
                     async with self._reconnect_lock:
                         try:
                             # Try to reconnect to current device first
-                            self._start_stream(self._current_device)
+                            await self._start_stream(self._current_device, gapless=False)
                             logging.info("Audio stream reconnected after timeout")
                         except Exception as exc:
                             logging.error("Failed to reconnect after timeout: %s", exc)
                             # If reconnect fails, try switching to a different available device
                             try:
+                                await self._devices.refresh_async()
                                 new_device = self._get_effective_device()
                                 if new_device != self._current_device:
                                     logging.info("Trying alternate device: %s", new_device)
-                                    self._start_stream(new_device)
+                                    await self._start_stream(new_device, gapless=False)
                             except Exception as retry_exc:
                                 logging.error("Failed to reconnect to alternate device: %s", retry_exc)
                                 self._register_fatal_error(AudioCaptureError(str(retry_exc)))
@@ -272,7 +450,7 @@ class AudioChunkStream:
                         )
                         async with self._reconnect_lock:
                             try:
-                                self._start_stream(current_default)
+                                await self._start_stream(current_default)
                                 logging.info("Audio stream reconnected to new device")
                             except Exception as exc:
                                 logging.error("Failed to reconnect to new device: %s", exc)
@@ -280,19 +458,15 @@ class AudioChunkStream:
                 else:
                     preferred = self.config.device_index
                     if preferred is not None and self._current_device != preferred:
-                        try:
-                            sd.query_devices(preferred, kind="input")
-                        except Exception:
-                            # Preferred device still unavailable; keep current fallback
-                            pass
-                        else:
+                        # Preferred device still unavailable; keep current fallback
+                        if self._devices.snapshot.is_input(preferred):
                             logging.info(
                                 "Configured audio device %s is available again; switching back.",
                                 preferred,
                             )
                             async with self._reconnect_lock:
                                 try:
-                                    self._start_stream(preferred)
+                                    await self._start_stream(preferred)
                                     self._last_missing_device_index = None
                                     logging.info(
                                         "Audio stream reconnected to configured device index %s",
@@ -317,43 +491,45 @@ class AudioChunkStream:
         self._stopped.set()
 
         if self._stream is not None:
-            try:
-                self._stream.stop()
-                self._stream.close()
-            except Exception as exc:  # noqa: BLE001
-                logging.debug("Error closing stream after fatal error: %s", exc)
-            finally:
-                self._stream = None
+            stream, self._stream = self._stream, None
+            self._active_generation = -1
+            if self._loop is not None:
+                self._loop.run_in_executor(None, self._close_stream, stream)
+            else:
+                self._close_stream(stream)
 
-        try:
-            self._queue.put_nowait(b"")
-        except queue.Full:
-            try:
-                self._queue.get_nowait()
-            except queue.Empty:
-                pass
-            try:
-                self._queue.put_nowait(b"")
-            except queue.Full:
-                pass
+        self._data_ready.set()
 
     @asynccontextmanager
     async def connect(self) -> AsyncGenerator["AudioChunkStream", None]:
         """Context manager that starts and stops the underlying audio stream."""
 
+        if sd is None:
+            raise AudioCaptureError(
+                f"sounddevice/PortAudio unavailable: {_SOUNDDEVICE_IMPORT_ERROR}"
+            )
+
         # Reset stop flag so the stream can be reused after a clean shutdown.
         self._stopped = asyncio.Event()
         self._fatal_error = None
 
-        # Drop any buffered chunks from a previous run before starting anew.
-        while not self._queue.empty():
-            try:
-                self._queue.get_nowait()
-            except queue.Empty:
-                break
-
+        # Drop any buffered audio from a previous run before starting anew.
+        self._ring.reset()
+        self._loop = asyncio.get_running_loop()
+        self._data_ready = asyncio.Event()
+        self._wakeup_pending = False
+
+        self._dsp.reset()
+        self._resamplers.clear()
+        self._capture_rates.clear()
+        self.metrics.reset()
+        await self._devices.start()
         initial_device = self._get_effective_device()
-        self._start_stream(initial_device)
+        try:
+            await self._start_stream(initial_device)
+        except BaseException:
+            await self._devices.stop()
+            raise
 
         # Start device monitoring task
         self._monitor_task = asyncio.create_task(
@@ -364,6 +540,7 @@ class AudioChunkStream:
             yield self
         finally:
             self._stopped.set()
+            self._data_ready.set()
 
             if self._monitor_task is not None:
                 self._monitor_task.cancel()
@@ -372,14 +549,11 @@ class AudioChunkStream:
                 except asyncio.CancelledError:
                     pass
                 self._monitor_task = None
+            await self._devices.stop()
 
             if self._stream is not None:
-                try:
-                    self._stream.stop()
-                    self._stream.close()
-                except Exception as exc:
-                    logging.debug("Error closing stream during cleanup: %s", exc)
-                self._stream = None
+                stream, self._stream = self._stream, None
+                await asyncio.to_thread(self._close_stream, stream)
 
     async def __anext__(self) -> bytes:
         return await self.next_chunk()
@@ -387,22 +561,43 @@ class AudioChunkStream:
     def __aiter__(self) -> "AudioChunkStream":
         return self
 
+    @property
+    def buffer(self) -> AudioRingBuffer:
+        """Ring buffer holding captured mono int16 samples.
+
+        Consumers that can work on memoryviews may call :meth:`wait_for_frames`
+        and then ``peek``/``consume`` directly instead of copying chunks.
+        """
+
+        return self._ring
+
+    async def wait_for_frames(self, frames: int) -> None:
+        """Wait until at least ``frames`` samples are buffered."""
+
+        if frames > self._ring.capacity:
+            raise AudioCaptureError(
+                f"Requested {frames} frames but ring buffer holds only {self._ring.capacity}."
+            )
+        while True:
+            if self._fatal_error is not None:
+                raise self._fatal_error
+            if self._ring.available >= frames:
+                return
+            if self._stopped.is_set():
+                raise StopAsyncIteration
+            # The PortAudio callback wakes us via call_soon_threadsafe once
+            # ``frames`` are buffered, so no executor thread is parked on a
+            # blocking get.
+            self._wake_threshold = max(frames, 1)
+            self._data_ready.clear()
+            await self._data_ready.wait()
+
     async def next_chunk(self) -> bytes:
         """Await the next audio chunk."""
 
-        if self._fatal_error is not None:
-            raise self._fatal_error
-
-        loop = asyncio.get_running_loop()
-        if self._stopped.is_set():
-            raise StopAsyncIteration
-        try:
-            chunk = await loop.run_in_executor(None, self._queue.get)
-        except Exception as exc:  # pylint: disable=broad-except
-            raise AudioCaptureError(f"Failed to read audio chunk: {exc}") from exc
-        if self._fatal_error is not None:
-            raise self._fatal_error
-        if not isinstance(chunk, (bytes, bytearray)):
-            # Defensive: ensure callers only receive raw bytes.
-            raise AudioCaptureError("Received non-bytes audio chunk from queue.")
-        return bytes(chunk)
+        await self.wait_for_frames(self._frames_per_chunk)
+        chunk = self._ring.read(self._frames_per_chunk)
+        if chunk is None:
+            raise AudioCaptureError("Audio ring buffer returned no data.")
+        self.metrics.record_levels(np.frombuffer(chunk, dtype=np.int16))
+        return chunk
@@ -0,0 +1,199 @@
+"""Telemetry for the audio capture path."""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+# Bucket upper bounds (ms) for callback jitter; the last bucket is open ended.
+DEFAULT_JITTER_BOUNDS_MS = (0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 250.0)
+
+_INT16_FULL_SCALE = 32768.0
+
+
+def _dbfs(level: float) -> float:
+    return 20.0 * math.log10(level / _INT16_FULL_SCALE) if level > 0 else -math.inf
+
+
+class Histogram:
+    """Fixed-bucket histogram with running count, mean and max."""
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = np.asarray(bounds, dtype=np.float64)
+        self.reset()
+
+    def reset(self) -> None:
+        self.counts = np.zeros(self.bounds.size + 1, dtype=np.int64)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        self.counts[int(np.searchsorted(self.bounds, value, side="left"))] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket containing quantile ``q`` (``inf`` for the overflow bucket)."""
+
+        if not self.count:
+            return 0.0
+        index = int(np.searchsorted(np.cumsum(self.counts), q * self.count, side="left"))
+        return float(self.bounds[index]) if index < self.bounds.size else math.inf
+
+    def as_dict(self) -> Dict[str, Any]:
+        labels = [f"<={bound:g}" for bound in self.bounds] + [f">{self.bounds[-1]:g}"]
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip(labels, self.counts.tolist())),
+        }
+
+
+class CaptureMetrics:
+    """Counters and distributions describing the health of live capture.
+
+    The audio callback records block timing, ring occupancy and status
+    flags; the consumer records per-chunk signal levels; the stream records
+    reconnects. Values are plain attributes updated without locking, which
+    is adequate for monitoring under the GIL. :meth:`snapshot` returns an
+    exportable dict and :meth:`describe` a one-line log summary.
+    """
+
+    def __init__(
+        self,
+        ring_capacity: int,
+        sample_rate: int,
+        jitter_bounds_ms: Sequence[float] = DEFAULT_JITTER_BOUNDS_MS,
+    ) -> None:
+        self.ring_capacity = ring_capacity
+        self.sample_rate = sample_rate
+        self.jitter_ms = Histogram(jitter_bounds_ms)
+        self.reset()
+
+    def reset(self) -> None:
+        self.started_at = time.time()
+        self.callbacks = 0
+        self.overflows = 0
+        self.underflows = 0
+        self.status_errors = 0
+        self.dropped_samples = 0
+        self.ring_samples = 0
+        self.ring_high_water = 0
+        self.reconnects = 0
+        self.reconnect_seconds_total = 0.0
+        self.reconnect_seconds_max = 0.0
+        self.last_reconnect_seconds: Optional[float] = None
+        self.chunks = 0
+        self.clipped_samples = 0
+        self.clipped_chunks = 0
+        self.last_rms_dbfs = -math.inf
+        self.last_peak_dbfs = -math.inf
+        self.peak_dbfs_max = -math.inf
+        self._energy_total = 0.0
+        self._level_samples = 0
+        self._last_callback: Optional[float] = None
+        self.jitter_ms.reset()
+
+    def record_callback(
+        self, frames: int, capture_rate: int, ring_samples: int, dropped_samples: int
+    ) -> None:
+        """Record one PortAudio block; jitter is measured against the nominal block period."""
+
+        now = time.perf_counter()
+        if self._last_callback is not None and capture_rate > 0:
+            expected = frames / capture_rate
+            self.jitter_ms.record(abs(now - self._last_callback - expected) * 1000.0)
+        self._last_callback = now
+        self.callbacks += 1
+        self.ring_samples = ring_samples
+        if ring_samples > self.ring_high_water:
+            self.ring_high_water = ring_samples
+        self.dropped_samples = dropped_samples
+
+    def restart_interval(self) -> None:
+        """Forget the previous callback time (new stream; its first interval is not jitter)."""
+
+        self._last_callback = None
+
+    def record_levels(self, samples: np.ndarray) -> None:
+        """Accumulate RMS, peak and clipping for one chunk of int16 samples."""
+
+        if samples.size == 0:
+            return
+        as_float = samples.astype(np.float32)
+        energy = float(np.dot(as_float, as_float))
+        peak = float(np.max(np.abs(as_float)))
+        clipped = int(np.count_nonzero((samples >= 32767) | (samples <= -32768)))
+
+        self.chunks += 1
+        self._energy_total += energy
+        self._level_samples += samples.size
+        self.last_rms_dbfs = _dbfs(math.sqrt(energy / samples.size))
+        self.last_peak_dbfs = _dbfs(peak)
+        self.peak_dbfs_max = max(self.peak_dbfs_max, self.last_peak_dbfs)
+        if clipped:
+            self.clipped_samples += clipped
+            self.clipped_chunks += 1
+
+    def record_reconnect(self, duration: float) -> None:
+        self.reconnects += 1
+        self.last_reconnect_seconds = duration
+        self.reconnect_seconds_total += duration
+        self.reconnect_seconds_max = max(self.reconnect_seconds_max, duration)
+
+    @property
+    def mean_rms_dbfs(self) -> float:
+        if not self._level_samples:
+            return -math.inf
+        return _dbfs(math.sqrt(self._energy_total / self._level_samples))
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "uptime_seconds": time.time() - self.started_at,
+            "callbacks": self.callbacks,
+            "callback_jitter_ms": self.jitter_ms.as_dict(),
+            "overflows": self.overflows,
+            "underflows": self.underflows,
+            "status_errors": self.status_errors,
+            "dropped_samples": self.dropped_samples,
+            "dropped_seconds": self.dropped_samples / self.sample_rate,
+            "ring_samples": self.ring_samples,
+            "ring_high_water": self.ring_high_water,
+            "ring_capacity": self.ring_capacity,
+            "reconnects": self.reconnects,
+            "reconnect_seconds_total": self.reconnect_seconds_total,
+            "reconnect_seconds_max": self.reconnect_seconds_max,
+            "last_reconnect_seconds": self.last_reconnect_seconds,
+            "chunks": self.chunks,
+            "rms_dbfs_last": self.last_rms_dbfs,
+            "rms_dbfs_mean": self.mean_rms_dbfs,
+            "peak_dbfs_last": self.last_peak_dbfs,
+            "peak_dbfs_max": self.peak_dbfs_max,
+            "clipped_samples": self.clipped_samples,
+            "clipped_chunks": self.clipped_chunks,
+        }
+
+    def describe(self) -> str:
+        jitter = self.jitter_ms
+        return (
+            f"{self.callbacks} callbacks, jitter mean {jitter.mean:.1f} ms / "
+            f"p99 <={jitter.quantile(0.99):g} ms / max {jitter.max:.1f} ms; "
+            f"ring {self.ring_samples}/{self.ring_capacity} (high {self.ring_high_water}); "
+            f"dropped {self.dropped_samples / self.sample_rate:.2f}s, "
+            f"{self.overflows} overflows; {self.reconnects} reconnects "
+            f"(max {self.reconnect_seconds_max:.2f}s); level {self.mean_rms_dbfs:.1f} dBFS rms, "
+            f"peak {self.peak_dbfs_max:.1f} dBFS, {self.clipped_samples} clipped samples"
+        )
@@ -9,9 +9,8 @@ import logging
 import signal
 from typing import Any, Dict, Optional
 
-import sounddevice as sd
-
 from .config import BackendChoice, load_settings
+from .devices import default_registry, sd
 from .pipeline import TranscriptionPipeline
 
 
@@ -23,14 +22,20 @@ def configure_logging(level: str) -> None:
 
 
 def list_audio_devices() -> None:
-    devices = sd.query_devices()
-    for index, device in enumerate(devices):
+    if sd is None:
+        print("sounddevice/PortAudio is not available on this host.")
+        return
+    snapshot = default_registry().snapshot
+    for device in snapshot.devices:
         io_type = []
         if device["max_input_channels"]:
             io_type.append("IN")
         if device["max_output_channels"]:
             io_type.append("OUT")
-        print(f"{index:>3}: {'/'.join(io_type):<7} {device['name']}  ({device['hostapi']})")
+        marker = "*" if device["index"] == snapshot.default_input else " "
+        print(
+            f"{marker}{device['index']:>3}: {'/'.join(io_type):<7} {device['name']}  ({device['hostapi']})"
+        )
 
 
 def print_settings() -> None:
@@ -38,6 +43,7 @@ def print_settings() -> None:
     filtered: Dict[str, Any] = {
         "backend": settings.backend.value,
         "audio": settings.audio.model_dump(),
+        "vad": settings.vad.model_dump(),
         "zoom": settings.zoom.model_dump(),
         "logging": settings.logging.model_dump(),
         "web": settings.web.model_dump(),
@@ -60,13 +66,18 @@ def print_settings() -> None:
 
 
 async def run_pipeline(
-    backend_override: Optional[str] = None, log_file_override: Optional[str] = None
+    backend_override: Optional[str] = None,
+    log_file_override: Optional[str] = None,
+    input_file: Optional[str] = None,
+    replay_speed: float = 1.0,
 ) -> None:
     settings = load_settings()
     pipeline = TranscriptionPipeline(
         settings,
         backend_override=backend_override,
         transcript_log_override=log_file_override,
+        input_file=input_file,
+        replay_speed=replay_speed,
     )
 
     loop = asyncio.get_running_loop()
@@ -80,7 +91,13 @@ async def run_pipeline(
     loop.add_signal_handler(signal.SIGTERM, handle_stop)
 
     run_task = asyncio.create_task(pipeline.run())
-    await stop_event.wait()
+    stop_task = asyncio.create_task(stop_event.wait())
+    await asyncio.wait({run_task, stop_task}, return_when=asyncio.FIRST_COMPLETED)
+    stop_task.cancel()
+    if run_task.done():
+        # Pipeline finished on its own (e.g. replay file exhausted).
+        run_task.result()
+        return
     run_task.cancel()
     try:
         await run_task
@@ -110,6 +127,16 @@ def main() -> None:
         "--log-file",
         help="Override transcript log file output path.",
     )
+    parser.add_argument(
+        "--input-file",
+        help="Replay a WAV or raw PCM file instead of capturing from an audio device.",
+    )
+    parser.add_argument(
+        "--replay-speed",
+        type=float,
+        default=1.0,
+        help="Replay pacing for --input-file: 1 = real time, N = N times faster, 0 = unthrottled.",
+    )
     args = parser.parse_args()
 
     configure_logging(args.log_level)
@@ -122,7 +149,9 @@ def main() -> None:
         print_settings()
         return
 
-    asyncio.run(run_pipeline(args.backend, args.log_file))
+    asyncio.run(
+        run_pipeline(args.backend, args.log_file, args.input_file, args.replay_speed)
+    )
 
 
 if __name__ == "__main__":
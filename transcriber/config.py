@@ -25,12 +25,84 @@ class AudioInputConfig(BaseModel):
         default=None,
         description="Optional low-level blocksize override for sounddevice.",
     )
+    buffer_seconds: float = Field(
+        default=5.0,
+        ge=0.5,
+        le=60.0,
+        description="Capacity of the capture ring buffer in seconds of audio.",
+    )
     device_check_interval: float = Field(
         default=2.0,
         ge=0.5,
         le=10.0,
         description="Interval in seconds to check for audio device changes.",
     )
+    switch_crossfade_ms: float = Field(
+        default=20.0,
+        ge=0.0,
+        le=200.0,
+        description="Crossfade length when capture switches to a new device.",
+    )
+    channel_weights: Optional[List[float]] = Field(
+        default=None,
+        description="Per-channel downmix weights; None averages all channels equally.",
+    )
+    remove_dc_offset: bool = Field(
+        default=False,
+        description="Subtract a running DC estimate from captured audio.",
+    )
+    gain_db: float = Field(default=0.0, ge=-30.0, le=30.0)
+    native_sample_rate: bool = Field(
+        default=False,
+        description="Capture at the device's default rate and resample to the backend rate.",
+    )
+    metrics_interval_seconds: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Log capture telemetry every N seconds; 0 disables periodic reports.",
+    )
+
+
+class VadConfig(BaseModel):
+    """Voice-activity gate applied between capture and the ASR backend."""
+
+    enabled: bool = False
+    threshold_db: float = Field(default=-45.0, ge=-90.0, le=0.0)
+    margin_db: float = Field(default=9.0, ge=0.0, le=40.0)
+    frame_ms: float = Field(default=20.0, ge=5.0, le=100.0)
+    hangover_seconds: float = Field(default=0.8, ge=0.0, le=5.0)
+    preroll_seconds: float = Field(default=0.3, ge=0.0, le=2.0)
+
+
+class RecordingConfig(BaseModel):
+    """Optional archive of the captured session audio."""
+
+    enabled: bool = False
+    directory: str = Field(default="recordings", min_length=1)
+    segment_seconds: float = Field(default=300.0, ge=10.0, le=3600.0)
+
+
+class SendOverflowPolicy(str, Enum):
+    """What the uplink queue does when it is full."""
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+
+
+class UplinkEncoding(str, Enum):
+    """Audio encoding declared in StartRecognition and used on the wire."""
+
+    PCM_S16LE = "pcm_s16le"
+    MULAW = "mulaw"
+
+
+class WhisperBacklogPolicy(str, Enum):
+    """What the Whisper backend does while inference is behind real time."""
+
+    SKIP = "skip"
+    SHORTEN = "shorten"
+    DOWNGRADE = "downgrade"
 
 
 class SpeechmaticsConfig(BaseModel):
@@ -45,8 +117,51 @@ class SpeechmaticsConfig(BaseModel):
     connection_url: str = Field(default="wss://eu2.rt.speechmatics.com/v2", min_length=10)
     jwt_token: Optional[str] = Field(default=None, description="Optional pre-issued JWT.")
     jwt_ttl_seconds: int = Field(default=3600, ge=60, le=24 * 3600)
+    jwt_endpoint: str = Field(
+        default="https://mp.speechmatics.com/v1/api_keys",
+        min_length=10,
+        description="Temporary-key endpoint; point at a local stand-in for testing.",
+    )
     max_reconnect_attempts: int = Field(default=3, ge=0, le=10)
     reconnect_backoff_seconds: float = Field(default=3.0, ge=0.1, le=30.0)
+    resume_buffer_seconds: float = Field(
+        default=30.0,
+        ge=0.0,
+        le=300.0,
+        description="Audio kept for replay after a mid-session disconnect; 0 disables resumption.",
+    )
+    resume_timeout_seconds: float = Field(default=120.0, ge=5.0, le=3600.0)
+    hot_standby: bool = Field(
+        default=False,
+        description="Keep a second started session ready for immediate failover.",
+    )
+    standby_recycle_seconds: float = Field(default=600.0, ge=30.0, le=3600.0)
+    send_queue_seconds: float = Field(
+        default=10.0,
+        ge=0.0,
+        le=120.0,
+        description="Audio buffered ahead of the uplink sender; 0 sends inline.",
+    )
+    send_coalesce_seconds: float = Field(default=1.0, ge=0.0, le=10.0)
+    send_overflow_policy: SendOverflowPolicy = Field(
+        default=SendOverflowPolicy.BLOCK,
+        description=(
+            "What a full uplink queue does: wait (never loses audio) or discard chunks; "
+            "dropped audio is kept out of transcript timing and replayed on resume."
+        ),
+    )
+    audio_encoding: UplinkEncoding = Field(
+        default=UplinkEncoding.PCM_S16LE,
+        description="mulaw halves uplink bandwidth at a small cost in accuracy.",
+    )
+    keep_raw_messages: bool = Field(
+        default=False,
+        description="Attach each decoded server message to its TranscriptSegment.raw.",
+    )
+    message_log_path: Optional[str] = Field(
+        default=None,
+        description="Append every server text message to this file (for replay benchmarks).",
+    )
 
 
 class VoskConfig(BaseModel):
@@ -55,6 +170,24 @@ class VoskConfig(BaseModel):
     model_path: str = Field(..., min_length=1)
     sample_rate: int = Field(default=16_000, ge=8_000, le=48_000)
     enable_partials: bool = True
+    partial_min_interval_seconds: float = Field(
+        default=0.3,
+        ge=0.0,
+        le=5.0,
+        description="Minimum wall time between PartialResult() extractions.",
+    )
+    partial_min_audio_seconds: float = Field(
+        default=0.3,
+        ge=0.0,
+        le=5.0,
+        description="Minimum new audio decoded between PartialResult() extractions.",
+    )
+    max_backlog_seconds: float = Field(
+        default=5.0,
+        ge=0.5,
+        le=120.0,
+        description="Audio queued for the recognizer thread before the audio pump waits.",
+    )
 
 
 class ZoomCaptionConfig(BaseModel):
@@ -126,6 +259,69 @@ class WhisperConfig(BaseModel):
     segment_duration: float = Field(default=6.0, ge=1.0, le=30.0)
     beam_size: int = Field(default=1, ge=1, le=5)
     vad_filter: bool = Field(default=True)
+    vad_segmentation: bool = Field(
+        default=False,
+        description=(
+            "Cut segments at detected pauses (segment_duration becomes the maximum) "
+            "and never decode silence; in streaming mode a pause commits the window."
+        ),
+    )
+    min_segment_seconds: float = Field(default=1.0, ge=0.2, le=10.0)
+    pause_seconds: float = Field(
+        default=0.5,
+        ge=0.1,
+        le=3.0,
+        description="Non-speech after an utterance that closes its segment.",
+    )
+    max_backlog_seconds: float = Field(
+        default=30.0,
+        ge=2.0,
+        le=600.0,
+        description=(
+            "Audio queued for inference before the oldest segments are dropped; "
+            "the backlog policy engages at half of it."
+        ),
+    )
+    backlog_policy: WhisperBacklogPolicy = WhisperBacklogPolicy.SKIP
+    shortened_window_seconds: float = Field(
+        default=3.0,
+        ge=0.5,
+        le=30.0,
+        description="Trailing audio transcribed per segment under the shorten policy.",
+    )
+    fallback_model_size: str = Field(
+        default="base",
+        min_length=1,
+        description="Smaller model used under the downgrade policy.",
+    )
+    streaming: bool = Field(
+        default=False,
+        description=(
+            "Re-decode a sliding window and emit partials instead of fixed segments; "
+            "a late decode simply covers more audio, so backlog policies do not apply."
+        ),
+    )
+    partial_interval_seconds: float = Field(
+        default=0.5,
+        ge=0.1,
+        le=5.0,
+        description="New audio between window re-decodes in streaming mode.",
+    )
+    max_window_seconds: float = Field(
+        default=15.0,
+        ge=2.0,
+        le=30.0,
+        description="Window length at which streaming mode commits whatever it has.",
+    )
+    inference_workers: int = Field(
+        default=0,
+        ge=0,
+        le=16,
+        description=(
+            "Worker processes that keep the model resident and are shared by all streams; "
+            "0 runs inference on a thread in this process."
+        ),
+    )
 
 
 class Settings(BaseModel):
@@ -133,6 +329,8 @@ class Settings(BaseModel):
 
     backend: BackendChoice = BackendChoice.SPEECHMATICS
     audio: AudioInputConfig = AudioInputConfig()
+    vad: VadConfig = VadConfig()
+    recording: RecordingConfig = RecordingConfig()
     speechmatics: Optional[SpeechmaticsConfig] = None
     vosk: Optional[VoskConfig] = None
     whisper: Optional[WhisperConfig] = None
@@ -169,6 +367,31 @@ def load_settings() -> Settings:
                 ),
                 jwt_token=env.get("SPEECHMATICS_JWT"),
                 jwt_ttl_seconds=int(env.get("SPEECHMATICS_JWT_TTL", "3600")),
+                jwt_endpoint=env.get(
+                    "SPEECHMATICS_JWT_ENDPOINT", "https://mp.speechmatics.com/v1/api_keys"
+                ),
+                resume_buffer_seconds=float(
+                    env.get("SPEECHMATICS_RESUME_BUFFER_SECONDS", "30")
+                ),
+                resume_timeout_seconds=float(
+                    env.get("SPEECHMATICS_RESUME_TIMEOUT_SECONDS", "120")
+                ),
+                hot_standby=env.get("SPEECHMATICS_HOT_STANDBY", "false").lower()
+                in {"1", "true", "yes"},
+                standby_recycle_seconds=float(
+                    env.get("SPEECHMATICS_STANDBY_RECYCLE_SECONDS", "600")
+                ),
+                send_queue_seconds=float(env.get("SPEECHMATICS_SEND_QUEUE_SECONDS", "10")),
+                send_coalesce_seconds=float(env.get("SPEECHMATICS_SEND_COALESCE_SECONDS", "1.0")),
+                send_overflow_policy=SendOverflowPolicy(
+                    env.get("SPEECHMATICS_SEND_OVERFLOW", "block").lower()
+                ),
+                audio_encoding=UplinkEncoding(
+                    env.get("SPEECHMATICS_AUDIO_ENCODING", "pcm_s16le").lower()
+                ),
+                keep_raw_messages=env.get("SPEECHMATICS_KEEP_RAW", "false").lower()
+                in {"1", "true", "yes"},
+                message_log_path=env.get("SPEECHMATICS_MESSAGE_LOG") or None,
             )
 
         if backend is BackendChoice.SPEECHMATICS and speechmatics_cfg is None:
@@ -180,6 +403,9 @@ def load_settings() -> Settings:
                 model_path=env["VOSK_MODEL_PATH"],
                 sample_rate=int(env.get("VOSK_SAMPLE_RATE", env.get("AUDIO_SAMPLE_RATE", "16000"))),
                 enable_partials=env.get("VOSK_ENABLE_PARTIALS", "true").lower() in {"1", "true", "yes"},
+                partial_min_interval_seconds=float(env.get("VOSK_PARTIAL_MIN_INTERVAL", "0.3")),
+                partial_min_audio_seconds=float(env.get("VOSK_PARTIAL_MIN_AUDIO", "0.3")),
+                max_backlog_seconds=float(env.get("VOSK_MAX_BACKLOG_SECONDS", "5")),
             )
 
         if backend is BackendChoice.VOSK and vosk_cfg is None:
@@ -195,6 +421,22 @@ def load_settings() -> Settings:
                 segment_duration=float(env.get("WHISPER_SEGMENT_DURATION", "6.0")),
                 beam_size=int(env.get("WHISPER_BEAM_SIZE", "1")),
                 vad_filter=env.get("WHISPER_VAD_FILTER", "true").lower() in {"1", "true", "yes"},
+                vad_segmentation=env.get("WHISPER_VAD_SEGMENTATION", "false").lower()
+                in {"1", "true", "yes"},
+                min_segment_seconds=float(env.get("WHISPER_MIN_SEGMENT_SECONDS", "1.0")),
+                pause_seconds=float(env.get("WHISPER_PAUSE_SECONDS", "0.5")),
+                max_backlog_seconds=float(env.get("WHISPER_MAX_BACKLOG_SECONDS", "30")),
+                backlog_policy=WhisperBacklogPolicy(
+                    env.get("WHISPER_BACKLOG_POLICY", "skip").lower()
+                ),
+                shortened_window_seconds=float(
+                    env.get("WHISPER_SHORTENED_WINDOW_SECONDS", "3.0")
+                ),
+                fallback_model_size=env.get("WHISPER_FALLBACK_MODEL_SIZE", "base"),
+                streaming=env.get("WHISPER_STREAMING", "false").lower() in {"1", "true", "yes"},
+                partial_interval_seconds=float(env.get("WHISPER_PARTIAL_INTERVAL", "0.5")),
+                max_window_seconds=float(env.get("WHISPER_MAX_WINDOW_SECONDS", "15")),
+                inference_workers=int(env.get("WHISPER_WORKERS", "0")),
             )
 
         if backend is BackendChoice.WHISPER and whisper_cfg is None:
@@ -268,7 +510,37 @@ def load_settings() -> Settings:
                     if "AUDIO_BLOCKSIZE" in env
                     else None
                 ),
+                buffer_seconds=float(env.get("AUDIO_BUFFER_SECONDS", "5.0")),
                 device_check_interval=float(env.get("AUDIO_DEVICE_CHECK_INTERVAL", "2.0")),
+                switch_crossfade_ms=float(env.get("AUDIO_SWITCH_CROSSFADE_MS", "20.0")),
+                channel_weights=(
+                    [
+                        float(weight)
+                        for weight in env["AUDIO_CHANNEL_WEIGHTS"].replace(";", ",").split(",")
+                        if weight.strip()
+                    ]
+                    if env.get("AUDIO_CHANNEL_WEIGHTS")
+                    else None
+                ),
+                remove_dc_offset=env.get("AUDIO_REMOVE_DC_OFFSET", "false").lower()
+                in {"1", "true", "yes"},
+                gain_db=float(env.get("AUDIO_GAIN_DB", "0.0")),
+                native_sample_rate=env.get("AUDIO_NATIVE_SAMPLE_RATE", "false").lower()
+                in {"1", "true", "yes"},
+                metrics_interval_seconds=float(env.get("AUDIO_METRICS_INTERVAL", "0")),
+            ),
+            vad=VadConfig(
+                enabled=env.get("VAD_ENABLED", "false").lower() in {"1", "true", "yes"},
+                threshold_db=float(env.get("VAD_THRESHOLD_DB", "-45.0")),
+                margin_db=float(env.get("VAD_MARGIN_DB", "9.0")),
+                frame_ms=float(env.get("VAD_FRAME_MS", "20.0")),
+                hangover_seconds=float(env.get("VAD_HANGOVER_SECONDS", "0.8")),
+                preroll_seconds=float(env.get("VAD_PREROLL_SECONDS", "0.3")),
+            ),
+            recording=RecordingConfig(
+                enabled=env.get("RECORDING_ENABLED", "false").lower() in {"1", "true", "yes"},
+                directory=env.get("RECORDING_DIR", "recordings"),
+                segment_seconds=float(env.get("RECORDING_SEGMENT_SECONDS", "300")),
             ),
             zoom=ZoomCaptionConfig(
                 caption_post_url=env.get("ZOOM_CC_POST_URL"),
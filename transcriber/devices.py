@@ -0,0 +1,234 @@
+"""Cached audio device table shared by capture, CLI and diagnostics."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import logging
+import shutil
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import sounddevice as sd
+except (ImportError, OSError):  # pragma: no cover - depends on host audio stack
+    sd = None
+
+# `pactl subscribe` event kinds that can change the usable input set or default.
+_PACTL_EVENT_KINDS = ("source", "server", "card")
+
+
+@dataclass(frozen=True)
+class DeviceSnapshot:
+    """Immutable view of the PortAudio device table at one point in time."""
+
+    devices: Tuple[Dict[str, Any], ...] = ()
+    default_input: Optional[int] = None
+    fingerprint: str = ""
+    taken_at: float = field(default=0.0, compare=False)
+
+    def get(self, index: Optional[int]) -> Optional[Dict[str, Any]]:
+        if index is None or index < 0 or index >= len(self.devices):
+            return None
+        return self.devices[index]
+
+    def is_input(self, index: Optional[int]) -> bool:
+        device = self.get(index)
+        return bool(device and device.get("max_input_channels", 0) > 0)
+
+    def input_devices(self) -> List[Dict[str, Any]]:
+        return [device for device in self.devices if device.get("max_input_channels", 0) > 0]
+
+
+def _fingerprint(devices: Tuple[Dict[str, Any], ...], default_input: Optional[int]) -> str:
+    digest = hashlib.sha1()
+    for device in devices:
+        digest.update(
+            repr(
+                (
+                    device.get("name"),
+                    device.get("hostapi"),
+                    device.get("max_input_channels"),
+                    device.get("max_output_channels"),
+                    device.get("default_samplerate"),
+                )
+            ).encode("utf-8")
+        )
+    digest.update(repr(default_input).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class DeviceRegistry:
+    """Cache ``sd.query_devices`` results and refresh them off the event loop.
+
+    Queries are slow on PipeWire hosts and hold the GIL, so callers read the
+    cached :attr:`snapshot` instead of querying PortAudio directly. While
+    :meth:`start` is active the registry refreshes itself when PulseAudio /
+    PipeWire (via ``pactl subscribe``) reports a source, card or server
+    change, and otherwise falls back to polling with exponential backoff
+    while nothing changes.
+    """
+
+    def __init__(self, poll_interval: float = 2.0, max_poll_interval: float = 30.0) -> None:
+        self._poll_interval = max(0.1, poll_interval)
+        self._max_poll_interval = max(self._poll_interval, max_poll_interval)
+        self._snapshot: Optional[DeviceSnapshot] = None
+        self._changed = asyncio.Event()
+        self._watch_task: Optional[asyncio.Task] = None
+        self._refresh_lock = asyncio.Lock()
+
+    @property
+    def snapshot(self) -> DeviceSnapshot:
+        """Latest cached snapshot; performs a blocking refresh only on first use."""
+
+        if self._snapshot is None:
+            self.refresh()
+        assert self._snapshot is not None  # nosec B101
+        return self._snapshot
+
+    def refresh(self) -> DeviceSnapshot:
+        """Query PortAudio now (blocking) and update the cache."""
+
+        if sd is None:
+            self._snapshot = DeviceSnapshot(taken_at=time.time())
+            return self._snapshot
+        try:
+            devices = tuple(
+                {**dict(device), "index": index}
+                for index, device in enumerate(sd.query_devices())
+            )
+        except Exception as exc:  # noqa: BLE001
+            logging.warning("Failed to query audio devices: %s", exc)
+            if self._snapshot is None:
+                self._snapshot = DeviceSnapshot(taken_at=time.time())
+            return self._snapshot
+
+        default_input: Optional[int] = None
+        try:
+            default_info = sd.query_devices(kind="input")
+            if default_info:
+                default_input = default_info.get("index")
+        except Exception as exc:  # noqa: BLE001
+            logging.warning("Failed to query default input device: %s", exc)
+
+        snapshot = DeviceSnapshot(
+            devices=devices,
+            default_input=default_input,
+            fingerprint=_fingerprint(devices, default_input),
+            taken_at=time.time(),
+        )
+        previous = self._snapshot
+        self._snapshot = snapshot
+        if previous is not None and previous.fingerprint != snapshot.fingerprint:
+            logging.info(
+                "Audio device table changed (%d devices, default input %s).",
+                len(devices),
+                default_input,
+            )
+        return snapshot
+
+    async def refresh_async(self) -> bool:
+        """Refresh in a worker thread; return True when the device table changed."""
+
+        async with self._refresh_lock:
+            previous = self._snapshot
+            snapshot = await asyncio.to_thread(self.refresh)
+        changed = previous is None or previous.fingerprint != snapshot.fingerprint
+        if changed:
+            self._changed.set()
+        return changed
+
+    async def wait_for_change(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for a device table change."""
+
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._changed.clear()
+        return True
+
+    async def start(self) -> None:
+        """Begin watching for device changes in the background."""
+
+        if self._watch_task is not None and not self._watch_task.done():
+            return
+        await self.refresh_async()
+        self._changed.clear()
+        self._watch_task = asyncio.create_task(self._watch(), name="audio-device-registry")
+
+    async def stop(self) -> None:
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._watch_task
+            self._watch_task = None
+
+    async def _watch(self) -> None:
+        if shutil.which("pactl"):
+            try:
+                await self._watch_pactl()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                logging.info("pactl device notifications unavailable (%s); polling instead.", exc)
+        await self._poll_with_backoff()
+
+    async def _watch_pactl(self) -> None:
+        process = await asyncio.create_subprocess_exec(
+            "pactl",
+            "subscribe",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        logging.debug("Watching PulseAudio/PipeWire device events via pactl subscribe.")
+        assert process.stdout is not None  # nosec B101
+        try:
+            while True:
+                line = await process.stdout.readline()
+                if not line:
+                    raise RuntimeError("pactl subscribe exited")
+                event = line.decode("utf-8", "replace").lower()
+                if not any(f"on {kind}" in event for kind in _PACTL_EVENT_KINDS):
+                    continue
+                # Events arrive in bursts; coalesce them before re-querying.
+                await self._drain_burst(process.stdout, 0.3)
+                await self.refresh_async()
+        finally:
+            if process.returncode is None:
+                process.terminate()
+                with contextlib.suppress(Exception):
+                    await asyncio.wait_for(process.wait(), timeout=2.0)
+
+    @staticmethod
+    async def _drain_burst(stream: asyncio.StreamReader, quiet_seconds: float) -> None:
+        while True:
+            try:
+                line = await asyncio.wait_for(stream.readline(), timeout=quiet_seconds)
+            except asyncio.TimeoutError:
+                return
+            if not line:
+                return
+
+    async def _poll_with_backoff(self) -> None:
+        interval = self._poll_interval
+        while True:
+            await asyncio.sleep(interval)
+            if await self.refresh_async():
+                interval = self._poll_interval
+            else:
+                interval = min(interval * 2, self._max_poll_interval)
+
+
+_default_registry: Optional[DeviceRegistry] = None
+
+
+def default_registry() -> DeviceRegistry:
+    """Process-wide registry used by the CLI and diagnostics."""
+
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = DeviceRegistry()
+    return _default_registry
@@ -0,0 +1,201 @@
+"""File-backed audio source for replaying recorded sessions."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import mmap
+import struct
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncGenerator, Optional, Tuple
+
+import numpy as np
+
+from .audio import AudioCaptureError
+from .config import AudioInputConfig
+from .dsp import CaptureDSP
+from .resample import PolyphaseResampler
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+def parse_wav_header(data: mmap.mmap) -> Tuple[int, int, int, int]:
+    """Return ``(sample_rate, channels, data_offset, data_length)`` for a 16-bit PCM WAV."""
+
+    if len(data) < 12 or data[0:4] != b"RIFF" or data[8:12] != b"WAVE":
+        raise AudioCaptureError("Not a RIFF/WAVE file.")
+
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id = data[offset : offset + 4]
+        (chunk_size,) = struct.unpack_from("<I", data, offset + 4)
+        body = offset + 8
+        if chunk_id == b"fmt ":
+            fmt_tag, channels, sample_rate, _byte_rate, _align, bits = struct.unpack_from(
+                "<HHIIHH", data, body
+            )
+            if fmt_tag == _WAVE_FORMAT_EXTENSIBLE and chunk_size >= 40:
+                (fmt_tag,) = struct.unpack_from("<H", data, body + 24)
+            if fmt_tag != _WAVE_FORMAT_PCM or bits != 16:
+                raise AudioCaptureError(
+                    f"Unsupported WAV encoding (format={fmt_tag:#x}, bits={bits}); need 16-bit PCM."
+                )
+        elif chunk_id == b"data":
+            if sample_rate is None or channels is None:
+                raise AudioCaptureError("WAV data chunk precedes fmt chunk.")
+            remaining = len(data) - body
+            # Files left behind by an interrupted recorder may carry an unpatched size.
+            length = remaining if chunk_size in (0, 0xFFFFFFFF) else min(chunk_size, remaining)
+            return sample_rate, channels, body, length
+        offset = body + chunk_size + (chunk_size & 1)
+    raise AudioCaptureError("WAV file has no data chunk.")
+
+
+class FileAudioSource:
+    """Async iterator that replays a WAV or raw PCM file as capture chunks.
+
+    The file is memory-mapped and sliced into ``chunk_duration_seconds``
+    chunks of mono int16 PCM, exactly like :class:`AudioChunkStream`.
+    ``speed`` paces delivery: ``1.0`` is real time, ``N`` is N times faster,
+    and ``0`` delivers chunks as fast as the consumer accepts them.
+    Files recorded at another rate are resampled to ``output_sample_rate``.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        config: AudioInputConfig,
+        speed: float = 1.0,
+        output_sample_rate: Optional[int] = None,
+    ) -> None:
+        self.path = Path(path).expanduser()
+        self.config = config
+        self.speed = max(0.0, float(speed))
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._samples: Optional[np.ndarray] = None
+        self._dsp: Optional[CaptureDSP] = None
+        self._resampler: Optional[PolyphaseResampler] = None
+        self.output_sample_rate = output_sample_rate or config.sample_rate
+        self._channels = config.channels
+        self._sample_rate = config.sample_rate
+        self._frames_per_chunk = 0
+        self._position = 0
+        self._started_at: Optional[float] = None
+
+    @property
+    def duration_seconds(self) -> float:
+        if self._samples is None:
+            return 0.0
+        return self._samples.size / self._channels / self._sample_rate
+
+    def _open(self) -> None:
+        try:
+            self._file = self.path.open("rb")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as exc:
+            self._close()
+            raise AudioCaptureError(f"Failed to open audio file {self.path}: {exc}") from exc
+
+        try:
+            if self.path.suffix.lower() == ".wav":
+                sample_rate, channels, offset, length = parse_wav_header(self._mmap)
+            else:
+                sample_rate, channels = self.config.sample_rate, self.config.channels
+                offset, length = 0, len(self._mmap)
+
+        except AudioCaptureError:
+            self._close()
+            raise
+        self._sample_rate = sample_rate
+        self._channels = channels
+        # Chunks are cut on the file's timeline and resampled afterwards.
+        self._frames_per_chunk = int(sample_rate * self.config.chunk_duration_seconds)
+        self._resampler = (
+            PolyphaseResampler(sample_rate, self.output_sample_rate)
+            if sample_rate != self.output_sample_rate
+            else None
+        )
+        frame_bytes = 2 * channels
+        usable = (length // frame_bytes) * frame_bytes
+        # Zero-copy view over the mapped file; chunks are sliced from it on demand.
+        self._samples = np.frombuffer(self._mmap, dtype=np.int16, count=usable // 2, offset=offset)
+        weights = self.config.channel_weights if channels == self.config.channels else None
+        self._dsp = CaptureDSP(
+            channels=channels,
+            channel_weights=weights,
+            remove_dc=self.config.remove_dc_offset,
+            gain_db=self.config.gain_db,
+        )
+        logging.info(
+            "Replaying %s (%.1f s, %d Hz, %d ch) at %s.",
+            self.path,
+            self.duration_seconds,
+            sample_rate,
+            channels,
+            f"{self.speed:g}x" if self.speed else "unthrottled speed",
+        )
+        if self._resampler is not None:
+            logging.info(
+                "Resampling replay audio %d Hz -> %d Hz.", sample_rate, self.output_sample_rate
+            )
+
+    def _close(self) -> None:
+        self._samples = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @asynccontextmanager
+    async def connect(self) -> AsyncGenerator["FileAudioSource", None]:
+        """Context manager that maps the file for the duration of the replay."""
+
+        self._open()
+        self._position = 0
+        self._started_at = None
+        try:
+            yield self
+        finally:
+            self._close()
+
+    async def __anext__(self) -> bytes:
+        return await self.next_chunk()
+
+    def __aiter__(self) -> "FileAudioSource":
+        return self
+
+    async def next_chunk(self) -> bytes:
+        """Return the next chunk, sleeping as needed to honour ``speed``."""
+
+        if self._samples is None or self._dsp is None:
+            raise StopAsyncIteration
+        step = self._frames_per_chunk * self._channels
+        if self._position >= self._samples.size:
+            raise StopAsyncIteration
+
+        loop = asyncio.get_running_loop()
+        if self._started_at is None:
+            self._started_at = loop.time()
+        if self.speed > 0:
+            # Like live capture, a chunk becomes available once its last sample "arrives".
+            chunk_end = min(self._position + step, self._samples.size)
+            emitted_seconds = chunk_end / self._channels / self._sample_rate
+            delay = self._started_at + emitted_seconds / self.speed - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        else:
+            await asyncio.sleep(0)
+
+        block = self._samples[self._position : self._position + step]
+        self._position += step
+        samples = self._dsp.process(block)
+        if self._resampler is not None:
+            samples = self._resampler.process(samples)
+        return samples.tobytes()
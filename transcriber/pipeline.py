@@ -10,7 +10,7 @@ import functools
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 from .asr import (
     SpeechmaticsRealtimeBackend,
@@ -24,12 +24,18 @@ from .asr import (
 )
 from .audio import AudioCaptureError, AudioChunkStream
 from .config import BackendChoice, Settings, load_settings
+from .file_source import FileAudioSource
+from .recorder import RecordingError, SessionRecorder
+from .vad import EnergyZcrDetector, VoiceActivityGate
 from .zoom_caption import ZoomCaptionPublisher
 from .display.webui import CaptionWebUI
 from .discord import DiscordBatcher, DiscordNotifier
 from .translate import TranslationService
 
 
+AudioSource = Union[AudioChunkStream, FileAudioSource]
+
+
 def _normalize_text(text: str) -> str:
     if not text:
         return ""
@@ -150,6 +156,8 @@ class TranscriptionPipeline:
         settings: Optional[Settings] = None,
         backend_override: Optional[str] = None,
         transcript_log_override: Optional[str] = None,
+        input_file: Optional[str] = None,
+        replay_speed: float = 1.0,
     ) -> None:
         self.settings = settings or load_settings()
         self.backend_choice = (
@@ -157,15 +165,28 @@ class TranscriptionPipeline:
             if backend_override
             else self.settings.backend
         )
-        self._audio_stream = AudioChunkStream(
-            self.settings.audio,
-            check_interval=self.settings.audio.device_check_interval,
-        )
+        self._output_sample_rate = self._backend_sample_rate()
+        self._audio_stream: AudioSource
+        if input_file:
+            self._audio_stream = FileAudioSource(
+                input_file,
+                self.settings.audio,
+                speed=replay_speed,
+                output_sample_rate=self._output_sample_rate,
+            )
+        else:
+            self._audio_stream = AudioChunkStream(
+                self.settings.audio,
+                check_interval=self.settings.audio.device_check_interval,
+                output_sample_rate=self._output_sample_rate,
+            )
         self._zoom_publisher = ZoomCaptionPublisher(self.settings.zoom)
         self._transcript_logger = TranscriptFileLogger(
             self.settings.logging, override_path=transcript_log_override
         )
         self._web_ui: Optional[CaptionWebUI] = None
+        self._vad_gate: Optional[VoiceActivityGate] = None
+        self._recorder: Optional[SessionRecorder] = None
         self.state = PipelineState()
         self._running = False
         self._sentence_assembler = SentenceAssembler()
@@ -208,6 +229,8 @@ class TranscriptionPipeline:
         logging.info("Starting transcription pipeline with backend=%s.", self.backend_choice.value)
 
         backend = self._create_backend()
+        self._vad_gate = self._create_vad_gate(backend)
+        self._recorder = self._start_recorder()
         try:
             with self._transcript_logger:
                 async with self._zoom_publisher:
@@ -255,11 +278,19 @@ class TranscriptionPipeline:
             await self._discord_batcher.close()
             await self._discord_notifier.close()
             await self._translation_service.close()
+            if self._vad_gate is not None:
+                self._vad_gate.log_summary()
+            if self._recorder is not None:
+                await asyncio.to_thread(self._recorder.close)
+                self._recorder = None
+            audio_stream = self._audio_stream
+            if isinstance(audio_stream, AudioChunkStream) and audio_stream.metrics.callbacks:
+                logging.info("Capture metrics: %s", audio_stream.metrics.describe())
             self._running = False
             logging.info("Transcription pipeline stopped.")
 
     async def _main_loop(
-        self, audio_stream: AudioChunkStream, backend: StreamingTranscriptionBackend
+        self, audio_stream: AudioSource, backend: StreamingTranscriptionBackend
     ) -> None:
         audio_task = asyncio.create_task(
             self._pump_audio(audio_stream, backend), name="audio-producer"
@@ -267,16 +298,48 @@ class TranscriptionPipeline:
         transcript_task = asyncio.create_task(
             self._consume_transcripts(backend), name="transcript-consumer"
         )
+        metrics_task: Optional[asyncio.Task] = None
+        interval = self.settings.audio.metrics_interval_seconds
+        if interval > 0:
+            metrics_task = asyncio.create_task(
+                self._report_metrics(audio_stream, backend, interval), name="pipeline-metrics"
+            )
 
-        done, pending = await asyncio.wait(
-            {audio_task, transcript_task},
-            return_when=asyncio.FIRST_EXCEPTION,
-        )
+        try:
+            done, pending = await asyncio.wait(
+                {audio_task, transcript_task},
+                return_when=asyncio.FIRST_EXCEPTION,
+            )
+        finally:
+            if metrics_task is not None:
+                metrics_task.cancel()
         for task in pending:
             task.cancel()
         for task in done:
             task.result()
 
+    @staticmethod
+    async def _report_metrics(
+        audio_stream: AudioSource, backend: StreamingTranscriptionBackend, interval: float
+    ) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            if isinstance(audio_stream, AudioChunkStream):
+                logging.info("Capture metrics: %s", audio_stream.metrics.describe())
+            summary = backend.metrics_summary()
+            if summary:
+                logging.info("Backend metrics: %s", summary)
+
+    def _backend_sample_rate(self) -> int:
+        """Sample rate the selected backend consumes; capture is resampled to it."""
+        if self.backend_choice is BackendChoice.SPEECHMATICS and self.settings.speechmatics:
+            return self.settings.speechmatics.sample_rate
+        if self.backend_choice is BackendChoice.VOSK and self.settings.vosk:
+            return self.settings.vosk.sample_rate
+        if self.backend_choice is BackendChoice.WHISPER:
+            return WhisperStreamingBackend.MODEL_SAMPLE_RATE
+        return self.settings.audio.sample_rate
+
     def _create_backend(self) -> StreamingTranscriptionBackend:
         if self.backend_choice is BackendChoice.SPEECHMATICS:
             if not self.settings.speechmatics:
@@ -292,11 +355,55 @@ class TranscriptionPipeline:
             if not self.settings.whisper:
                 raise RuntimeError("Whisper configuration missing.")
             return WhisperStreamingBackend(
-                self.settings.whisper, self.settings.audio.sample_rate
+                self.settings.whisper, self._output_sample_rate, vad=self.settings.vad
             )
 
         raise RuntimeError(f"Unsupported backend: {self.backend_choice}")
 
+    def _create_vad_gate(
+        self, backend: StreamingTranscriptionBackend
+    ) -> Optional[VoiceActivityGate]:
+        vad_cfg = self.settings.vad
+        if not vad_cfg.enabled:
+            return None
+        sample_rate = self._output_sample_rate
+        detector = EnergyZcrDetector(
+            sample_rate,
+            frame_ms=vad_cfg.frame_ms,
+            threshold_db=vad_cfg.threshold_db,
+            margin_db=vad_cfg.margin_db,
+        )
+        logging.info(
+            "Voice activity gate enabled (silence %s).",
+            "replaced by keepalive frames"
+            if backend.silence_keepalive_seconds
+            else "skipped",
+        )
+        return VoiceActivityGate(
+            detector,
+            sample_rate,
+            hangover_seconds=vad_cfg.hangover_seconds,
+            preroll_seconds=vad_cfg.preroll_seconds,
+            keepalive_seconds=backend.silence_keepalive_seconds,
+            on_skip=backend.skip_audio,
+        )
+
+    def _start_recorder(self) -> Optional[SessionRecorder]:
+        rec_cfg = self.settings.recording
+        if not rec_cfg.enabled:
+            return None
+        recorder = SessionRecorder(
+            rec_cfg.directory,
+            self._output_sample_rate,
+            segment_seconds=rec_cfg.segment_seconds,
+        )
+        try:
+            recorder.start()
+        except RecordingError as exc:
+            logging.error("Session recording disabled: %s", exc)
+            return None
+        return recorder
+
     async def _emit_sentence(self, sentence: str, speaker: Optional[str]) -> None:
         sentence = sentence.strip()
         if not sentence:
@@ -337,10 +444,22 @@ class TranscriptionPipeline:
             )
 
     async def _pump_audio(
-        self, audio_stream: AudioChunkStream, backend: StreamingTranscriptionBackend
+        self, audio_stream: AudioSource, backend: StreamingTranscriptionBackend
     ) -> None:
+        gate = self._vad_gate
+        recorder = self._recorder
         async for chunk in audio_stream:
-            await backend.send_audio_chunk(chunk)
+            if recorder is not None:
+                recorder.write(chunk)
+            if gate is None:
+                await backend.send_audio_chunk(chunk)
+                continue
+            for block in gate.process(chunk):
+                await backend.send_audio_chunk(block)
+        # Input exhausted (end of replay file or capture stopped): let the
+        # backend finish so the transcript consumer can drain and exit.
+        logging.info("Audio input finished; flushing backend.")
+        await backend.flush()
 
     async def _consume_transcripts(self, backend: StreamingTranscriptionBackend) -> None:
         async for result in backend.transcript_results():
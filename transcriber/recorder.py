@@ -0,0 +1,340 @@
+"""Session audio recorder writing a segmented, indexed WAV archive."""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import queue
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+INDEX_FILENAME = "index.jsonl"
+_WAV_HEADER_BYTES = 44
+_SAMPLE_BYTES = 2
+_UNPATCHED_SIZE = 0xFFFFFFFF
+_STOP = object()
+
+
+class RecordingError(Exception):
+    """Raised when a session recording cannot be created or read."""
+
+
+def wav_header(sample_rate: int, data_bytes: int) -> bytes:
+    """Canonical 44-byte header for mono 16-bit PCM."""
+
+    riff_size = _UNPATCHED_SIZE if data_bytes == _UNPATCHED_SIZE else 36 + data_bytes
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        riff_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        1,
+        sample_rate,
+        sample_rate * _SAMPLE_BYTES,
+        _SAMPLE_BYTES,
+        16,
+        b"data",
+        data_bytes,
+    )
+
+
+class SessionRecorder:
+    """Persist captured audio without blocking the live path.
+
+    :meth:`write` only timestamps the chunk and hands it to a queue; a
+    background thread batches chunks into writes of about ``flush_seconds``
+    of audio and rotates to a new WAV segment every ``segment_seconds``.
+    Segment headers are written with an unpatched size and fixed up on
+    rotation, so files left by a crash remain readable by
+    :class:`~transcriber.file_source.FileAudioSource`.
+
+    Alongside the segments, ``index.jsonl`` records where each segment
+    starts on the stream-sample clock and, once per flush, a mark pairing
+    wall-clock time with a stream sample and byte offset. :func:`extract_range`
+    uses it to cut any time range without scanning the audio.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        sample_rate: int,
+        segment_seconds: float = 300.0,
+        flush_seconds: float = 1.0,
+        max_pending_chunks: int = 512,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.session_dir = Path(directory).expanduser() / time.strftime("%Y%m%d-%H%M%S")
+        self._segment_samples = max(1, int(segment_seconds * sample_rate))
+        self._flush_bytes = max(_SAMPLE_BYTES, int(flush_seconds * sample_rate) * _SAMPLE_BYTES)
+        self._flush_seconds = max(0.05, flush_seconds)
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_pending_chunks)
+        self._thread: Optional[threading.Thread] = None
+        self._index: Optional[BinaryIO] = None
+        self._segment: Optional[BinaryIO] = None
+        self._segment_name = ""
+        self._segment_start = 0
+        self._segment_written = 0  # samples written to the current segment
+        self._stream_samples = 0  # samples accepted by write()
+        self._failed = False
+        self.dropped_chunks = 0
+        self.segments = 0
+
+    def start(self) -> None:
+        try:
+            self.session_dir.mkdir(parents=True, exist_ok=False)
+            self._index = (self.session_dir / INDEX_FILENAME).open("ab")
+        except OSError as exc:
+            raise RecordingError(f"Cannot create recording in {self.session_dir}: {exc}") from exc
+        self._thread = threading.Thread(target=self._run, name="session-recorder", daemon=True)
+        self._thread.start()
+        logging.info("Recording session audio to %s", self.session_dir)
+
+    def write(self, chunk: bytes) -> None:
+        """Queue one chunk of mono int16 PCM; never blocks."""
+
+        if self._thread is None or self._failed or not chunk:
+            return
+        item = (chunk, self._stream_samples, time.time())
+        self._stream_samples += len(chunk) // _SAMPLE_BYTES
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self.dropped_chunks += 1
+            if self.dropped_chunks == 1:
+                logging.warning("Session recorder is falling behind; dropping audio.")
+
+    def close(self) -> None:
+        """Flush pending audio and finalise the archive (blocking)."""
+
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+        logging.info(
+            "Session recording finished: %.1f s in %d segment(s) at %s%s",
+            self._stream_samples / self.sample_rate,
+            self.segments,
+            self.session_dir,
+            f" ({self.dropped_chunks} chunks dropped)" if self.dropped_chunks else "",
+        )
+
+    def _run(self) -> None:
+        pending: List[bytes] = []
+        pending_bytes = 0
+        mark: Optional[Tuple[int, float]] = None
+        expected = 0  # stream sample the next chunk should start at
+        while True:
+            try:
+                item = self._queue.get(timeout=self._flush_seconds)
+            except queue.Empty:
+                item = None
+            if item is _STOP or item is None:
+                if pending:
+                    self._flush(pending, mark)
+                    pending, pending_bytes, mark = [], 0, None
+                if item is _STOP:
+                    break
+                continue
+
+            chunk, sample, wall = item
+            if self._failed:
+                continue
+            if sample > expected:
+                # Chunks were dropped upstream; keep the sample clock aligned with silence.
+                gap = sample - expected
+                chunk = bytes(gap * _SAMPLE_BYTES) + chunk
+                sample, wall = expected, wall - gap / self.sample_rate
+            expected = sample + len(chunk) // _SAMPLE_BYTES
+            buffered = self._segment_written + (pending_bytes + len(chunk)) // _SAMPLE_BYTES
+            if self._segment is None or buffered > self._segment_samples:
+                if pending:
+                    self._flush(pending, mark)
+                    pending, pending_bytes, mark = [], 0, None
+                self._rotate(sample, wall)
+            if mark is None:
+                mark = (sample, wall)
+            pending.append(chunk)
+            pending_bytes += len(chunk)
+            if pending_bytes >= self._flush_bytes:
+                self._flush(pending, mark)
+                pending, pending_bytes, mark = [], 0, None
+        self._close_segment()
+
+    def _flush(self, pending: List[bytes], mark: Optional[Tuple[int, float]]) -> None:
+        if self._segment is None or self._failed:
+            return
+        offset = _WAV_HEADER_BYTES + self._segment_written * _SAMPLE_BYTES
+        data = b"".join(pending)
+        try:
+            self._segment.write(data)
+            if mark is not None:
+                self._append_index(
+                    {
+                        "type": "mark",
+                        "file": self._segment_name,
+                        "sample": mark[0],
+                        "wall": mark[1],
+                        "offset": offset,
+                    }
+                )
+        except OSError as exc:
+            self._fail(exc)
+            return
+        self._segment_written += len(data) // _SAMPLE_BYTES
+
+    def _rotate(self, sample: int, wall: float) -> None:
+        self._close_segment()
+        self.segments += 1
+        self._segment_name = f"segment-{self.segments:05d}.wav"
+        self._segment_start = sample
+        self._segment_written = 0
+        try:
+            self._segment = (self.session_dir / self._segment_name).open(
+                "wb", buffering=max(self._flush_bytes, 1 << 16)
+            )
+            self._segment.write(wav_header(self.sample_rate, _UNPATCHED_SIZE))
+            self._append_index(
+                {
+                    "type": "segment",
+                    "file": self._segment_name,
+                    "sample": sample,
+                    "wall": wall,
+                    "sample_rate": self.sample_rate,
+                }
+            )
+        except OSError as exc:
+            self._fail(exc)
+
+    def _close_segment(self) -> None:
+        if self._segment is None:
+            return
+        segment, self._segment = self._segment, None
+        try:
+            segment.seek(0)
+            segment.write(wav_header(self.sample_rate, self._segment_written * _SAMPLE_BYTES))
+            segment.close()
+        except OSError as exc:
+            logging.warning("Failed to finalise %s: %s", self._segment_name, exc)
+
+    def _append_index(self, entry: Dict[str, Any]) -> None:
+        assert self._index is not None  # nosec B101
+        self._index.write(json.dumps(entry, separators=(",", ":")).encode("utf-8") + b"\n")
+        self._index.flush()
+
+    def _fail(self, exc: OSError) -> None:
+        self._failed = True
+        logging.error("Session recording stopped: %s", exc)
+
+
+@dataclass
+class RecordingIndex:
+    """Parsed ``index.jsonl`` of a recorded session."""
+
+    session_dir: Path
+    sample_rate: int
+    segments: List[Dict[str, Any]] = field(default_factory=list)
+    marks: List[Dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, session_dir: str) -> "RecordingIndex":
+        path = Path(session_dir).expanduser()
+        try:
+            lines = (path / INDEX_FILENAME).read_text(encoding="utf-8").splitlines()
+        except OSError as exc:
+            raise RecordingError(f"Cannot read recording index in {path}: {exc}") from exc
+        segments: List[Dict[str, Any]] = []
+        marks: List[Dict[str, Any]] = []
+        for line in lines:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            (segments if entry.get("type") == "segment" else marks).append(entry)
+        if not segments:
+            raise RecordingError(f"Recording in {path} has no segments.")
+        return cls(path, int(segments[0]["sample_rate"]), segments, marks)
+
+    @property
+    def started_at(self) -> float:
+        return float(self.segments[0]["wall"])
+
+    def wall_to_sample(self, wall: float) -> int:
+        """Map a wall-clock timestamp to the stream-sample clock using the nearest earlier mark."""
+
+        anchors = self.marks or self.segments
+        walls = [entry["wall"] for entry in anchors]
+        position = max(0, bisect.bisect_right(walls, wall) - 1)
+        anchor = anchors[position]
+        return max(0, int(anchor["sample"] + (wall - anchor["wall"]) * self.sample_rate))
+
+    def locate(self, sample: int) -> Tuple[Path, int, int]:
+        """Return ``(segment_path, byte_offset, samples_left_in_segment)`` for ``sample``."""
+
+        starts = [entry["sample"] for entry in self.segments]
+        position = max(0, bisect.bisect_right(starts, sample) - 1)
+        entry = self.segments[position]
+        segment_path = self.session_dir / entry["file"]
+        try:
+            total = (segment_path.stat().st_size - _WAV_HEADER_BYTES) // _SAMPLE_BYTES
+        except OSError as exc:
+            raise RecordingError(f"Missing recording segment {segment_path}: {exc}") from exc
+        within = max(0, sample - entry["sample"])
+        return segment_path, _WAV_HEADER_BYTES + within * _SAMPLE_BYTES, max(0, total - within)
+
+
+def extract_range(
+    session_dir: str,
+    start: float,
+    end: float,
+    output: str,
+    clock: str = "stream",
+) -> int:
+    """Copy ``[start, end)`` of a recorded session into a standalone WAV file.
+
+    With ``clock="stream"`` the bounds are seconds of audio from the start of
+    the session; with ``clock="wall"`` they are Unix timestamps. Returns the
+    number of samples written.
+    """
+
+    index = RecordingIndex.load(session_dir)
+    if clock == "wall":
+        first, last = index.wall_to_sample(start), index.wall_to_sample(end)
+    elif clock == "stream":
+        first, last = int(start * index.sample_rate), int(end * index.sample_rate)
+    else:
+        raise ValueError(f"Unknown clock {clock!r}; expected 'stream' or 'wall'.")
+    if last <= first:
+        raise RecordingError("Extraction range is empty.")
+
+    written = 0
+    out_path = Path(output).expanduser()
+    with out_path.open("wb") as out:
+        out.write(wav_header(index.sample_rate, _UNPATCHED_SIZE))
+        sample = first
+        while sample < last:
+            segment_path, offset, available = index.locate(sample)
+            count = min(available, last - sample)
+            if count <= 0:
+                break
+            with segment_path.open("rb") as segment:
+                segment.seek(offset)
+                data = segment.read(count * _SAMPLE_BYTES)
+            if not data:
+                break
+            out.write(data)
+            written += len(data) // _SAMPLE_BYTES
+            sample += len(data) // _SAMPLE_BYTES
+        out.seek(0)
+        out.write(wav_header(index.sample_rate, written * _SAMPLE_BYTES))
+    return written
@@ -0,0 +1,205 @@
+"""Preallocated ring buffers for captured PCM audio."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+
+
+class AudioRingBuffer:
+    """Preallocated int16 ring buffer shared between the audio callback and a reader.
+
+    One thread writes (the PortAudio callback) and one thread reads (the
+    consumer). Each side only ever advances its own position counter, and
+    both counters grow monotonically, so no lock is needed under the GIL.
+    When the buffer is full the producer drops the excess samples of the
+    incoming block and records them in ``dropped_samples``.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("Ring buffer capacity must be positive.")
+        self.capacity = int(capacity)
+        self._data = np.zeros(self.capacity, dtype=np.int16)
+        # Scratch area used to hand out contiguous views across the wrap point.
+        self._scratch = np.zeros(self.capacity, dtype=np.int16)
+        self._write_pos = 0
+        self._read_pos = 0
+        self.dropped_samples = 0
+
+    @property
+    def available(self) -> int:
+        """Number of samples ready to be read."""
+
+        return self._write_pos - self._read_pos
+
+    @property
+    def free(self) -> int:
+        return self.capacity - self.available
+
+    @property
+    def total_written(self) -> int:
+        """Total samples accepted since the last reset (stream sample clock)."""
+
+        return self._write_pos
+
+    def clear(self) -> None:
+        """Discard unread samples (consumer side)."""
+
+        self._read_pos = self._write_pos
+
+    def reset(self) -> None:
+        """Reset positions and counters. Only call while no producer is active."""
+
+        self._write_pos = 0
+        self._read_pos = 0
+        self.dropped_samples = 0
+
+    def write(self, samples: np.ndarray) -> int:
+        """Copy ``samples`` into the buffer in place; return the number accepted."""
+
+        count = int(samples.size)
+        if count == 0:
+            return 0
+        free = self.capacity - (self._write_pos - self._read_pos)
+        if count > free:
+            self.dropped_samples += count - free
+            count = free
+            if count == 0:
+                return 0
+        start = self._write_pos % self.capacity
+        first = min(count, self.capacity - start)
+        self._data[start : start + first] = samples[:first]
+        if first < count:
+            self._data[: count - first] = samples[first:count]
+        # Publish only after the copy is complete.
+        self._write_pos += count
+        return count
+
+    def write_crossfade(self, samples: np.ndarray, overlap: int) -> int:
+        """Write ``samples`` after blending their head into the unread tail.
+
+        Used when capture switches to a new device: the first ``overlap``
+        samples of the new stream are crossfaded with the most recent unread
+        samples of the old one instead of being appended, which hides the
+        discontinuity and absorbs the small time overlap between the streams.
+        Returns the number of input samples consumed.
+        """
+
+        overlap = min(int(overlap), self.available, int(samples.size))
+        if overlap <= 0:
+            return self.write(samples)
+        positions = (self._write_pos - overlap + np.arange(overlap)) % self.capacity
+        fade_in = np.linspace(0.0, 1.0, overlap, dtype=np.float32)
+        tail = self._data[positions].astype(np.float32)
+        head = samples[:overlap].astype(np.float32)
+        self._data[positions] = (tail + (head - tail) * fade_in).astype(np.int16)
+        return overlap + self.write(samples[overlap:])
+
+    def peek(self, count: int) -> Optional[memoryview]:
+        """Return a read-only byte view of the next ``count`` samples without consuming them.
+
+        Returns ``None`` when fewer than ``count`` samples are buffered. The
+        view stays valid until :meth:`consume` is called.
+        """
+
+        count = int(count)
+        if count <= 0 or count > self.capacity or self.available < count:
+            return None
+        start = self._read_pos % self.capacity
+        end = start + count
+        if end <= self.capacity:
+            view = self._data[start:end]
+        else:
+            first = self.capacity - start
+            self._scratch[:first] = self._data[start:]
+            self._scratch[first:count] = self._data[: count - first]
+            view = self._scratch[:count]
+        return memoryview(view).cast("B").toreadonly()
+
+    def consume(self, count: int) -> None:
+        """Release ``count`` samples previously returned by :meth:`peek`."""
+
+        self._read_pos += min(int(count), self.available)
+
+    def read(self, count: int) -> Optional[bytes]:
+        """Copy out and consume the next ``count`` samples as bytes."""
+
+        view = self.peek(count)
+        if view is None:
+            return None
+        chunk = view.tobytes()
+        view.release()
+        self.consume(count)
+        return chunk
+
+
+_PCM16_SCALE = np.float32(1.0 / 32768.0)
+
+
+class FloatAudioWindow:
+    """Preallocated float32 window over the most recent ``capacity`` samples.
+
+    Incoming int16 PCM is converted and scaled straight into the buffer,
+    and every sample is stored twice (at ``i`` and ``i + capacity``) so any
+    retained span is one contiguous slice: :meth:`view` hands out NumPy
+    views, never copies, and the steady state allocates nothing. Positions
+    are absolute sample indices since the stream started. A view stays
+    valid until ``capacity`` further samples have been appended.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("Window capacity must be positive.")
+        self.capacity = int(capacity)
+        self._data = np.zeros(2 * self.capacity, dtype=np.float32)
+        self.start = 0  # oldest retained sample
+        self.end = 0  # one past the newest sample
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def append(self, samples: np.ndarray) -> int:
+        """Convert int16 ``samples`` in place; return how many old samples were evicted."""
+
+        count = int(samples.size)
+        if count > self.capacity:
+            samples = samples[count - self.capacity :]
+            self.start = self.end = self.end + count - self.capacity
+            count = self.capacity
+        evicted = max(0, self.end + count - self.start - self.capacity)
+        self.start += evicted
+        pos = self.end % self.capacity
+        first = min(count, self.capacity - pos)
+        self._store(samples[:first], pos)
+        if first < count:
+            self._store(samples[first:], 0)
+        self.end += count
+        return evicted
+
+    def view(self, start: int, end: int) -> np.ndarray:
+        """Zero-copy float32 view of absolute samples ``[start, end)``."""
+
+        start = max(start, self.start)
+        end = min(end, self.end)
+        if end <= start:
+            return self._data[:0]
+        pos = start % self.capacity
+        return self._data[pos : pos + end - start]
+
+    def discard_until(self, position: int) -> None:
+        """Release samples before ``position``."""
+
+        self.start = min(max(self.start, int(position)), self.end)
+
+    def clear(self) -> None:
+        self.start = self.end
+
+    def _store(self, samples: np.ndarray, pos: int) -> None:
+        target = self._data[pos : pos + samples.size]
+        # copyto casts element-wise without a temporary; a mixed-type multiply would
+        # allocate a cast buffer per call.
+        np.copyto(target, samples, casting="unsafe")
+        target *= _PCM16_SCALE
+        self._data[pos + self.capacity : pos + self.capacity + samples.size] = target
@@ -0,0 +1,291 @@
+"""Voice-activity gating between audio capture and the ASR backends."""
+
+from __future__ import annotations
+
+import abc
+import logging
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from .dsp import pcm16_view
+
+
+class VoiceActivityDetector(abc.ABC):
+    """Classifies fixed-size frames of mono int16 audio as speech or non-speech."""
+
+    frame_samples: int
+
+    @abc.abstractmethod
+    def speech_frames(self, samples: np.ndarray) -> np.ndarray:
+        """Return a boolean array with one entry per complete frame in ``samples``."""
+
+    def reset(self) -> None:  # pragma: no cover - optional hook
+        """Forget any adaptive state."""
+
+
+class EnergyZcrDetector(VoiceActivityDetector):
+    """Frame energy / zero-crossing-rate detector with an adaptive noise floor.
+
+    A frame counts as speech when its level is ``margin_db`` above the
+    tracked noise floor (and above ``threshold_db`` absolute), or when it is
+    up to half that margin quieter but has a zero-crossing rate typical of
+    fricatives. All per-frame statistics are computed in one vectorised pass per chunk.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        frame_ms: float = 20.0,
+        threshold_db: float = -45.0,
+        margin_db: float = 9.0,
+        zcr_range: tuple[float, float] = (0.1, 0.5),
+        noise_adapt: float = 0.05,
+    ) -> None:
+        self.frame_samples = max(1, int(sample_rate * frame_ms / 1000.0))
+        self.threshold_db = threshold_db
+        self.margin_db = margin_db
+        self.zcr_low, self.zcr_high = zcr_range
+        self._noise_adapt = noise_adapt
+        self._noise_floor_db = threshold_db - margin_db
+
+    def reset(self) -> None:
+        self._noise_floor_db = self.threshold_db - self.margin_db
+
+    def speech_frames(self, samples: np.ndarray) -> np.ndarray:
+        count = samples.size // self.frame_samples
+        if count == 0:
+            return np.zeros(0, dtype=bool)
+        frames = samples[: count * self.frame_samples].reshape(count, self.frame_samples)
+        as_float = frames.astype(np.float32) / 32768.0
+        power = np.mean(as_float * as_float, axis=1)
+        level_db = 10.0 * np.log10(power + 1e-10)
+        signs = np.signbit(frames)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / float(self.frame_samples)
+
+        # Track the noise floor from the quietest frames of each chunk; pauses
+        # between words keep this low even during continuous speech.
+        alpha = self._noise_adapt
+        self._noise_floor_db = (1.0 - alpha) * self._noise_floor_db + alpha * float(
+            np.percentile(level_db, 10)
+        )
+        threshold = max(self.threshold_db, self._noise_floor_db + self.margin_db)
+        loud = level_db > threshold
+        fricative = (
+            (level_db > threshold - self.margin_db / 2)
+            & (zcr >= self.zcr_low)
+            & (zcr <= self.zcr_high)
+        )
+        return loud | fricative
+
+
+@dataclass
+class VadStats:
+    """Running totals reported by :class:`VoiceActivityGate`."""
+
+    speech_seconds: float = 0.0
+    silence_seconds: float = 0.0
+    suppressed_seconds: float = 0.0
+    keepalive_frames: int = 0
+
+    @property
+    def speech_ratio(self) -> float:
+        total = self.speech_seconds + self.silence_seconds
+        return self.speech_seconds / total if total else 0.0
+
+    def describe(self) -> str:
+        return (
+            f"speech {self.speech_seconds:.1f}s / silence {self.silence_seconds:.1f}s "
+            f"({self.speech_ratio:.0%} speech), {self.suppressed_seconds:.1f}s of audio not sent, "
+            f"{self.keepalive_frames} keepalive frames"
+        )
+
+
+class VoiceActivityGate:
+    """Drop or compress silent audio before it reaches a backend.
+
+    Speech chunks pass through unchanged. After speech ends the gate keeps
+    forwarding audio for ``hangover_seconds`` so trailing syllables and the
+    backend's own endpointing are not cut off. While gated, the most recent
+    ``preroll_seconds`` of audio is retained and prepended when speech
+    resumes. Suppressed chunks are either skipped or replaced by a short
+    block of digital silence (``keepalive_seconds``) for backends that need
+    a steady stream to keep their session alive. Just before audio is
+    forwarded again, ``on_skip`` is told how many input samples the gate
+    held back without a stand-in, so a backend can keep its clock on the
+    input timeline.
+    """
+
+    def __init__(
+        self,
+        detector: VoiceActivityDetector,
+        sample_rate: int,
+        hangover_seconds: float = 0.8,
+        preroll_seconds: float = 0.3,
+        keepalive_seconds: Optional[float] = None,
+        on_skip: Optional[Callable[[int], None]] = None,
+    ) -> None:
+        self.detector = detector
+        self.sample_rate = sample_rate
+        self._hangover_samples = int(sample_rate * hangover_seconds)
+        self._preroll_bytes = int(sample_rate * preroll_seconds) * 2
+        self._keepalive = (
+            bytes(int(sample_rate * keepalive_seconds) * 2) if keepalive_seconds else None
+        )
+        self._on_skip = on_skip
+        self._hangover_remaining = 0
+        self._preroll = bytearray()
+        self._unsent_samples = 0  # suppressed input not covered by keepalive frames
+        self.stats = VadStats()
+
+    def reset(self) -> None:
+        self.detector.reset()
+        self._hangover_remaining = 0
+        self._preroll.clear()
+        self._unsent_samples = 0
+        self.stats = VadStats()
+
+    def process(self, chunk: bytes) -> List[bytes]:
+        """Return the audio blocks that should be forwarded for ``chunk``."""
+
+        samples = pcm16_view(chunk)
+        duration = samples.size / self.sample_rate
+        speech = self.detector.speech_frames(samples)
+
+        if speech.any():
+            self.stats.speech_seconds += duration
+            # Hangover counts from the last speech frame in this chunk.
+            last_speech_end = (int(np.flatnonzero(speech)[-1]) + 1) * self.detector.frame_samples
+            self._hangover_remaining = self._hangover_samples - (samples.size - last_speech_end)
+            blocks: List[bytes] = []
+            # The preroll is the tail of the suppressed audio; the rest is skipped.
+            skipped = max(0, self._unsent_samples - len(self._preroll) // 2)
+            self._unsent_samples = 0
+            if skipped and self._on_skip is not None:
+                self._on_skip(skipped)
+            if self._preroll:
+                self.stats.suppressed_seconds -= len(self._preroll) / 2 / self.sample_rate
+                blocks.append(bytes(self._preroll))
+                self._preroll.clear()
+            blocks.append(chunk)
+            return blocks
+
+        self.stats.silence_seconds += duration
+        if self._hangover_remaining > 0:
+            self._hangover_remaining -= samples.size
+            return [chunk]
+
+        self.stats.suppressed_seconds += duration
+        if self._preroll_bytes:
+            self._preroll.extend(chunk)
+            excess = len(self._preroll) - self._preroll_bytes
+            if excess > 0:
+                del self._preroll[:excess]
+        if self._keepalive is not None:
+            self.stats.keepalive_frames += 1
+            self._unsent_samples += samples.size - len(self._keepalive) // 2
+            return [self._keepalive]
+        self._unsent_samples += samples.size
+        return []
+
+    def log_summary(self) -> None:
+        logging.info("Voice activity gate: %s", self.stats.describe())
+
+
+class UtteranceSegmenter:
+    """Cut a continuous stream into utterances at detected pauses.
+
+    An utterance opens on the first speech frame (reaching back
+    ``preroll_seconds``) and closes once ``pause_seconds`` of non-speech
+    follow it, so a speaker who stops is flushed straight away. One that
+    reaches ``max_seconds`` is split at its latest pause past
+    ``min_seconds``, or hard at the limit; a closed utterance shorter than
+    ``min_seconds`` is widened backwards over the preceding audio. Stretches
+    without speech never produce a range. Ranges are absolute sample
+    indices since the stream started.
+    """
+
+    def __init__(
+        self,
+        detector: VoiceActivityDetector,
+        sample_rate: int,
+        min_seconds: float = 1.0,
+        max_seconds: float = 6.0,
+        pause_seconds: float = 0.5,
+        preroll_seconds: float = 0.3,
+    ) -> None:
+        self.detector = detector
+        self._max = int(sample_rate * max_seconds)
+        self._min = min(int(sample_rate * min_seconds), self._max)
+        self._pause = max(1, int(sample_rate * pause_seconds))
+        self._preroll = int(sample_rate * preroll_seconds)
+        self._carry = np.zeros(0, dtype=np.int16)
+        self.position = 0  # samples classified so far
+        self.last_speech_end = 0
+        self._floor = 0  # end of the last emitted range
+        self._start: Optional[int] = None
+        self._last_gap: Optional[int] = None
+        self.utterances = 0
+        self.emitted_samples = 0
+
+    @property
+    def in_utterance(self) -> bool:
+        return self._start is not None
+
+    @property
+    def retain_from(self) -> int:
+        """Earliest sample a future range can start at; older audio may be dropped."""
+
+        anchor = self._start if self._start is not None else self.position
+        return max(self._floor, anchor - max(self._min, self._preroll))
+
+    def feed(self, samples: np.ndarray) -> List[Tuple[int, int]]:
+        """Classify ``samples`` and return the ``(start, end)`` ranges completed by them."""
+
+        if self._carry.size:
+            samples = np.concatenate((self._carry, samples))
+        speech = self.detector.speech_frames(samples)
+        frame = self.detector.frame_samples
+        self._carry = samples[speech.size * frame :].copy()
+
+        ranges: List[Tuple[int, int]] = []
+        for is_speech in speech.tolist():
+            frame_end = self.position + frame
+            if is_speech:
+                if self._start is None:
+                    self._start = max(self._floor, self.position - self._preroll)
+                    self._last_gap = None
+                self.last_speech_end = frame_end
+            elif self._start is not None:
+                self._last_gap = frame_end
+                if frame_end - self.last_speech_end >= self._pause:
+                    ranges.append(self._close(frame_end))
+            self.position = frame_end
+            if self._start is not None and self.position - self._start >= self._max:
+                gap = self._last_gap
+                cut = gap if gap is not None and gap - self._start >= self._min else self.position
+                ranges.append(self._emit(self._start, cut))
+                self._start = cut if self.last_speech_end > cut else None
+                self._last_gap = None
+        return ranges
+
+    def finish(self) -> Optional[Tuple[int, int]]:
+        """Close the open utterance at end of stream, if any."""
+
+        if self._start is None:
+            return None
+        return self._close(self.position)
+
+    def _close(self, now: int) -> Tuple[int, int]:
+        assert self._start is not None  # nosec B101
+        end = min(now, self.last_speech_end + self._pause // 2)
+        start = max(self._floor, min(self._start, end - self._min))
+        self._start = None
+        return self._emit(start, end)
+
+    def _emit(self, start: int, end: int) -> Tuple[int, int]:
+        self._floor = end
+        self.utterances += 1
+        self.emitted_samples += end - start
+        return start, end